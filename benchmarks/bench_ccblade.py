@@ -0,0 +1,22 @@
+import numpy as np
+
+from .common import nrel5mw_rotor
+
+
+class CCBladePowerCurve:
+    """CCBlade.evaluate over the operating wind speeds of the NREL 5MW rotor"""
+
+    params = [[23, 200], [False, True]]
+    param_names = ["n_speeds", "derivatives"]
+
+    def setup(self, n_speeds, derivatives):
+        self.rotor = nrel5mw_rotor(derivatives=derivatives)
+        self.Uinf = np.linspace(3.0, 25.0, n_speeds)
+        self.Omega = np.minimum(6.972 + 0.43 * (self.Uinf - 3.0), 12.1)
+        self.pitch = np.maximum(0.0, 2.6 * (self.Uinf - 11.4) - 0.045 * (self.Uinf - 11.4) ** 2)
+
+    def time_evaluate(self, n_speeds, derivatives):
+        self.rotor.evaluate(self.Uinf, self.Omega, self.pitch)
+
+    def peakmem_evaluate(self, n_speeds, derivatives):
+        self.rotor.evaluate(self.Uinf, self.Omega, self.pitch)
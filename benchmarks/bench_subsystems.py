@@ -0,0 +1,49 @@
+import tracemalloc
+
+from .common import get_subsystem, reference_problem
+
+# Reference problem and pathname of each of the timed subsystems
+subsystems = {
+    "ComputePowerCurve": ("IEA-15MW", "wt.rp.powercurve.compute_power_curve"),
+    "PreComp": ("IEA-15MW", "wt.re.precomp"),
+    "Frame3DD blade": ("IEA-15MW", "wt.rs.frame"),
+    "Frame3DD tower": ("IEA-15MW", "wt.towerse.tower"),
+    "Frame3DD floating": ("NREL5MW-semi", "wt.floatingse.load"),
+    "MapMooring": ("NREL5MW-semi", "wt.floatingse.mm"),
+    "ORBIT ProjectManager": ("IEA-15MW", "orbit"),
+    "LandBOSSE": ("IEA-3.4MW", "landbosse"),
+}
+
+
+class Subsystems:
+    """
+    One evaluation of a subsystem of a reference problem, with the inputs of the full model run.
+
+    peakmem would report the memory of the whole reference problem, so the memory of the subsystem
+    is tracked as the peak of the allocations traced by tracemalloc during its evaluation. This
+    covers numpy arrays but not the memory allocated in the compiled extensions.
+    """
+
+    params = list(subsystems)
+    param_names = ["subsystem"]
+    number = 1
+    repeat = (3, 10, 60.0)
+    warmup_time = 0.0
+    timeout = 1800.0
+
+    def setup(self, name):
+        turbine, path = subsystems[name]
+        self.system = get_subsystem(reference_problem(turbine), path)
+
+    def time_run_solve_nonlinear(self, name):
+        self.system.run_solve_nonlinear()
+
+    def track_peak_traced_memory(self, name):
+        tracemalloc.start()
+        try:
+            self.system.run_solve_nonlinear()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    track_peak_traced_memory.unit = "bytes"
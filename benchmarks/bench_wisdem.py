@@ -0,0 +1,19 @@
+from .common import setup_problem, reference_inputs
+
+
+class RunModel:
+    """Full model evaluation of the IEA 15MW reference turbine, on a newly set up problem each time"""
+
+    number = 1
+    repeat = 3
+    warmup_time = 0.0
+    timeout = 3600.0
+
+    def setup(self):
+        self.wt_opt = setup_problem(*reference_inputs["IEA-15MW"])
+
+    def time_run_model(self):
+        self.wt_opt.run_model()
+
+    def peakmem_run_model(self):
+        self.wt_opt.run_model()
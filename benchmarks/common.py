@@ -0,0 +1,194 @@
+"""
+Reference inputs shared by the benchmarks.
+
+The problems are built from the reference turbines in the examples and are
+kept for the life of the benchmark process, so that the benchmarks of single
+subsystems only pay for the full model evaluation once.
+"""
+
+import os
+from functools import reduce
+
+import numpy as np
+import openmdao.api as om
+from wisdem.ccblade.ccblade import CCBlade, CCAirfoil
+from wisdem.glue_code.glue_code import WindPark
+from wisdem.glue_code.gc_LoadInputs import WindTurbineOntologyPython
+from wisdem.glue_code.gc_WT_InitModel import yaml2openmdao
+from wisdem.glue_code.gc_PoseOptimization import PoseOptimization
+
+examples_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "examples")
+
+# Geometry, modeling options and analysis options yamls of the reference problems
+reference_inputs = {
+    "IEA-15MW": [
+        os.path.join(examples_dir, "02_reference_turbines", "IEA-15-240-RWT.yaml"),
+        os.path.join(examples_dir, "02_reference_turbines", "modeling_options.yaml"),
+        os.path.join(examples_dir, "02_reference_turbines", "analysis_options.yaml"),
+    ],
+    "IEA-3.4MW": [
+        os.path.join(examples_dir, "02_reference_turbines", "IEA-3p4-130-RWT.yaml"),
+        os.path.join(examples_dir, "02_reference_turbines", "modeling_options.yaml"),
+        os.path.join(examples_dir, "02_reference_turbines", "analysis_options.yaml"),
+    ],
+    "NREL5MW-semi": [
+        os.path.join(examples_dir, "09_floating", "nrel5mw-semi_oc4.yaml"),
+        os.path.join(examples_dir, "09_floating", "modeling_options.yaml"),
+        os.path.join(examples_dir, "09_floating", "analysis_options.yaml"),
+    ],
+}
+
+_reference_problems = {}
+
+
+def setup_problem(fname_wt_input, fname_modeling_options, fname_opt_options):
+    """
+    Set up and initialize a WISDEM problem for an analysis run.
+
+    This only uses the glue code that older WISDEM versions also have, so that
+    the benchmarks can compare against them.
+
+    Parameters
+    ----------
+    fname_wt_input : str
+        Geometry yaml file
+    fname_modeling_options : str
+        Modeling options yaml file
+    fname_opt_options : str
+        Analysis options yaml file
+
+    Returns
+    -------
+    wt_opt : openmdao.api.Problem
+        Problem with the turbine description of the yaml files loaded in
+    """
+    wt_initial = WindTurbineOntologyPython(fname_wt_input, fname_modeling_options, fname_opt_options)
+    wt_init, modeling_options, opt_options = wt_initial.get_input_data()
+    myopt = PoseOptimization(modeling_options, opt_options)
+
+    wt_opt = om.Problem(model=WindPark(modeling_options=modeling_options, opt_options=opt_options))
+    wt_opt.setup()
+    wt_opt = yaml2openmdao(wt_opt, modeling_options, wt_init, opt_options)
+    wt_opt = myopt.set_initial(wt_opt, wt_init)
+
+    return wt_opt
+
+
+def reference_problem(turbine):
+    """
+    Set up and evaluate once the problem of one of the reference_inputs.
+
+    Parameters
+    ----------
+    turbine : str
+        Key of reference_inputs
+
+    Returns
+    -------
+    wt_opt : openmdao.api.Problem
+        Problem after run_model, shared by all the callers in this process
+    """
+    if turbine not in _reference_problems:
+        wt_opt = setup_problem(*reference_inputs[turbine])
+        wt_opt.run_model()
+        _reference_problems[turbine] = wt_opt
+
+    return _reference_problems[turbine]
+
+
+def get_subsystem(wt_opt, path):
+    """Subsystem of the model of wt_opt at pathname path, e.g. wt.rs.frame"""
+    return reduce(getattr, path.split("."), wt_opt.model)
+
+
+def nrel5mw_rotor(derivatives=False):
+    """CCBlade rotor of the NREL 5MW reference turbine, with the AeroDyn airfoils of the examples"""
+    Rhub = 1.5
+    Rtip = 63.0
+    r = np.array(
+        [
+            2.8667,
+            5.6000,
+            8.3333,
+            11.7500,
+            15.8500,
+            19.9500,
+            24.0500,
+            28.1500,
+            32.2500,
+            36.3500,
+            40.4500,
+            44.5500,
+            48.6500,
+            52.7500,
+            56.1667,
+            58.9000,
+            61.6333,
+        ]
+    )
+    chord = np.array(
+        [
+            3.542,
+            3.854,
+            4.167,
+            4.557,
+            4.652,
+            4.458,
+            4.249,
+            4.007,
+            3.748,
+            3.502,
+            3.256,
+            3.010,
+            2.764,
+            2.518,
+            2.313,
+            2.086,
+            1.419,
+        ]
+    )
+    theta = np.array(
+        [
+            13.308,
+            13.308,
+            13.308,
+            13.308,
+            11.480,
+            10.162,
+            9.011,
+            7.795,
+            6.544,
+            5.361,
+            4.188,
+            3.125,
+            2.319,
+            1.526,
+            0.863,
+            0.370,
+            0.106,
+        ]
+    )
+
+    basepath = os.path.join(examples_dir, "_airfoil_files")
+    names = ["Cylinder1", "Cylinder2", "DU40_A17", "DU35_A17", "DU30_A17", "DU25_A17", "DU21_A17", "NACA64_A17"]
+    airfoil_types = [CCAirfoil.initFromAerodynFile(os.path.join(basepath, name + ".dat")) for name in names]
+    af_idx = [0, 0, 1, 2, 3, 3, 4, 5, 5, 6, 6, 7, 7, 7, 7, 7, 7]
+    af = [airfoil_types[k] for k in af_idx]
+
+    return CCBlade(
+        r,
+        chord,
+        theta,
+        af,
+        Rhub,
+        Rtip,
+        B=3,
+        rho=1.225,
+        mu=1.81206e-5,
+        precone=2.5,
+        tilt=-5.0,
+        yaw=0.0,
+        shearExp=0.2,
+        hubHt=90.0,
+        derivatives=derivatives,
+    )
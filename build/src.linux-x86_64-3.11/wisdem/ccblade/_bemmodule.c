@@ -0,0 +1,4915 @@
+/* File: _bemmodule.c
+ * This file is auto-generated with f2py (version:1.24.4).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Mon Oct 19 08:34:21 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+
+/* Unconditionally included */
+#include <Python.h>
+#include <numpy/npy_os.h>
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *_bem_error;
+static PyObject *_bem_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+/*need_typedefs*/
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+/* See fortranobject.h for definitions. The macros here are provided for BC. */
+#define rank f2py_rank
+#define shape f2py_shape
+#define fshape f2py_shape
+#define len f2py_len
+#define flen f2py_flen
+#define slen f2py_slen
+#define size f2py_size
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(_bem_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int
+double_from_pyobj(double* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+        *v = PyFloat_AsDouble(obj);
+        return !(*v == -1.0 && PyErr_Occurred());
+    }
+
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+        *v = PyFloat_AsDouble(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1.0 && PyErr_Occurred());
+    }
+
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
+
+    if (tmp) {
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = _bem_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int
+int_from_pyobj(int* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+
+    if (PyLong_Check(obj)) {
+        *v = Npy__PyLong_AsInt(obj);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    tmp = PyNumber_Long(obj);
+    if (tmp) {
+        *v = Npy__PyLong_AsInt(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
+
+    if (tmp) {
+        if (int_from_pyobj(v, tmp, errmess)) {
+            Py_DECREF(tmp);
+            return 1;
+        }
+        Py_DECREF(tmp);
+    }
+
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err == NULL) {
+            err = _bem_error;
+        }
+        PyErr_SetString(err, errmess);
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(inductionfactors,INDUCTIONFACTORS)(double*,double*,double*,double*,double*,double*,double*,int*,double*,double*,int*,int*,int*,int*,double*,double*,double*);
+extern void F_FUNC(relativewind,RELATIVEWIND)(double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*);
+extern void F_FUNC(definecurvature,DEFINECURVATURE)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*);
+extern void F_FUNC(windcomponents,WINDCOMPONENTS)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*);
+extern void F_FUNC(thrusttorque,THRUSTTORQUE)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*);
+extern void F_FUNC_US(inductionfactors_dv,INDUCTIONFACTORS_DV)(double*,double*,double*,double*,double*,double*,double*,int*,double*,double*,int*,int*,int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*);
+extern void F_FUNC_US(relativewind_dv,RELATIVEWIND_DV)(double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*);
+extern void F_FUNC_US(windcomponents_dv,WINDCOMPONENTS_DV)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*);
+extern void F_FUNC_US(definecurvature_dv,DEFINECURVATURE_DV)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*);
+extern void F_FUNC_US(thrusttorque_bv,THRUSTTORQUE_BV)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*);
+extern void F_FUNC_US(definecurvature_bv,DEFINECURVATURE_BV)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*);
+extern void F_FUNC_US(definecurvature_dv2,DEFINECURVATURE_DV2)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/****************************** inductionfactors ******************************/
+static char doc_f2py_rout__bem_inductionfactors[] = "\
+fzero,a,ap = inductionfactors(r,chord,rhub,rtip,phi,cl,cd,b,vx,vy,[usecd,hubloss,tiploss,wakerotation])\n\nWrapper for ``inductionfactors``.\
+\n\nParameters\n----------\n"
+"r : input float\n"
+"chord : input float\n"
+"rhub : input float\n"
+"rtip : input float\n"
+"phi : input float\n"
+"cl : input float\n"
+"cd : input float\n"
+"b : input int\n"
+"vx : input float\n"
+"vy : input float\n"
+"\nOther Parameters\n----------------\n"
+"usecd : input int, optional\n    Default: 1\n"
+"hubloss : input int, optional\n    Default: 1\n"
+"tiploss : input int, optional\n    Default: 1\n"
+"wakerotation : input int, optional\n    Default: 1\n"
+"\nReturns\n-------\n"
+"fzero : float\n"
+"a : float\n"
+"ap : float";
+/* extern void F_FUNC(inductionfactors,INDUCTIONFACTORS)(double*,double*,double*,double*,double*,double*,double*,int*,double*,double*,int*,int*,int*,int*,double*,double*,double*); */
+static PyObject *f2py_rout__bem_inductionfactors(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,double*,double*,double*,double*,int*,double*,double*,int*,int*,int*,int*,double*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    double r = 0;
+    PyObject *r_capi = Py_None;
+    double chord = 0;
+    PyObject *chord_capi = Py_None;
+    double rhub = 0;
+    PyObject *rhub_capi = Py_None;
+    double rtip = 0;
+    PyObject *rtip_capi = Py_None;
+    double phi = 0;
+    PyObject *phi_capi = Py_None;
+    double cl = 0;
+    PyObject *cl_capi = Py_None;
+    double cd = 0;
+    PyObject *cd_capi = Py_None;
+    int b = 0;
+    PyObject *b_capi = Py_None;
+    double vx = 0;
+    PyObject *vx_capi = Py_None;
+    double vy = 0;
+    PyObject *vy_capi = Py_None;
+    int usecd = 0;
+    PyObject *usecd_capi = Py_None;
+    int hubloss = 0;
+    PyObject *hubloss_capi = Py_None;
+    int tiploss = 0;
+    PyObject *tiploss_capi = Py_None;
+    int wakerotation = 0;
+    PyObject *wakerotation_capi = Py_None;
+    double fzero = 0;
+    double a = 0;
+    double ap = 0;
+    static char *capi_kwlist[] = {"r","chord","rhub","rtip","phi","cl","cd","b","vx","vy","usecd","hubloss","tiploss","wakerotation",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOOOO|OOOO:_bem.inductionfactors",\
+        capi_kwlist,&r_capi,&chord_capi,&rhub_capi,&rtip_capi,&phi_capi,&cl_capi,&cd_capi,&b_capi,&vx_capi,&vy_capi,&usecd_capi,&hubloss_capi,&tiploss_capi,&wakerotation_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable r */
+        f2py_success = double_from_pyobj(&r,r_capi,"_bem.inductionfactors() 1st argument (r) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable chord */
+        f2py_success = double_from_pyobj(&chord,chord_capi,"_bem.inductionfactors() 2nd argument (chord) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable rhub */
+        f2py_success = double_from_pyobj(&rhub,rhub_capi,"_bem.inductionfactors() 3rd argument (rhub) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable rtip */
+        f2py_success = double_from_pyobj(&rtip,rtip_capi,"_bem.inductionfactors() 4th argument (rtip) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable phi */
+        f2py_success = double_from_pyobj(&phi,phi_capi,"_bem.inductionfactors() 5th argument (phi) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable cl */
+        f2py_success = double_from_pyobj(&cl,cl_capi,"_bem.inductionfactors() 6th argument (cl) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable cd */
+        f2py_success = double_from_pyobj(&cd,cd_capi,"_bem.inductionfactors() 7th argument (cd) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable b */
+        f2py_success = int_from_pyobj(&b,b_capi,"_bem.inductionfactors() 8th argument (b) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable vx */
+        f2py_success = double_from_pyobj(&vx,vx_capi,"_bem.inductionfactors() 9th argument (vx) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable vy */
+        f2py_success = double_from_pyobj(&vy,vy_capi,"_bem.inductionfactors() 10th argument (vy) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable usecd */
+    if (usecd_capi == Py_None) usecd = 1; else
+        usecd = (int)PyObject_IsTrue(usecd_capi);
+        f2py_success = 1;
+    if (f2py_success) {
+    /* Processing variable hubloss */
+    if (hubloss_capi == Py_None) hubloss = 1; else
+        hubloss = (int)PyObject_IsTrue(hubloss_capi);
+        f2py_success = 1;
+    if (f2py_success) {
+    /* Processing variable tiploss */
+    if (tiploss_capi == Py_None) tiploss = 1; else
+        tiploss = (int)PyObject_IsTrue(tiploss_capi);
+        f2py_success = 1;
+    if (f2py_success) {
+    /* Processing variable wakerotation */
+    if (wakerotation_capi == Py_None) wakerotation = 1; else
+        wakerotation = (int)PyObject_IsTrue(wakerotation_capi);
+        f2py_success = 1;
+    if (f2py_success) {
+    /* Processing variable fzero */
+    /* Processing variable a */
+    /* Processing variable ap */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&r,&chord,&rhub,&rtip,&phi,&cl,&cd,&b,&vx,&vy,&usecd,&hubloss,&tiploss,&wakerotation,&fzero,&a,&ap);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("ddd",fzero,a,ap);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    /* End of cleaning variable ap */
+    /* End of cleaning variable a */
+    /* End of cleaning variable fzero */
+    } /*if (f2py_success) of wakerotation*/
+    /* End of cleaning variable wakerotation */
+    } /*if (f2py_success) of tiploss*/
+    /* End of cleaning variable tiploss */
+    } /*if (f2py_success) of hubloss*/
+    /* End of cleaning variable hubloss */
+    } /*if (f2py_success) of usecd*/
+    /* End of cleaning variable usecd */
+    } /*if (f2py_success) of vy*/
+    /* End of cleaning variable vy */
+    } /*if (f2py_success) of vx*/
+    /* End of cleaning variable vx */
+    } /*if (f2py_success) of b*/
+    /* End of cleaning variable b */
+    } /*if (f2py_success) of cd*/
+    /* End of cleaning variable cd */
+    } /*if (f2py_success) of cl*/
+    /* End of cleaning variable cl */
+    } /*if (f2py_success) of phi*/
+    /* End of cleaning variable phi */
+    } /*if (f2py_success) of rtip*/
+    /* End of cleaning variable rtip */
+    } /*if (f2py_success) of rhub*/
+    /* End of cleaning variable rhub */
+    } /*if (f2py_success) of chord*/
+    /* End of cleaning variable chord */
+    } /*if (f2py_success) of r*/
+    /* End of cleaning variable r */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/************************** end of inductionfactors **************************/
+
+/******************************** relativewind ********************************/
+static char doc_f2py_rout__bem_relativewind[] = "\
+alpha,w,re = relativewind(phi,a,ap,vx,vy,pitch,chord,theta,rho,mu)\n\nWrapper for ``relativewind``.\
+\n\nParameters\n----------\n"
+"phi : input float\n"
+"a : input float\n"
+"ap : input float\n"
+"vx : input float\n"
+"vy : input float\n"
+"pitch : input float\n"
+"chord : input float\n"
+"theta : input float\n"
+"rho : input float\n"
+"mu : input float\n"
+"\nReturns\n-------\n"
+"alpha : float\n"
+"w : float\n"
+"re : float";
+/* extern void F_FUNC(relativewind,RELATIVEWIND)(double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*); */
+static PyObject *f2py_rout__bem_relativewind(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    double phi = 0;
+    PyObject *phi_capi = Py_None;
+    double a = 0;
+    PyObject *a_capi = Py_None;
+    double ap = 0;
+    PyObject *ap_capi = Py_None;
+    double vx = 0;
+    PyObject *vx_capi = Py_None;
+    double vy = 0;
+    PyObject *vy_capi = Py_None;
+    double pitch = 0;
+    PyObject *pitch_capi = Py_None;
+    double chord = 0;
+    PyObject *chord_capi = Py_None;
+    double theta = 0;
+    PyObject *theta_capi = Py_None;
+    double rho = 0;
+    PyObject *rho_capi = Py_None;
+    double mu = 0;
+    PyObject *mu_capi = Py_None;
+    double alpha = 0;
+    double w = 0;
+    double re = 0;
+    static char *capi_kwlist[] = {"phi","a","ap","vx","vy","pitch","chord","theta","rho","mu",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOOOO|:_bem.relativewind",\
+        capi_kwlist,&phi_capi,&a_capi,&ap_capi,&vx_capi,&vy_capi,&pitch_capi,&chord_capi,&theta_capi,&rho_capi,&mu_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable phi */
+        f2py_success = double_from_pyobj(&phi,phi_capi,"_bem.relativewind() 1st argument (phi) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable a */
+        f2py_success = double_from_pyobj(&a,a_capi,"_bem.relativewind() 2nd argument (a) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable ap */
+        f2py_success = double_from_pyobj(&ap,ap_capi,"_bem.relativewind() 3rd argument (ap) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable vx */
+        f2py_success = double_from_pyobj(&vx,vx_capi,"_bem.relativewind() 4th argument (vx) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable vy */
+        f2py_success = double_from_pyobj(&vy,vy_capi,"_bem.relativewind() 5th argument (vy) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable pitch */
+        f2py_success = double_from_pyobj(&pitch,pitch_capi,"_bem.relativewind() 6th argument (pitch) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable chord */
+        f2py_success = double_from_pyobj(&chord,chord_capi,"_bem.relativewind() 7th argument (chord) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable theta */
+        f2py_success = double_from_pyobj(&theta,theta_capi,"_bem.relativewind() 8th argument (theta) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable rho */
+        f2py_success = double_from_pyobj(&rho,rho_capi,"_bem.relativewind() 9th argument (rho) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable mu */
+        f2py_success = double_from_pyobj(&mu,mu_capi,"_bem.relativewind() 10th argument (mu) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable alpha */
+    /* Processing variable w */
+    /* Processing variable re */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&phi,&a,&ap,&vx,&vy,&pitch,&chord,&theta,&rho,&mu,&alpha,&w,&re);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("ddd",alpha,w,re);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    /* End of cleaning variable re */
+    /* End of cleaning variable w */
+    /* End of cleaning variable alpha */
+    } /*if (f2py_success) of mu*/
+    /* End of cleaning variable mu */
+    } /*if (f2py_success) of rho*/
+    /* End of cleaning variable rho */
+    } /*if (f2py_success) of theta*/
+    /* End of cleaning variable theta */
+    } /*if (f2py_success) of chord*/
+    /* End of cleaning variable chord */
+    } /*if (f2py_success) of pitch*/
+    /* End of cleaning variable pitch */
+    } /*if (f2py_success) of vy*/
+    /* End of cleaning variable vy */
+    } /*if (f2py_success) of vx*/
+    /* End of cleaning variable vx */
+    } /*if (f2py_success) of ap*/
+    /* End of cleaning variable ap */
+    } /*if (f2py_success) of a*/
+    /* End of cleaning variable a */
+    } /*if (f2py_success) of phi*/
+    /* End of cleaning variable phi */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/**************************** end of relativewind ****************************/
+
+/****************************** definecurvature ******************************/
+static char doc_f2py_rout__bem_definecurvature[] = "\
+x_az,y_az,z_az,cone,s = definecurvature(r,precurve,presweep,precone,[n])\n\nWrapper for ``definecurvature``.\
+\n\nParameters\n----------\n"
+"r : input rank-1 array('d') with bounds (n)\n"
+"precurve : input rank-1 array('d') with bounds (n)\n"
+"presweep : input rank-1 array('d') with bounds (n)\n"
+"precone : input float\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: shape(r, 0)\n"
+"\nReturns\n-------\n"
+"x_az : rank-1 array('d') with bounds (n)\n"
+"y_az : rank-1 array('d') with bounds (n)\n"
+"z_az : rank-1 array('d') with bounds (n)\n"
+"cone : rank-1 array('d') with bounds (n)\n"
+"s : rank-1 array('d') with bounds (n)";
+/* extern void F_FUNC(definecurvature,DEFINECURVATURE)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*); */
+static PyObject *f2py_rout__bem_definecurvature(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int n = 0;
+    PyObject *n_capi = Py_None;
+    double *r = NULL;
+    npy_intp r_Dims[1] = {-1};
+    const int r_Rank = 1;
+    PyArrayObject *capi_r_as_array = NULL;
+    int capi_r_intent = 0;
+    PyObject *r_capi = Py_None;
+    double *precurve = NULL;
+    npy_intp precurve_Dims[1] = {-1};
+    const int precurve_Rank = 1;
+    PyArrayObject *capi_precurve_as_array = NULL;
+    int capi_precurve_intent = 0;
+    PyObject *precurve_capi = Py_None;
+    double *presweep = NULL;
+    npy_intp presweep_Dims[1] = {-1};
+    const int presweep_Rank = 1;
+    PyArrayObject *capi_presweep_as_array = NULL;
+    int capi_presweep_intent = 0;
+    PyObject *presweep_capi = Py_None;
+    double precone = 0;
+    PyObject *precone_capi = Py_None;
+    double *x_az = NULL;
+    npy_intp x_az_Dims[1] = {-1};
+    const int x_az_Rank = 1;
+    PyArrayObject *capi_x_az_as_array = NULL;
+    int capi_x_az_intent = 0;
+    double *y_az = NULL;
+    npy_intp y_az_Dims[1] = {-1};
+    const int y_az_Rank = 1;
+    PyArrayObject *capi_y_az_as_array = NULL;
+    int capi_y_az_intent = 0;
+    double *z_az = NULL;
+    npy_intp z_az_Dims[1] = {-1};
+    const int z_az_Rank = 1;
+    PyArrayObject *capi_z_az_as_array = NULL;
+    int capi_z_az_intent = 0;
+    double *cone = NULL;
+    npy_intp cone_Dims[1] = {-1};
+    const int cone_Rank = 1;
+    PyArrayObject *capi_cone_as_array = NULL;
+    int capi_cone_intent = 0;
+    double *s = NULL;
+    npy_intp s_Dims[1] = {-1};
+    const int s_Rank = 1;
+    PyArrayObject *capi_s_as_array = NULL;
+    int capi_s_intent = 0;
+    static char *capi_kwlist[] = {"r","precurve","presweep","precone","n",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOO|O:_bem.definecurvature",\
+        capi_kwlist,&r_capi,&precurve_capi,&presweep_capi,&precone_capi,&n_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable r */
+    ;
+    capi_r_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature: failed to create array from the 1st argument `r`";
+    capi_r_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,r_Dims,r_Rank,  capi_r_intent,r_capi,capi_errmess);
+    if (capi_r_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        r = (double *)(PyArray_DATA(capi_r_as_array));
+
+    /* Processing variable precone */
+        f2py_success = double_from_pyobj(&precone,precone_capi,"_bem.definecurvature() 4th argument (precone) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable n */
+    if (n_capi == Py_None) n = shape(r, 0); else
+        f2py_success = int_from_pyobj(&n,n_capi,"_bem.definecurvature() 1st keyword (n) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(r, 0) == n,"shape(r, 0) == n","1st keyword n","definecurvature:n=%d",n) {
+    /* Processing variable precurve */
+    precurve_Dims[0]=n;
+    capi_precurve_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature: failed to create array from the 2nd argument `precurve`";
+    capi_precurve_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurve_Dims,precurve_Rank,  capi_precurve_intent,precurve_capi,capi_errmess);
+    if (capi_precurve_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurve = (double *)(PyArray_DATA(capi_precurve_as_array));
+
+    /* Processing variable presweep */
+    presweep_Dims[0]=n;
+    capi_presweep_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature: failed to create array from the 3rd argument `presweep`";
+    capi_presweep_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweep_Dims,presweep_Rank,  capi_presweep_intent,presweep_capi,capi_errmess);
+    if (capi_presweep_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweep = (double *)(PyArray_DATA(capi_presweep_as_array));
+
+    /* Processing variable x_az */
+    x_az_Dims[0]=n;
+    capi_x_az_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature: failed to create array from the hidden `x_az`";
+    capi_x_az_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,x_az_Dims,x_az_Rank,  capi_x_az_intent,Py_None,capi_errmess);
+    if (capi_x_az_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        x_az = (double *)(PyArray_DATA(capi_x_az_as_array));
+
+    /* Processing variable y_az */
+    y_az_Dims[0]=n;
+    capi_y_az_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature: failed to create array from the hidden `y_az`";
+    capi_y_az_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,y_az_Dims,y_az_Rank,  capi_y_az_intent,Py_None,capi_errmess);
+    if (capi_y_az_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        y_az = (double *)(PyArray_DATA(capi_y_az_as_array));
+
+    /* Processing variable z_az */
+    z_az_Dims[0]=n;
+    capi_z_az_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature: failed to create array from the hidden `z_az`";
+    capi_z_az_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,z_az_Dims,z_az_Rank,  capi_z_az_intent,Py_None,capi_errmess);
+    if (capi_z_az_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        z_az = (double *)(PyArray_DATA(capi_z_az_as_array));
+
+    /* Processing variable cone */
+    cone_Dims[0]=n;
+    capi_cone_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature: failed to create array from the hidden `cone`";
+    capi_cone_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,cone_Dims,cone_Rank,  capi_cone_intent,Py_None,capi_errmess);
+    if (capi_cone_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        cone = (double *)(PyArray_DATA(capi_cone_as_array));
+
+    /* Processing variable s */
+    s_Dims[0]=n;
+    capi_s_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature: failed to create array from the hidden `s`";
+    capi_s_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,s_Dims,s_Rank,  capi_s_intent,Py_None,capi_errmess);
+    if (capi_s_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        s = (double *)(PyArray_DATA(capi_s_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&n,r,precurve,presweep,&precone,x_az,y_az,z_az,cone,s);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("NNNNN",capi_x_az_as_array,capi_y_az_as_array,capi_z_az_as_array,capi_cone_as_array,capi_s_as_array);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    }  /* if (capi_s_as_array == NULL) ... else of s */
+    /* End of cleaning variable s */
+    }  /* if (capi_cone_as_array == NULL) ... else of cone */
+    /* End of cleaning variable cone */
+    }  /* if (capi_z_az_as_array == NULL) ... else of z_az */
+    /* End of cleaning variable z_az */
+    }  /* if (capi_y_az_as_array == NULL) ... else of y_az */
+    /* End of cleaning variable y_az */
+    }  /* if (capi_x_az_as_array == NULL) ... else of x_az */
+    /* End of cleaning variable x_az */
+    if((PyObject *)capi_presweep_as_array!=presweep_capi) {
+        Py_XDECREF(capi_presweep_as_array); }
+    }  /* if (capi_presweep_as_array == NULL) ... else of presweep */
+    /* End of cleaning variable presweep */
+    if((PyObject *)capi_precurve_as_array!=precurve_capi) {
+        Py_XDECREF(capi_precurve_as_array); }
+    }  /* if (capi_precurve_as_array == NULL) ... else of precurve */
+    /* End of cleaning variable precurve */
+    } /*CHECKSCALAR(shape(r, 0) == n)*/
+    } /*if (f2py_success) of n*/
+    /* End of cleaning variable n */
+    } /*if (f2py_success) of precone*/
+    /* End of cleaning variable precone */
+    if((PyObject *)capi_r_as_array!=r_capi) {
+        Py_XDECREF(capi_r_as_array); }
+    }  /* if (capi_r_as_array == NULL) ... else of r */
+    /* End of cleaning variable r */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/*************************** end of definecurvature ***************************/
+
+/******************************* windcomponents *******************************/
+static char doc_f2py_rout__bem_windcomponents[] = "\
+vx,vy = windcomponents(r,precurve,presweep,precone,yaw,tilt,azimuth,uinf,omegarpm,hubht,shearexp,[n])\n\nWrapper for ``windcomponents``.\
+\n\nParameters\n----------\n"
+"r : input rank-1 array('d') with bounds (n)\n"
+"precurve : input rank-1 array('d') with bounds (n)\n"
+"presweep : input rank-1 array('d') with bounds (n)\n"
+"precone : input float\n"
+"yaw : input float\n"
+"tilt : input float\n"
+"azimuth : input float\n"
+"uinf : input float\n"
+"omegarpm : input float\n"
+"hubht : input float\n"
+"shearexp : input float\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: shape(r, 0)\n"
+"\nReturns\n-------\n"
+"vx : rank-1 array('d') with bounds (n)\n"
+"vy : rank-1 array('d') with bounds (n)";
+/* extern void F_FUNC(windcomponents,WINDCOMPONENTS)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*); */
+static PyObject *f2py_rout__bem_windcomponents(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int n = 0;
+    PyObject *n_capi = Py_None;
+    double *r = NULL;
+    npy_intp r_Dims[1] = {-1};
+    const int r_Rank = 1;
+    PyArrayObject *capi_r_as_array = NULL;
+    int capi_r_intent = 0;
+    PyObject *r_capi = Py_None;
+    double *precurve = NULL;
+    npy_intp precurve_Dims[1] = {-1};
+    const int precurve_Rank = 1;
+    PyArrayObject *capi_precurve_as_array = NULL;
+    int capi_precurve_intent = 0;
+    PyObject *precurve_capi = Py_None;
+    double *presweep = NULL;
+    npy_intp presweep_Dims[1] = {-1};
+    const int presweep_Rank = 1;
+    PyArrayObject *capi_presweep_as_array = NULL;
+    int capi_presweep_intent = 0;
+    PyObject *presweep_capi = Py_None;
+    double precone = 0;
+    PyObject *precone_capi = Py_None;
+    double yaw = 0;
+    PyObject *yaw_capi = Py_None;
+    double tilt = 0;
+    PyObject *tilt_capi = Py_None;
+    double azimuth = 0;
+    PyObject *azimuth_capi = Py_None;
+    double uinf = 0;
+    PyObject *uinf_capi = Py_None;
+    double omegarpm = 0;
+    PyObject *omegarpm_capi = Py_None;
+    double hubht = 0;
+    PyObject *hubht_capi = Py_None;
+    double shearexp = 0;
+    PyObject *shearexp_capi = Py_None;
+    double *vx = NULL;
+    npy_intp vx_Dims[1] = {-1};
+    const int vx_Rank = 1;
+    PyArrayObject *capi_vx_as_array = NULL;
+    int capi_vx_intent = 0;
+    double *vy = NULL;
+    npy_intp vy_Dims[1] = {-1};
+    const int vy_Rank = 1;
+    PyArrayObject *capi_vy_as_array = NULL;
+    int capi_vy_intent = 0;
+    static char *capi_kwlist[] = {"r","precurve","presweep","precone","yaw","tilt","azimuth","uinf","omegarpm","hubht","shearexp","n",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOOOOO|O:_bem.windcomponents",\
+        capi_kwlist,&r_capi,&precurve_capi,&presweep_capi,&precone_capi,&yaw_capi,&tilt_capi,&azimuth_capi,&uinf_capi,&omegarpm_capi,&hubht_capi,&shearexp_capi,&n_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable r */
+    ;
+    capi_r_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents: failed to create array from the 1st argument `r`";
+    capi_r_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,r_Dims,r_Rank,  capi_r_intent,r_capi,capi_errmess);
+    if (capi_r_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        r = (double *)(PyArray_DATA(capi_r_as_array));
+
+    /* Processing variable precone */
+        f2py_success = double_from_pyobj(&precone,precone_capi,"_bem.windcomponents() 4th argument (precone) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable yaw */
+        f2py_success = double_from_pyobj(&yaw,yaw_capi,"_bem.windcomponents() 5th argument (yaw) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable tilt */
+        f2py_success = double_from_pyobj(&tilt,tilt_capi,"_bem.windcomponents() 6th argument (tilt) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable azimuth */
+        f2py_success = double_from_pyobj(&azimuth,azimuth_capi,"_bem.windcomponents() 7th argument (azimuth) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable uinf */
+        f2py_success = double_from_pyobj(&uinf,uinf_capi,"_bem.windcomponents() 8th argument (uinf) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable omegarpm */
+        f2py_success = double_from_pyobj(&omegarpm,omegarpm_capi,"_bem.windcomponents() 9th argument (omegarpm) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable hubht */
+        f2py_success = double_from_pyobj(&hubht,hubht_capi,"_bem.windcomponents() 10th argument (hubht) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable shearexp */
+        f2py_success = double_from_pyobj(&shearexp,shearexp_capi,"_bem.windcomponents() 11st argument (shearexp) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable n */
+    if (n_capi == Py_None) n = shape(r, 0); else
+        f2py_success = int_from_pyobj(&n,n_capi,"_bem.windcomponents() 1st keyword (n) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(r, 0) == n,"shape(r, 0) == n","1st keyword n","windcomponents:n=%d",n) {
+    /* Processing variable precurve */
+    precurve_Dims[0]=n;
+    capi_precurve_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents: failed to create array from the 2nd argument `precurve`";
+    capi_precurve_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurve_Dims,precurve_Rank,  capi_precurve_intent,precurve_capi,capi_errmess);
+    if (capi_precurve_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurve = (double *)(PyArray_DATA(capi_precurve_as_array));
+
+    /* Processing variable presweep */
+    presweep_Dims[0]=n;
+    capi_presweep_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents: failed to create array from the 3rd argument `presweep`";
+    capi_presweep_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweep_Dims,presweep_Rank,  capi_presweep_intent,presweep_capi,capi_errmess);
+    if (capi_presweep_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweep = (double *)(PyArray_DATA(capi_presweep_as_array));
+
+    /* Processing variable vx */
+    vx_Dims[0]=n;
+    capi_vx_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.windcomponents: failed to create array from the hidden `vx`";
+    capi_vx_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,vx_Dims,vx_Rank,  capi_vx_intent,Py_None,capi_errmess);
+    if (capi_vx_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        vx = (double *)(PyArray_DATA(capi_vx_as_array));
+
+    /* Processing variable vy */
+    vy_Dims[0]=n;
+    capi_vy_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.windcomponents: failed to create array from the hidden `vy`";
+    capi_vy_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,vy_Dims,vy_Rank,  capi_vy_intent,Py_None,capi_errmess);
+    if (capi_vy_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        vy = (double *)(PyArray_DATA(capi_vy_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&n,r,precurve,presweep,&precone,&yaw,&tilt,&azimuth,&uinf,&omegarpm,&hubht,&shearexp,vx,vy);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("NN",capi_vx_as_array,capi_vy_as_array);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    }  /* if (capi_vy_as_array == NULL) ... else of vy */
+    /* End of cleaning variable vy */
+    }  /* if (capi_vx_as_array == NULL) ... else of vx */
+    /* End of cleaning variable vx */
+    if((PyObject *)capi_presweep_as_array!=presweep_capi) {
+        Py_XDECREF(capi_presweep_as_array); }
+    }  /* if (capi_presweep_as_array == NULL) ... else of presweep */
+    /* End of cleaning variable presweep */
+    if((PyObject *)capi_precurve_as_array!=precurve_capi) {
+        Py_XDECREF(capi_precurve_as_array); }
+    }  /* if (capi_precurve_as_array == NULL) ... else of precurve */
+    /* End of cleaning variable precurve */
+    } /*CHECKSCALAR(shape(r, 0) == n)*/
+    } /*if (f2py_success) of n*/
+    /* End of cleaning variable n */
+    } /*if (f2py_success) of shearexp*/
+    /* End of cleaning variable shearexp */
+    } /*if (f2py_success) of hubht*/
+    /* End of cleaning variable hubht */
+    } /*if (f2py_success) of omegarpm*/
+    /* End of cleaning variable omegarpm */
+    } /*if (f2py_success) of uinf*/
+    /* End of cleaning variable uinf */
+    } /*if (f2py_success) of azimuth*/
+    /* End of cleaning variable azimuth */
+    } /*if (f2py_success) of tilt*/
+    /* End of cleaning variable tilt */
+    } /*if (f2py_success) of yaw*/
+    /* End of cleaning variable yaw */
+    } /*if (f2py_success) of precone*/
+    /* End of cleaning variable precone */
+    if((PyObject *)capi_r_as_array!=r_capi) {
+        Py_XDECREF(capi_r_as_array); }
+    }  /* if (capi_r_as_array == NULL) ... else of r */
+    /* End of cleaning variable r */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/*************************** end of windcomponents ***************************/
+
+/******************************** thrusttorque ********************************/
+static char doc_f2py_rout__bem_thrusttorque[] = "\
+t,q,m = thrusttorque(np,tp,r,precurve,presweep,precone,rhub,rtip,precurvetip,presweeptip,[n])\n\nWrapper for ``thrusttorque``.\
+\n\nParameters\n----------\n"
+"np : input rank-1 array('d') with bounds (n)\n"
+"tp : input rank-1 array('d') with bounds (n)\n"
+"r : input rank-1 array('d') with bounds (n)\n"
+"precurve : input rank-1 array('d') with bounds (n)\n"
+"presweep : input rank-1 array('d') with bounds (n)\n"
+"precone : input float\n"
+"rhub : input float\n"
+"rtip : input float\n"
+"precurvetip : input float\n"
+"presweeptip : input float\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: shape(np, 0)\n"
+"\nReturns\n-------\n"
+"t : float\n"
+"q : float\n"
+"m : float";
+/* extern void F_FUNC(thrusttorque,THRUSTTORQUE)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*); */
+static PyObject *f2py_rout__bem_thrusttorque(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int n = 0;
+    PyObject *n_capi = Py_None;
+    double *np = NULL;
+    npy_intp np_Dims[1] = {-1};
+    const int np_Rank = 1;
+    PyArrayObject *capi_np_as_array = NULL;
+    int capi_np_intent = 0;
+    PyObject *np_capi = Py_None;
+    double *tp = NULL;
+    npy_intp tp_Dims[1] = {-1};
+    const int tp_Rank = 1;
+    PyArrayObject *capi_tp_as_array = NULL;
+    int capi_tp_intent = 0;
+    PyObject *tp_capi = Py_None;
+    double *r = NULL;
+    npy_intp r_Dims[1] = {-1};
+    const int r_Rank = 1;
+    PyArrayObject *capi_r_as_array = NULL;
+    int capi_r_intent = 0;
+    PyObject *r_capi = Py_None;
+    double *precurve = NULL;
+    npy_intp precurve_Dims[1] = {-1};
+    const int precurve_Rank = 1;
+    PyArrayObject *capi_precurve_as_array = NULL;
+    int capi_precurve_intent = 0;
+    PyObject *precurve_capi = Py_None;
+    double *presweep = NULL;
+    npy_intp presweep_Dims[1] = {-1};
+    const int presweep_Rank = 1;
+    PyArrayObject *capi_presweep_as_array = NULL;
+    int capi_presweep_intent = 0;
+    PyObject *presweep_capi = Py_None;
+    double precone = 0;
+    PyObject *precone_capi = Py_None;
+    double rhub = 0;
+    PyObject *rhub_capi = Py_None;
+    double rtip = 0;
+    PyObject *rtip_capi = Py_None;
+    double precurvetip = 0;
+    PyObject *precurvetip_capi = Py_None;
+    double presweeptip = 0;
+    PyObject *presweeptip_capi = Py_None;
+    double t = 0;
+    double q = 0;
+    double m = 0;
+    static char *capi_kwlist[] = {"np","tp","r","precurve","presweep","precone","rhub","rtip","precurvetip","presweeptip","n",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOOOO|O:_bem.thrusttorque",\
+        capi_kwlist,&np_capi,&tp_capi,&r_capi,&precurve_capi,&presweep_capi,&precone_capi,&rhub_capi,&rtip_capi,&precurvetip_capi,&presweeptip_capi,&n_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable np */
+    ;
+    capi_np_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.thrusttorque: failed to create array from the 1st argument `np`";
+    capi_np_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,np_Dims,np_Rank,  capi_np_intent,np_capi,capi_errmess);
+    if (capi_np_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        np = (double *)(PyArray_DATA(capi_np_as_array));
+
+    /* Processing variable precone */
+        f2py_success = double_from_pyobj(&precone,precone_capi,"_bem.thrusttorque() 6th argument (precone) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable rhub */
+        f2py_success = double_from_pyobj(&rhub,rhub_capi,"_bem.thrusttorque() 7th argument (rhub) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable rtip */
+        f2py_success = double_from_pyobj(&rtip,rtip_capi,"_bem.thrusttorque() 8th argument (rtip) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable precurvetip */
+        f2py_success = double_from_pyobj(&precurvetip,precurvetip_capi,"_bem.thrusttorque() 9th argument (precurvetip) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable presweeptip */
+        f2py_success = double_from_pyobj(&presweeptip,presweeptip_capi,"_bem.thrusttorque() 10th argument (presweeptip) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable t */
+    /* Processing variable q */
+    /* Processing variable m */
+    /* Processing variable n */
+    if (n_capi == Py_None) n = shape(np, 0); else
+        f2py_success = int_from_pyobj(&n,n_capi,"_bem.thrusttorque() 1st keyword (n) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(np, 0) == n,"shape(np, 0) == n","1st keyword n","thrusttorque:n=%d",n) {
+    /* Processing variable tp */
+    tp_Dims[0]=n;
+    capi_tp_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.thrusttorque: failed to create array from the 2nd argument `tp`";
+    capi_tp_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,tp_Dims,tp_Rank,  capi_tp_intent,tp_capi,capi_errmess);
+    if (capi_tp_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        tp = (double *)(PyArray_DATA(capi_tp_as_array));
+
+    /* Processing variable r */
+    r_Dims[0]=n;
+    capi_r_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.thrusttorque: failed to create array from the 3rd argument `r`";
+    capi_r_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,r_Dims,r_Rank,  capi_r_intent,r_capi,capi_errmess);
+    if (capi_r_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        r = (double *)(PyArray_DATA(capi_r_as_array));
+
+    /* Processing variable precurve */
+    precurve_Dims[0]=n;
+    capi_precurve_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.thrusttorque: failed to create array from the 4th argument `precurve`";
+    capi_precurve_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurve_Dims,precurve_Rank,  capi_precurve_intent,precurve_capi,capi_errmess);
+    if (capi_precurve_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurve = (double *)(PyArray_DATA(capi_precurve_as_array));
+
+    /* Processing variable presweep */
+    presweep_Dims[0]=n;
+    capi_presweep_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.thrusttorque: failed to create array from the 5th argument `presweep`";
+    capi_presweep_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweep_Dims,presweep_Rank,  capi_presweep_intent,presweep_capi,capi_errmess);
+    if (capi_presweep_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweep = (double *)(PyArray_DATA(capi_presweep_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&n,np,tp,r,precurve,presweep,&precone,&rhub,&rtip,&precurvetip,&presweeptip,&t,&q,&m);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("ddd",t,q,m);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_presweep_as_array!=presweep_capi) {
+        Py_XDECREF(capi_presweep_as_array); }
+    }  /* if (capi_presweep_as_array == NULL) ... else of presweep */
+    /* End of cleaning variable presweep */
+    if((PyObject *)capi_precurve_as_array!=precurve_capi) {
+        Py_XDECREF(capi_precurve_as_array); }
+    }  /* if (capi_precurve_as_array == NULL) ... else of precurve */
+    /* End of cleaning variable precurve */
+    if((PyObject *)capi_r_as_array!=r_capi) {
+        Py_XDECREF(capi_r_as_array); }
+    }  /* if (capi_r_as_array == NULL) ... else of r */
+    /* End of cleaning variable r */
+    if((PyObject *)capi_tp_as_array!=tp_capi) {
+        Py_XDECREF(capi_tp_as_array); }
+    }  /* if (capi_tp_as_array == NULL) ... else of tp */
+    /* End of cleaning variable tp */
+    } /*CHECKSCALAR(shape(np, 0) == n)*/
+    } /*if (f2py_success) of n*/
+    /* End of cleaning variable n */
+    /* End of cleaning variable m */
+    /* End of cleaning variable q */
+    /* End of cleaning variable t */
+    } /*if (f2py_success) of presweeptip*/
+    /* End of cleaning variable presweeptip */
+    } /*if (f2py_success) of precurvetip*/
+    /* End of cleaning variable precurvetip */
+    } /*if (f2py_success) of rtip*/
+    /* End of cleaning variable rtip */
+    } /*if (f2py_success) of rhub*/
+    /* End of cleaning variable rhub */
+    } /*if (f2py_success) of precone*/
+    /* End of cleaning variable precone */
+    if((PyObject *)capi_np_as_array!=np_capi) {
+        Py_XDECREF(capi_np_as_array); }
+    }  /* if (capi_np_as_array == NULL) ... else of np */
+    /* End of cleaning variable np */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/**************************** end of thrusttorque ****************************/
+
+/**************************** inductionfactors_dv ****************************/
+static char doc_f2py_rout__bem_inductionfactors_dv[] = "\
+fzero,a,ap,fzerod,ad,apd = inductionfactors_dv(r,chord,rhub,rtip,phi,cl,cd,b,vx,vy,rd,chordd,rhubd,rtipd,phid,cld,cdd,vxd,vyd,[usecd,hubloss,tiploss,wakerotation,nbdirs])\n\nWrapper for ``inductionfactors_dv``.\
+\n\nParameters\n----------\n"
+"r : input float\n"
+"chord : input float\n"
+"rhub : input float\n"
+"rtip : input float\n"
+"phi : input float\n"
+"cl : input float\n"
+"cd : input float\n"
+"b : input int\n"
+"vx : input float\n"
+"vy : input float\n"
+"rd : input rank-1 array('d') with bounds (nbdirs)\n"
+"chordd : input rank-1 array('d') with bounds (nbdirs)\n"
+"rhubd : input rank-1 array('d') with bounds (nbdirs)\n"
+"rtipd : input rank-1 array('d') with bounds (nbdirs)\n"
+"phid : input rank-1 array('d') with bounds (nbdirs)\n"
+"cld : input rank-1 array('d') with bounds (nbdirs)\n"
+"cdd : input rank-1 array('d') with bounds (nbdirs)\n"
+"vxd : input rank-1 array('d') with bounds (nbdirs)\n"
+"vyd : input rank-1 array('d') with bounds (nbdirs)\n"
+"\nOther Parameters\n----------------\n"
+"usecd : input int, optional\n    Default: 1\n"
+"hubloss : input int, optional\n    Default: 1\n"
+"tiploss : input int, optional\n    Default: 1\n"
+"wakerotation : input int, optional\n    Default: 1\n"
+"nbdirs : input int, optional\n    Default: shape(rd, 0)\n"
+"\nReturns\n-------\n"
+"fzero : float\n"
+"a : float\n"
+"ap : float\n"
+"fzerod : rank-1 array('d') with bounds (nbdirs)\n"
+"ad : rank-1 array('d') with bounds (nbdirs)\n"
+"apd : rank-1 array('d') with bounds (nbdirs)";
+/* extern void F_FUNC_US(inductionfactors_dv,INDUCTIONFACTORS_DV)(double*,double*,double*,double*,double*,double*,double*,int*,double*,double*,int*,int*,int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*); */
+static PyObject *f2py_rout__bem_inductionfactors_dv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,double*,double*,double*,double*,int*,double*,double*,int*,int*,int*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    double r = 0;
+    PyObject *r_capi = Py_None;
+    double chord = 0;
+    PyObject *chord_capi = Py_None;
+    double rhub = 0;
+    PyObject *rhub_capi = Py_None;
+    double rtip = 0;
+    PyObject *rtip_capi = Py_None;
+    double phi = 0;
+    PyObject *phi_capi = Py_None;
+    double cl = 0;
+    PyObject *cl_capi = Py_None;
+    double cd = 0;
+    PyObject *cd_capi = Py_None;
+    int b = 0;
+    PyObject *b_capi = Py_None;
+    double vx = 0;
+    PyObject *vx_capi = Py_None;
+    double vy = 0;
+    PyObject *vy_capi = Py_None;
+    int usecd = 0;
+    PyObject *usecd_capi = Py_None;
+    int hubloss = 0;
+    PyObject *hubloss_capi = Py_None;
+    int tiploss = 0;
+    PyObject *tiploss_capi = Py_None;
+    int wakerotation = 0;
+    PyObject *wakerotation_capi = Py_None;
+    double *rd = NULL;
+    npy_intp rd_Dims[1] = {-1};
+    const int rd_Rank = 1;
+    PyArrayObject *capi_rd_as_array = NULL;
+    int capi_rd_intent = 0;
+    PyObject *rd_capi = Py_None;
+    double *chordd = NULL;
+    npy_intp chordd_Dims[1] = {-1};
+    const int chordd_Rank = 1;
+    PyArrayObject *capi_chordd_as_array = NULL;
+    int capi_chordd_intent = 0;
+    PyObject *chordd_capi = Py_None;
+    double *rhubd = NULL;
+    npy_intp rhubd_Dims[1] = {-1};
+    const int rhubd_Rank = 1;
+    PyArrayObject *capi_rhubd_as_array = NULL;
+    int capi_rhubd_intent = 0;
+    PyObject *rhubd_capi = Py_None;
+    double *rtipd = NULL;
+    npy_intp rtipd_Dims[1] = {-1};
+    const int rtipd_Rank = 1;
+    PyArrayObject *capi_rtipd_as_array = NULL;
+    int capi_rtipd_intent = 0;
+    PyObject *rtipd_capi = Py_None;
+    double *phid = NULL;
+    npy_intp phid_Dims[1] = {-1};
+    const int phid_Rank = 1;
+    PyArrayObject *capi_phid_as_array = NULL;
+    int capi_phid_intent = 0;
+    PyObject *phid_capi = Py_None;
+    double *cld = NULL;
+    npy_intp cld_Dims[1] = {-1};
+    const int cld_Rank = 1;
+    PyArrayObject *capi_cld_as_array = NULL;
+    int capi_cld_intent = 0;
+    PyObject *cld_capi = Py_None;
+    double *cdd = NULL;
+    npy_intp cdd_Dims[1] = {-1};
+    const int cdd_Rank = 1;
+    PyArrayObject *capi_cdd_as_array = NULL;
+    int capi_cdd_intent = 0;
+    PyObject *cdd_capi = Py_None;
+    double *vxd = NULL;
+    npy_intp vxd_Dims[1] = {-1};
+    const int vxd_Rank = 1;
+    PyArrayObject *capi_vxd_as_array = NULL;
+    int capi_vxd_intent = 0;
+    PyObject *vxd_capi = Py_None;
+    double *vyd = NULL;
+    npy_intp vyd_Dims[1] = {-1};
+    const int vyd_Rank = 1;
+    PyArrayObject *capi_vyd_as_array = NULL;
+    int capi_vyd_intent = 0;
+    PyObject *vyd_capi = Py_None;
+    double fzero = 0;
+    double a = 0;
+    double ap = 0;
+    double *fzerod = NULL;
+    npy_intp fzerod_Dims[1] = {-1};
+    const int fzerod_Rank = 1;
+    PyArrayObject *capi_fzerod_as_array = NULL;
+    int capi_fzerod_intent = 0;
+    double *ad = NULL;
+    npy_intp ad_Dims[1] = {-1};
+    const int ad_Rank = 1;
+    PyArrayObject *capi_ad_as_array = NULL;
+    int capi_ad_intent = 0;
+    double *apd = NULL;
+    npy_intp apd_Dims[1] = {-1};
+    const int apd_Rank = 1;
+    PyArrayObject *capi_apd_as_array = NULL;
+    int capi_apd_intent = 0;
+    int nbdirs = 0;
+    PyObject *nbdirs_capi = Py_None;
+    static char *capi_kwlist[] = {"r","chord","rhub","rtip","phi","cl","cd","b","vx","vy","rd","chordd","rhubd","rtipd","phid","cld","cdd","vxd","vyd","usecd","hubloss","tiploss","wakerotation","nbdirs",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOOOOOOOOOOOOO|OOOOO:_bem.inductionfactors_dv",\
+        capi_kwlist,&r_capi,&chord_capi,&rhub_capi,&rtip_capi,&phi_capi,&cl_capi,&cd_capi,&b_capi,&vx_capi,&vy_capi,&rd_capi,&chordd_capi,&rhubd_capi,&rtipd_capi,&phid_capi,&cld_capi,&cdd_capi,&vxd_capi,&vyd_capi,&usecd_capi,&hubloss_capi,&tiploss_capi,&wakerotation_capi,&nbdirs_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable r */
+        f2py_success = double_from_pyobj(&r,r_capi,"_bem.inductionfactors_dv() 1st argument (r) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable chord */
+        f2py_success = double_from_pyobj(&chord,chord_capi,"_bem.inductionfactors_dv() 2nd argument (chord) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable rhub */
+        f2py_success = double_from_pyobj(&rhub,rhub_capi,"_bem.inductionfactors_dv() 3rd argument (rhub) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable rtip */
+        f2py_success = double_from_pyobj(&rtip,rtip_capi,"_bem.inductionfactors_dv() 4th argument (rtip) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable phi */
+        f2py_success = double_from_pyobj(&phi,phi_capi,"_bem.inductionfactors_dv() 5th argument (phi) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable cl */
+        f2py_success = double_from_pyobj(&cl,cl_capi,"_bem.inductionfactors_dv() 6th argument (cl) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable cd */
+        f2py_success = double_from_pyobj(&cd,cd_capi,"_bem.inductionfactors_dv() 7th argument (cd) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable rd */
+    ;
+    capi_rd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.inductionfactors_dv: failed to create array from the 11st argument `rd`";
+    capi_rd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,rd_Dims,rd_Rank,  capi_rd_intent,rd_capi,capi_errmess);
+    if (capi_rd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        rd = (double *)(PyArray_DATA(capi_rd_as_array));
+
+    /* Processing variable b */
+        f2py_success = int_from_pyobj(&b,b_capi,"_bem.inductionfactors_dv() 8th argument (b) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable vx */
+        f2py_success = double_from_pyobj(&vx,vx_capi,"_bem.inductionfactors_dv() 9th argument (vx) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable vy */
+        f2py_success = double_from_pyobj(&vy,vy_capi,"_bem.inductionfactors_dv() 10th argument (vy) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable usecd */
+    if (usecd_capi == Py_None) usecd = 1; else
+        usecd = (int)PyObject_IsTrue(usecd_capi);
+        f2py_success = 1;
+    if (f2py_success) {
+    /* Processing variable hubloss */
+    if (hubloss_capi == Py_None) hubloss = 1; else
+        hubloss = (int)PyObject_IsTrue(hubloss_capi);
+        f2py_success = 1;
+    if (f2py_success) {
+    /* Processing variable tiploss */
+    if (tiploss_capi == Py_None) tiploss = 1; else
+        tiploss = (int)PyObject_IsTrue(tiploss_capi);
+        f2py_success = 1;
+    if (f2py_success) {
+    /* Processing variable wakerotation */
+    if (wakerotation_capi == Py_None) wakerotation = 1; else
+        wakerotation = (int)PyObject_IsTrue(wakerotation_capi);
+        f2py_success = 1;
+    if (f2py_success) {
+    /* Processing variable fzero */
+    /* Processing variable a */
+    /* Processing variable ap */
+    /* Processing variable nbdirs */
+    if (nbdirs_capi == Py_None) nbdirs = shape(rd, 0); else
+        f2py_success = int_from_pyobj(&nbdirs,nbdirs_capi,"_bem.inductionfactors_dv() 5th keyword (nbdirs) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(rd, 0) == nbdirs,"shape(rd, 0) == nbdirs","5th keyword nbdirs","inductionfactors_dv:nbdirs=%d",nbdirs) {
+    /* Processing variable fzerod */
+    fzerod_Dims[0]=nbdirs;
+    capi_fzerod_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.inductionfactors_dv: failed to create array from the hidden `fzerod`";
+    capi_fzerod_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,fzerod_Dims,fzerod_Rank,  capi_fzerod_intent,Py_None,capi_errmess);
+    if (capi_fzerod_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        fzerod = (double *)(PyArray_DATA(capi_fzerod_as_array));
+
+    /* Processing variable ad */
+    ad_Dims[0]=nbdirs;
+    capi_ad_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.inductionfactors_dv: failed to create array from the hidden `ad`";
+    capi_ad_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,ad_Dims,ad_Rank,  capi_ad_intent,Py_None,capi_errmess);
+    if (capi_ad_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        ad = (double *)(PyArray_DATA(capi_ad_as_array));
+
+    /* Processing variable apd */
+    apd_Dims[0]=nbdirs;
+    capi_apd_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.inductionfactors_dv: failed to create array from the hidden `apd`";
+    capi_apd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,apd_Dims,apd_Rank,  capi_apd_intent,Py_None,capi_errmess);
+    if (capi_apd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        apd = (double *)(PyArray_DATA(capi_apd_as_array));
+
+    /* Processing variable chordd */
+    chordd_Dims[0]=nbdirs;
+    capi_chordd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.inductionfactors_dv: failed to create array from the 12nd argument `chordd`";
+    capi_chordd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,chordd_Dims,chordd_Rank,  capi_chordd_intent,chordd_capi,capi_errmess);
+    if (capi_chordd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        chordd = (double *)(PyArray_DATA(capi_chordd_as_array));
+
+    /* Processing variable rhubd */
+    rhubd_Dims[0]=nbdirs;
+    capi_rhubd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.inductionfactors_dv: failed to create array from the 13rd argument `rhubd`";
+    capi_rhubd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,rhubd_Dims,rhubd_Rank,  capi_rhubd_intent,rhubd_capi,capi_errmess);
+    if (capi_rhubd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        rhubd = (double *)(PyArray_DATA(capi_rhubd_as_array));
+
+    /* Processing variable rtipd */
+    rtipd_Dims[0]=nbdirs;
+    capi_rtipd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.inductionfactors_dv: failed to create array from the 14th argument `rtipd`";
+    capi_rtipd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,rtipd_Dims,rtipd_Rank,  capi_rtipd_intent,rtipd_capi,capi_errmess);
+    if (capi_rtipd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        rtipd = (double *)(PyArray_DATA(capi_rtipd_as_array));
+
+    /* Processing variable phid */
+    phid_Dims[0]=nbdirs;
+    capi_phid_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.inductionfactors_dv: failed to create array from the 15th argument `phid`";
+    capi_phid_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,phid_Dims,phid_Rank,  capi_phid_intent,phid_capi,capi_errmess);
+    if (capi_phid_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        phid = (double *)(PyArray_DATA(capi_phid_as_array));
+
+    /* Processing variable cld */
+    cld_Dims[0]=nbdirs;
+    capi_cld_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.inductionfactors_dv: failed to create array from the 16th argument `cld`";
+    capi_cld_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,cld_Dims,cld_Rank,  capi_cld_intent,cld_capi,capi_errmess);
+    if (capi_cld_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        cld = (double *)(PyArray_DATA(capi_cld_as_array));
+
+    /* Processing variable cdd */
+    cdd_Dims[0]=nbdirs;
+    capi_cdd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.inductionfactors_dv: failed to create array from the 17th argument `cdd`";
+    capi_cdd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,cdd_Dims,cdd_Rank,  capi_cdd_intent,cdd_capi,capi_errmess);
+    if (capi_cdd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        cdd = (double *)(PyArray_DATA(capi_cdd_as_array));
+
+    /* Processing variable vxd */
+    vxd_Dims[0]=nbdirs;
+    capi_vxd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.inductionfactors_dv: failed to create array from the 18th argument `vxd`";
+    capi_vxd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,vxd_Dims,vxd_Rank,  capi_vxd_intent,vxd_capi,capi_errmess);
+    if (capi_vxd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        vxd = (double *)(PyArray_DATA(capi_vxd_as_array));
+
+    /* Processing variable vyd */
+    vyd_Dims[0]=nbdirs;
+    capi_vyd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.inductionfactors_dv: failed to create array from the 19th argument `vyd`";
+    capi_vyd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,vyd_Dims,vyd_Rank,  capi_vyd_intent,vyd_capi,capi_errmess);
+    if (capi_vyd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        vyd = (double *)(PyArray_DATA(capi_vyd_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&r,&chord,&rhub,&rtip,&phi,&cl,&cd,&b,&vx,&vy,&usecd,&hubloss,&tiploss,&wakerotation,rd,chordd,rhubd,rtipd,phid,cld,cdd,vxd,vyd,&fzero,&a,&ap,fzerod,ad,apd,&nbdirs);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("dddNNN",fzero,a,ap,capi_fzerod_as_array,capi_ad_as_array,capi_apd_as_array);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_vyd_as_array!=vyd_capi) {
+        Py_XDECREF(capi_vyd_as_array); }
+    }  /* if (capi_vyd_as_array == NULL) ... else of vyd */
+    /* End of cleaning variable vyd */
+    if((PyObject *)capi_vxd_as_array!=vxd_capi) {
+        Py_XDECREF(capi_vxd_as_array); }
+    }  /* if (capi_vxd_as_array == NULL) ... else of vxd */
+    /* End of cleaning variable vxd */
+    if((PyObject *)capi_cdd_as_array!=cdd_capi) {
+        Py_XDECREF(capi_cdd_as_array); }
+    }  /* if (capi_cdd_as_array == NULL) ... else of cdd */
+    /* End of cleaning variable cdd */
+    if((PyObject *)capi_cld_as_array!=cld_capi) {
+        Py_XDECREF(capi_cld_as_array); }
+    }  /* if (capi_cld_as_array == NULL) ... else of cld */
+    /* End of cleaning variable cld */
+    if((PyObject *)capi_phid_as_array!=phid_capi) {
+        Py_XDECREF(capi_phid_as_array); }
+    }  /* if (capi_phid_as_array == NULL) ... else of phid */
+    /* End of cleaning variable phid */
+    if((PyObject *)capi_rtipd_as_array!=rtipd_capi) {
+        Py_XDECREF(capi_rtipd_as_array); }
+    }  /* if (capi_rtipd_as_array == NULL) ... else of rtipd */
+    /* End of cleaning variable rtipd */
+    if((PyObject *)capi_rhubd_as_array!=rhubd_capi) {
+        Py_XDECREF(capi_rhubd_as_array); }
+    }  /* if (capi_rhubd_as_array == NULL) ... else of rhubd */
+    /* End of cleaning variable rhubd */
+    if((PyObject *)capi_chordd_as_array!=chordd_capi) {
+        Py_XDECREF(capi_chordd_as_array); }
+    }  /* if (capi_chordd_as_array == NULL) ... else of chordd */
+    /* End of cleaning variable chordd */
+    }  /* if (capi_apd_as_array == NULL) ... else of apd */
+    /* End of cleaning variable apd */
+    }  /* if (capi_ad_as_array == NULL) ... else of ad */
+    /* End of cleaning variable ad */
+    }  /* if (capi_fzerod_as_array == NULL) ... else of fzerod */
+    /* End of cleaning variable fzerod */
+    } /*CHECKSCALAR(shape(rd, 0) == nbdirs)*/
+    } /*if (f2py_success) of nbdirs*/
+    /* End of cleaning variable nbdirs */
+    /* End of cleaning variable ap */
+    /* End of cleaning variable a */
+    /* End of cleaning variable fzero */
+    } /*if (f2py_success) of wakerotation*/
+    /* End of cleaning variable wakerotation */
+    } /*if (f2py_success) of tiploss*/
+    /* End of cleaning variable tiploss */
+    } /*if (f2py_success) of hubloss*/
+    /* End of cleaning variable hubloss */
+    } /*if (f2py_success) of usecd*/
+    /* End of cleaning variable usecd */
+    } /*if (f2py_success) of vy*/
+    /* End of cleaning variable vy */
+    } /*if (f2py_success) of vx*/
+    /* End of cleaning variable vx */
+    } /*if (f2py_success) of b*/
+    /* End of cleaning variable b */
+    if((PyObject *)capi_rd_as_array!=rd_capi) {
+        Py_XDECREF(capi_rd_as_array); }
+    }  /* if (capi_rd_as_array == NULL) ... else of rd */
+    /* End of cleaning variable rd */
+    } /*if (f2py_success) of cd*/
+    /* End of cleaning variable cd */
+    } /*if (f2py_success) of cl*/
+    /* End of cleaning variable cl */
+    } /*if (f2py_success) of phi*/
+    /* End of cleaning variable phi */
+    } /*if (f2py_success) of rtip*/
+    /* End of cleaning variable rtip */
+    } /*if (f2py_success) of rhub*/
+    /* End of cleaning variable rhub */
+    } /*if (f2py_success) of chord*/
+    /* End of cleaning variable chord */
+    } /*if (f2py_success) of r*/
+    /* End of cleaning variable r */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/************************* end of inductionfactors_dv *************************/
+
+/****************************** relativewind_dv ******************************/
+static char doc_f2py_rout__bem_relativewind_dv[] = "\
+alpha,alphad,w,wd,re,red = relativewind_dv(phi,phid,a,ad,ap,apd,vx,vxd,vy,vyd,pitch,pitchd,chord,chordd,theta,thetad,rho,mu,[nbdirs])\n\nWrapper for ``relativewind_dv``.\
+\n\nParameters\n----------\n"
+"phi : input float\n"
+"phid : input rank-1 array('d') with bounds (nbdirs)\n"
+"a : input float\n"
+"ad : input rank-1 array('d') with bounds (nbdirs)\n"
+"ap : input float\n"
+"apd : input rank-1 array('d') with bounds (nbdirs)\n"
+"vx : input float\n"
+"vxd : input rank-1 array('d') with bounds (nbdirs)\n"
+"vy : input float\n"
+"vyd : input rank-1 array('d') with bounds (nbdirs)\n"
+"pitch : input float\n"
+"pitchd : input rank-1 array('d') with bounds (nbdirs)\n"
+"chord : input float\n"
+"chordd : input rank-1 array('d') with bounds (nbdirs)\n"
+"theta : input float\n"
+"thetad : input rank-1 array('d') with bounds (nbdirs)\n"
+"rho : input float\n"
+"mu : input float\n"
+"\nOther Parameters\n----------------\n"
+"nbdirs : input int, optional\n    Default: shape(phid, 0)\n"
+"\nReturns\n-------\n"
+"alpha : float\n"
+"alphad : rank-1 array('d') with bounds (nbdirs)\n"
+"w : float\n"
+"wd : rank-1 array('d') with bounds (nbdirs)\n"
+"re : float\n"
+"red : rank-1 array('d') with bounds (nbdirs)";
+/* extern void F_FUNC_US(relativewind_dv,RELATIVEWIND_DV)(double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*); */
+static PyObject *f2py_rout__bem_relativewind_dv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    double phi = 0;
+    PyObject *phi_capi = Py_None;
+    double *phid = NULL;
+    npy_intp phid_Dims[1] = {-1};
+    const int phid_Rank = 1;
+    PyArrayObject *capi_phid_as_array = NULL;
+    int capi_phid_intent = 0;
+    PyObject *phid_capi = Py_None;
+    double a = 0;
+    PyObject *a_capi = Py_None;
+    double *ad = NULL;
+    npy_intp ad_Dims[1] = {-1};
+    const int ad_Rank = 1;
+    PyArrayObject *capi_ad_as_array = NULL;
+    int capi_ad_intent = 0;
+    PyObject *ad_capi = Py_None;
+    double ap = 0;
+    PyObject *ap_capi = Py_None;
+    double *apd = NULL;
+    npy_intp apd_Dims[1] = {-1};
+    const int apd_Rank = 1;
+    PyArrayObject *capi_apd_as_array = NULL;
+    int capi_apd_intent = 0;
+    PyObject *apd_capi = Py_None;
+    double vx = 0;
+    PyObject *vx_capi = Py_None;
+    double *vxd = NULL;
+    npy_intp vxd_Dims[1] = {-1};
+    const int vxd_Rank = 1;
+    PyArrayObject *capi_vxd_as_array = NULL;
+    int capi_vxd_intent = 0;
+    PyObject *vxd_capi = Py_None;
+    double vy = 0;
+    PyObject *vy_capi = Py_None;
+    double *vyd = NULL;
+    npy_intp vyd_Dims[1] = {-1};
+    const int vyd_Rank = 1;
+    PyArrayObject *capi_vyd_as_array = NULL;
+    int capi_vyd_intent = 0;
+    PyObject *vyd_capi = Py_None;
+    double pitch = 0;
+    PyObject *pitch_capi = Py_None;
+    double *pitchd = NULL;
+    npy_intp pitchd_Dims[1] = {-1};
+    const int pitchd_Rank = 1;
+    PyArrayObject *capi_pitchd_as_array = NULL;
+    int capi_pitchd_intent = 0;
+    PyObject *pitchd_capi = Py_None;
+    double chord = 0;
+    PyObject *chord_capi = Py_None;
+    double *chordd = NULL;
+    npy_intp chordd_Dims[1] = {-1};
+    const int chordd_Rank = 1;
+    PyArrayObject *capi_chordd_as_array = NULL;
+    int capi_chordd_intent = 0;
+    PyObject *chordd_capi = Py_None;
+    double theta = 0;
+    PyObject *theta_capi = Py_None;
+    double *thetad = NULL;
+    npy_intp thetad_Dims[1] = {-1};
+    const int thetad_Rank = 1;
+    PyArrayObject *capi_thetad_as_array = NULL;
+    int capi_thetad_intent = 0;
+    PyObject *thetad_capi = Py_None;
+    double rho = 0;
+    PyObject *rho_capi = Py_None;
+    double mu = 0;
+    PyObject *mu_capi = Py_None;
+    double alpha = 0;
+    double *alphad = NULL;
+    npy_intp alphad_Dims[1] = {-1};
+    const int alphad_Rank = 1;
+    PyArrayObject *capi_alphad_as_array = NULL;
+    int capi_alphad_intent = 0;
+    double w = 0;
+    double *wd = NULL;
+    npy_intp wd_Dims[1] = {-1};
+    const int wd_Rank = 1;
+    PyArrayObject *capi_wd_as_array = NULL;
+    int capi_wd_intent = 0;
+    double re = 0;
+    double *red = NULL;
+    npy_intp red_Dims[1] = {-1};
+    const int red_Rank = 1;
+    PyArrayObject *capi_red_as_array = NULL;
+    int capi_red_intent = 0;
+    int nbdirs = 0;
+    PyObject *nbdirs_capi = Py_None;
+    static char *capi_kwlist[] = {"phi","phid","a","ad","ap","apd","vx","vxd","vy","vyd","pitch","pitchd","chord","chordd","theta","thetad","rho","mu","nbdirs",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOOOOOOOOOOOO|O:_bem.relativewind_dv",\
+        capi_kwlist,&phi_capi,&phid_capi,&a_capi,&ad_capi,&ap_capi,&apd_capi,&vx_capi,&vxd_capi,&vy_capi,&vyd_capi,&pitch_capi,&pitchd_capi,&chord_capi,&chordd_capi,&theta_capi,&thetad_capi,&rho_capi,&mu_capi,&nbdirs_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable phi */
+        f2py_success = double_from_pyobj(&phi,phi_capi,"_bem.relativewind_dv() 1st argument (phi) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable a */
+        f2py_success = double_from_pyobj(&a,a_capi,"_bem.relativewind_dv() 3rd argument (a) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable ap */
+        f2py_success = double_from_pyobj(&ap,ap_capi,"_bem.relativewind_dv() 5th argument (ap) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable vx */
+        f2py_success = double_from_pyobj(&vx,vx_capi,"_bem.relativewind_dv() 7th argument (vx) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable vy */
+        f2py_success = double_from_pyobj(&vy,vy_capi,"_bem.relativewind_dv() 9th argument (vy) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable pitch */
+        f2py_success = double_from_pyobj(&pitch,pitch_capi,"_bem.relativewind_dv() 11st argument (pitch) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable phid */
+    ;
+    capi_phid_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.relativewind_dv: failed to create array from the 2nd argument `phid`";
+    capi_phid_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,phid_Dims,phid_Rank,  capi_phid_intent,phid_capi,capi_errmess);
+    if (capi_phid_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        phid = (double *)(PyArray_DATA(capi_phid_as_array));
+
+    /* Processing variable chord */
+        f2py_success = double_from_pyobj(&chord,chord_capi,"_bem.relativewind_dv() 13rd argument (chord) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable theta */
+        f2py_success = double_from_pyobj(&theta,theta_capi,"_bem.relativewind_dv() 15th argument (theta) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable rho */
+        f2py_success = double_from_pyobj(&rho,rho_capi,"_bem.relativewind_dv() 17th argument (rho) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable mu */
+        f2py_success = double_from_pyobj(&mu,mu_capi,"_bem.relativewind_dv() 18th argument (mu) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable alpha */
+    /* Processing variable w */
+    /* Processing variable re */
+    /* Processing variable nbdirs */
+    if (nbdirs_capi == Py_None) nbdirs = shape(phid, 0); else
+        f2py_success = int_from_pyobj(&nbdirs,nbdirs_capi,"_bem.relativewind_dv() 1st keyword (nbdirs) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(phid, 0) == nbdirs,"shape(phid, 0) == nbdirs","1st keyword nbdirs","relativewind_dv:nbdirs=%d",nbdirs) {
+    /* Processing variable alphad */
+    alphad_Dims[0]=nbdirs;
+    capi_alphad_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.relativewind_dv: failed to create array from the hidden `alphad`";
+    capi_alphad_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,alphad_Dims,alphad_Rank,  capi_alphad_intent,Py_None,capi_errmess);
+    if (capi_alphad_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        alphad = (double *)(PyArray_DATA(capi_alphad_as_array));
+
+    /* Processing variable wd */
+    wd_Dims[0]=nbdirs;
+    capi_wd_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.relativewind_dv: failed to create array from the hidden `wd`";
+    capi_wd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,wd_Dims,wd_Rank,  capi_wd_intent,Py_None,capi_errmess);
+    if (capi_wd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        wd = (double *)(PyArray_DATA(capi_wd_as_array));
+
+    /* Processing variable red */
+    red_Dims[0]=nbdirs;
+    capi_red_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.relativewind_dv: failed to create array from the hidden `red`";
+    capi_red_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,red_Dims,red_Rank,  capi_red_intent,Py_None,capi_errmess);
+    if (capi_red_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        red = (double *)(PyArray_DATA(capi_red_as_array));
+
+    /* Processing variable ad */
+    ad_Dims[0]=nbdirs;
+    capi_ad_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.relativewind_dv: failed to create array from the 4th argument `ad`";
+    capi_ad_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,ad_Dims,ad_Rank,  capi_ad_intent,ad_capi,capi_errmess);
+    if (capi_ad_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        ad = (double *)(PyArray_DATA(capi_ad_as_array));
+
+    /* Processing variable apd */
+    apd_Dims[0]=nbdirs;
+    capi_apd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.relativewind_dv: failed to create array from the 6th argument `apd`";
+    capi_apd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,apd_Dims,apd_Rank,  capi_apd_intent,apd_capi,capi_errmess);
+    if (capi_apd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        apd = (double *)(PyArray_DATA(capi_apd_as_array));
+
+    /* Processing variable vxd */
+    vxd_Dims[0]=nbdirs;
+    capi_vxd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.relativewind_dv: failed to create array from the 8th argument `vxd`";
+    capi_vxd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,vxd_Dims,vxd_Rank,  capi_vxd_intent,vxd_capi,capi_errmess);
+    if (capi_vxd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        vxd = (double *)(PyArray_DATA(capi_vxd_as_array));
+
+    /* Processing variable vyd */
+    vyd_Dims[0]=nbdirs;
+    capi_vyd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.relativewind_dv: failed to create array from the 10th argument `vyd`";
+    capi_vyd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,vyd_Dims,vyd_Rank,  capi_vyd_intent,vyd_capi,capi_errmess);
+    if (capi_vyd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        vyd = (double *)(PyArray_DATA(capi_vyd_as_array));
+
+    /* Processing variable pitchd */
+    pitchd_Dims[0]=nbdirs;
+    capi_pitchd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.relativewind_dv: failed to create array from the 12nd argument `pitchd`";
+    capi_pitchd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,pitchd_Dims,pitchd_Rank,  capi_pitchd_intent,pitchd_capi,capi_errmess);
+    if (capi_pitchd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        pitchd = (double *)(PyArray_DATA(capi_pitchd_as_array));
+
+    /* Processing variable chordd */
+    chordd_Dims[0]=nbdirs;
+    capi_chordd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.relativewind_dv: failed to create array from the 14th argument `chordd`";
+    capi_chordd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,chordd_Dims,chordd_Rank,  capi_chordd_intent,chordd_capi,capi_errmess);
+    if (capi_chordd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        chordd = (double *)(PyArray_DATA(capi_chordd_as_array));
+
+    /* Processing variable thetad */
+    thetad_Dims[0]=nbdirs;
+    capi_thetad_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.relativewind_dv: failed to create array from the 16th argument `thetad`";
+    capi_thetad_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,thetad_Dims,thetad_Rank,  capi_thetad_intent,thetad_capi,capi_errmess);
+    if (capi_thetad_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        thetad = (double *)(PyArray_DATA(capi_thetad_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&phi,phid,&a,ad,&ap,apd,&vx,vxd,&vy,vyd,&pitch,pitchd,&chord,chordd,&theta,thetad,&rho,&mu,&alpha,alphad,&w,wd,&re,red,&nbdirs);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("dNdNdN",alpha,capi_alphad_as_array,w,capi_wd_as_array,re,capi_red_as_array);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_thetad_as_array!=thetad_capi) {
+        Py_XDECREF(capi_thetad_as_array); }
+    }  /* if (capi_thetad_as_array == NULL) ... else of thetad */
+    /* End of cleaning variable thetad */
+    if((PyObject *)capi_chordd_as_array!=chordd_capi) {
+        Py_XDECREF(capi_chordd_as_array); }
+    }  /* if (capi_chordd_as_array == NULL) ... else of chordd */
+    /* End of cleaning variable chordd */
+    if((PyObject *)capi_pitchd_as_array!=pitchd_capi) {
+        Py_XDECREF(capi_pitchd_as_array); }
+    }  /* if (capi_pitchd_as_array == NULL) ... else of pitchd */
+    /* End of cleaning variable pitchd */
+    if((PyObject *)capi_vyd_as_array!=vyd_capi) {
+        Py_XDECREF(capi_vyd_as_array); }
+    }  /* if (capi_vyd_as_array == NULL) ... else of vyd */
+    /* End of cleaning variable vyd */
+    if((PyObject *)capi_vxd_as_array!=vxd_capi) {
+        Py_XDECREF(capi_vxd_as_array); }
+    }  /* if (capi_vxd_as_array == NULL) ... else of vxd */
+    /* End of cleaning variable vxd */
+    if((PyObject *)capi_apd_as_array!=apd_capi) {
+        Py_XDECREF(capi_apd_as_array); }
+    }  /* if (capi_apd_as_array == NULL) ... else of apd */
+    /* End of cleaning variable apd */
+    if((PyObject *)capi_ad_as_array!=ad_capi) {
+        Py_XDECREF(capi_ad_as_array); }
+    }  /* if (capi_ad_as_array == NULL) ... else of ad */
+    /* End of cleaning variable ad */
+    }  /* if (capi_red_as_array == NULL) ... else of red */
+    /* End of cleaning variable red */
+    }  /* if (capi_wd_as_array == NULL) ... else of wd */
+    /* End of cleaning variable wd */
+    }  /* if (capi_alphad_as_array == NULL) ... else of alphad */
+    /* End of cleaning variable alphad */
+    } /*CHECKSCALAR(shape(phid, 0) == nbdirs)*/
+    } /*if (f2py_success) of nbdirs*/
+    /* End of cleaning variable nbdirs */
+    /* End of cleaning variable re */
+    /* End of cleaning variable w */
+    /* End of cleaning variable alpha */
+    } /*if (f2py_success) of mu*/
+    /* End of cleaning variable mu */
+    } /*if (f2py_success) of rho*/
+    /* End of cleaning variable rho */
+    } /*if (f2py_success) of theta*/
+    /* End of cleaning variable theta */
+    } /*if (f2py_success) of chord*/
+    /* End of cleaning variable chord */
+    if((PyObject *)capi_phid_as_array!=phid_capi) {
+        Py_XDECREF(capi_phid_as_array); }
+    }  /* if (capi_phid_as_array == NULL) ... else of phid */
+    /* End of cleaning variable phid */
+    } /*if (f2py_success) of pitch*/
+    /* End of cleaning variable pitch */
+    } /*if (f2py_success) of vy*/
+    /* End of cleaning variable vy */
+    } /*if (f2py_success) of vx*/
+    /* End of cleaning variable vx */
+    } /*if (f2py_success) of ap*/
+    /* End of cleaning variable ap */
+    } /*if (f2py_success) of a*/
+    /* End of cleaning variable a */
+    } /*if (f2py_success) of phi*/
+    /* End of cleaning variable phi */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/*************************** end of relativewind_dv ***************************/
+
+/***************************** windcomponents_dv *****************************/
+static char doc_f2py_rout__bem_windcomponents_dv[] = "\
+vx,vxd,vy,vyd = windcomponents_dv(r,rd,precurve,precurved,presweep,presweepd,precone,preconed,yaw,yawd,tilt,tiltd,azimuth,azimuthd,uinf,uinfd,omegarpm,omegarpmd,hubht,hubhtd,shearexp,[n,nbdirs])\n\nWrapper for ``windcomponents_dv``.\
+\n\nParameters\n----------\n"
+"r : input rank-1 array('d') with bounds (n)\n"
+"rd : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"precurve : input rank-1 array('d') with bounds (n)\n"
+"precurved : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"presweep : input rank-1 array('d') with bounds (n)\n"
+"presweepd : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"precone : input float\n"
+"preconed : input rank-1 array('d') with bounds (nbdirs)\n"
+"yaw : input float\n"
+"yawd : input rank-1 array('d') with bounds (nbdirs)\n"
+"tilt : input float\n"
+"tiltd : input rank-1 array('d') with bounds (nbdirs)\n"
+"azimuth : input float\n"
+"azimuthd : input rank-1 array('d') with bounds (nbdirs)\n"
+"uinf : input float\n"
+"uinfd : input rank-1 array('d') with bounds (nbdirs)\n"
+"omegarpm : input float\n"
+"omegarpmd : input rank-1 array('d') with bounds (nbdirs)\n"
+"hubht : input float\n"
+"hubhtd : input rank-1 array('d') with bounds (nbdirs)\n"
+"shearexp : input float\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: shape(r, 0)\n"
+"nbdirs : input int, optional\n    Default: shape(rd, 0)\n"
+"\nReturns\n-------\n"
+"vx : rank-1 array('d') with bounds (n)\n"
+"vxd : rank-2 array('d') with bounds (nbdirs,n)\n"
+"vy : rank-1 array('d') with bounds (n)\n"
+"vyd : rank-2 array('d') with bounds (nbdirs,n)";
+/* extern void F_FUNC_US(windcomponents_dv,WINDCOMPONENTS_DV)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*); */
+static PyObject *f2py_rout__bem_windcomponents_dv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int n = 0;
+    PyObject *n_capi = Py_None;
+    double *r = NULL;
+    npy_intp r_Dims[1] = {-1};
+    const int r_Rank = 1;
+    PyArrayObject *capi_r_as_array = NULL;
+    int capi_r_intent = 0;
+    PyObject *r_capi = Py_None;
+    double *rd = NULL;
+    npy_intp rd_Dims[2] = {-1, -1};
+    const int rd_Rank = 2;
+    PyArrayObject *capi_rd_as_array = NULL;
+    int capi_rd_intent = 0;
+    PyObject *rd_capi = Py_None;
+    double *precurve = NULL;
+    npy_intp precurve_Dims[1] = {-1};
+    const int precurve_Rank = 1;
+    PyArrayObject *capi_precurve_as_array = NULL;
+    int capi_precurve_intent = 0;
+    PyObject *precurve_capi = Py_None;
+    double *precurved = NULL;
+    npy_intp precurved_Dims[2] = {-1, -1};
+    const int precurved_Rank = 2;
+    PyArrayObject *capi_precurved_as_array = NULL;
+    int capi_precurved_intent = 0;
+    PyObject *precurved_capi = Py_None;
+    double *presweep = NULL;
+    npy_intp presweep_Dims[1] = {-1};
+    const int presweep_Rank = 1;
+    PyArrayObject *capi_presweep_as_array = NULL;
+    int capi_presweep_intent = 0;
+    PyObject *presweep_capi = Py_None;
+    double *presweepd = NULL;
+    npy_intp presweepd_Dims[2] = {-1, -1};
+    const int presweepd_Rank = 2;
+    PyArrayObject *capi_presweepd_as_array = NULL;
+    int capi_presweepd_intent = 0;
+    PyObject *presweepd_capi = Py_None;
+    double precone = 0;
+    PyObject *precone_capi = Py_None;
+    double *preconed = NULL;
+    npy_intp preconed_Dims[1] = {-1};
+    const int preconed_Rank = 1;
+    PyArrayObject *capi_preconed_as_array = NULL;
+    int capi_preconed_intent = 0;
+    PyObject *preconed_capi = Py_None;
+    double yaw = 0;
+    PyObject *yaw_capi = Py_None;
+    double *yawd = NULL;
+    npy_intp yawd_Dims[1] = {-1};
+    const int yawd_Rank = 1;
+    PyArrayObject *capi_yawd_as_array = NULL;
+    int capi_yawd_intent = 0;
+    PyObject *yawd_capi = Py_None;
+    double tilt = 0;
+    PyObject *tilt_capi = Py_None;
+    double *tiltd = NULL;
+    npy_intp tiltd_Dims[1] = {-1};
+    const int tiltd_Rank = 1;
+    PyArrayObject *capi_tiltd_as_array = NULL;
+    int capi_tiltd_intent = 0;
+    PyObject *tiltd_capi = Py_None;
+    double azimuth = 0;
+    PyObject *azimuth_capi = Py_None;
+    double *azimuthd = NULL;
+    npy_intp azimuthd_Dims[1] = {-1};
+    const int azimuthd_Rank = 1;
+    PyArrayObject *capi_azimuthd_as_array = NULL;
+    int capi_azimuthd_intent = 0;
+    PyObject *azimuthd_capi = Py_None;
+    double uinf = 0;
+    PyObject *uinf_capi = Py_None;
+    double *uinfd = NULL;
+    npy_intp uinfd_Dims[1] = {-1};
+    const int uinfd_Rank = 1;
+    PyArrayObject *capi_uinfd_as_array = NULL;
+    int capi_uinfd_intent = 0;
+    PyObject *uinfd_capi = Py_None;
+    double omegarpm = 0;
+    PyObject *omegarpm_capi = Py_None;
+    double *omegarpmd = NULL;
+    npy_intp omegarpmd_Dims[1] = {-1};
+    const int omegarpmd_Rank = 1;
+    PyArrayObject *capi_omegarpmd_as_array = NULL;
+    int capi_omegarpmd_intent = 0;
+    PyObject *omegarpmd_capi = Py_None;
+    double hubht = 0;
+    PyObject *hubht_capi = Py_None;
+    double *hubhtd = NULL;
+    npy_intp hubhtd_Dims[1] = {-1};
+    const int hubhtd_Rank = 1;
+    PyArrayObject *capi_hubhtd_as_array = NULL;
+    int capi_hubhtd_intent = 0;
+    PyObject *hubhtd_capi = Py_None;
+    double shearexp = 0;
+    PyObject *shearexp_capi = Py_None;
+    double *vx = NULL;
+    npy_intp vx_Dims[1] = {-1};
+    const int vx_Rank = 1;
+    PyArrayObject *capi_vx_as_array = NULL;
+    int capi_vx_intent = 0;
+    double *vxd = NULL;
+    npy_intp vxd_Dims[2] = {-1, -1};
+    const int vxd_Rank = 2;
+    PyArrayObject *capi_vxd_as_array = NULL;
+    int capi_vxd_intent = 0;
+    double *vy = NULL;
+    npy_intp vy_Dims[1] = {-1};
+    const int vy_Rank = 1;
+    PyArrayObject *capi_vy_as_array = NULL;
+    int capi_vy_intent = 0;
+    double *vyd = NULL;
+    npy_intp vyd_Dims[2] = {-1, -1};
+    const int vyd_Rank = 2;
+    PyArrayObject *capi_vyd_as_array = NULL;
+    int capi_vyd_intent = 0;
+    int nbdirs = 0;
+    PyObject *nbdirs_capi = Py_None;
+    static char *capi_kwlist[] = {"r","rd","precurve","precurved","presweep","presweepd","precone","preconed","yaw","yawd","tilt","tiltd","azimuth","azimuthd","uinf","uinfd","omegarpm","omegarpmd","hubht","hubhtd","shearexp","n","nbdirs",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOOOOOOOOOOOOOOO|OO:_bem.windcomponents_dv",\
+        capi_kwlist,&r_capi,&rd_capi,&precurve_capi,&precurved_capi,&presweep_capi,&presweepd_capi,&precone_capi,&preconed_capi,&yaw_capi,&yawd_capi,&tilt_capi,&tiltd_capi,&azimuth_capi,&azimuthd_capi,&uinf_capi,&uinfd_capi,&omegarpm_capi,&omegarpmd_capi,&hubht_capi,&hubhtd_capi,&shearexp_capi,&n_capi,&nbdirs_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable r */
+    ;
+    capi_r_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 1st argument `r`";
+    capi_r_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,r_Dims,r_Rank,  capi_r_intent,r_capi,capi_errmess);
+    if (capi_r_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        r = (double *)(PyArray_DATA(capi_r_as_array));
+
+    /* Processing variable precone */
+        f2py_success = double_from_pyobj(&precone,precone_capi,"_bem.windcomponents_dv() 7th argument (precone) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable yaw */
+        f2py_success = double_from_pyobj(&yaw,yaw_capi,"_bem.windcomponents_dv() 9th argument (yaw) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable tilt */
+        f2py_success = double_from_pyobj(&tilt,tilt_capi,"_bem.windcomponents_dv() 11st argument (tilt) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable azimuth */
+        f2py_success = double_from_pyobj(&azimuth,azimuth_capi,"_bem.windcomponents_dv() 13rd argument (azimuth) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable uinf */
+        f2py_success = double_from_pyobj(&uinf,uinf_capi,"_bem.windcomponents_dv() 15th argument (uinf) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable omegarpm */
+        f2py_success = double_from_pyobj(&omegarpm,omegarpm_capi,"_bem.windcomponents_dv() 17th argument (omegarpm) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable hubht */
+        f2py_success = double_from_pyobj(&hubht,hubht_capi,"_bem.windcomponents_dv() 19th argument (hubht) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable shearexp */
+        f2py_success = double_from_pyobj(&shearexp,shearexp_capi,"_bem.windcomponents_dv() 21st argument (shearexp) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable n */
+    if (n_capi == Py_None) n = shape(r, 0); else
+        f2py_success = int_from_pyobj(&n,n_capi,"_bem.windcomponents_dv() 1st keyword (n) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(r, 0) == n,"shape(r, 0) == n","1st keyword n","windcomponents_dv:n=%d",n) {
+    /* Processing variable precurve */
+    precurve_Dims[0]=n;
+    capi_precurve_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 3rd argument `precurve`";
+    capi_precurve_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurve_Dims,precurve_Rank,  capi_precurve_intent,precurve_capi,capi_errmess);
+    if (capi_precurve_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurve = (double *)(PyArray_DATA(capi_precurve_as_array));
+
+    /* Processing variable presweep */
+    presweep_Dims[0]=n;
+    capi_presweep_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 5th argument `presweep`";
+    capi_presweep_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweep_Dims,presweep_Rank,  capi_presweep_intent,presweep_capi,capi_errmess);
+    if (capi_presweep_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweep = (double *)(PyArray_DATA(capi_presweep_as_array));
+
+    /* Processing variable rd */
+    rd_Dims[1]=n;
+    capi_rd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 2nd argument `rd`";
+    capi_rd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,rd_Dims,rd_Rank,  capi_rd_intent,rd_capi,capi_errmess);
+    if (capi_rd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        rd = (double *)(PyArray_DATA(capi_rd_as_array));
+
+    /* Processing variable nbdirs */
+    if (nbdirs_capi == Py_None) nbdirs = shape(rd, 0); else
+        f2py_success = int_from_pyobj(&nbdirs,nbdirs_capi,"_bem.windcomponents_dv() 2nd keyword (nbdirs) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(rd, 0) == nbdirs,"shape(rd, 0) == nbdirs","2nd keyword nbdirs","windcomponents_dv:nbdirs=%d",nbdirs) {
+    /* Processing variable vx */
+    vx_Dims[0]=n;
+    capi_vx_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the hidden `vx`";
+    capi_vx_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,vx_Dims,vx_Rank,  capi_vx_intent,Py_None,capi_errmess);
+    if (capi_vx_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        vx = (double *)(PyArray_DATA(capi_vx_as_array));
+
+    /* Processing variable vy */
+    vy_Dims[0]=n;
+    capi_vy_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the hidden `vy`";
+    capi_vy_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,vy_Dims,vy_Rank,  capi_vy_intent,Py_None,capi_errmess);
+    if (capi_vy_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        vy = (double *)(PyArray_DATA(capi_vy_as_array));
+
+    /* Processing variable vxd */
+    vxd_Dims[0]=nbdirs,vxd_Dims[1]=n;
+    capi_vxd_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the hidden `vxd`";
+    capi_vxd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,vxd_Dims,vxd_Rank,  capi_vxd_intent,Py_None,capi_errmess);
+    if (capi_vxd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        vxd = (double *)(PyArray_DATA(capi_vxd_as_array));
+
+    /* Processing variable vyd */
+    vyd_Dims[0]=nbdirs,vyd_Dims[1]=n;
+    capi_vyd_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the hidden `vyd`";
+    capi_vyd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,vyd_Dims,vyd_Rank,  capi_vyd_intent,Py_None,capi_errmess);
+    if (capi_vyd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        vyd = (double *)(PyArray_DATA(capi_vyd_as_array));
+
+    /* Processing variable precurved */
+    precurved_Dims[0]=nbdirs,precurved_Dims[1]=n;
+    capi_precurved_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 4th argument `precurved`";
+    capi_precurved_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurved_Dims,precurved_Rank,  capi_precurved_intent,precurved_capi,capi_errmess);
+    if (capi_precurved_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurved = (double *)(PyArray_DATA(capi_precurved_as_array));
+
+    /* Processing variable presweepd */
+    presweepd_Dims[0]=nbdirs,presweepd_Dims[1]=n;
+    capi_presweepd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 6th argument `presweepd`";
+    capi_presweepd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweepd_Dims,presweepd_Rank,  capi_presweepd_intent,presweepd_capi,capi_errmess);
+    if (capi_presweepd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweepd = (double *)(PyArray_DATA(capi_presweepd_as_array));
+
+    /* Processing variable preconed */
+    preconed_Dims[0]=nbdirs;
+    capi_preconed_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 8th argument `preconed`";
+    capi_preconed_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,preconed_Dims,preconed_Rank,  capi_preconed_intent,preconed_capi,capi_errmess);
+    if (capi_preconed_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        preconed = (double *)(PyArray_DATA(capi_preconed_as_array));
+
+    /* Processing variable yawd */
+    yawd_Dims[0]=nbdirs;
+    capi_yawd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 10th argument `yawd`";
+    capi_yawd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,yawd_Dims,yawd_Rank,  capi_yawd_intent,yawd_capi,capi_errmess);
+    if (capi_yawd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        yawd = (double *)(PyArray_DATA(capi_yawd_as_array));
+
+    /* Processing variable tiltd */
+    tiltd_Dims[0]=nbdirs;
+    capi_tiltd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 12nd argument `tiltd`";
+    capi_tiltd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,tiltd_Dims,tiltd_Rank,  capi_tiltd_intent,tiltd_capi,capi_errmess);
+    if (capi_tiltd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        tiltd = (double *)(PyArray_DATA(capi_tiltd_as_array));
+
+    /* Processing variable azimuthd */
+    azimuthd_Dims[0]=nbdirs;
+    capi_azimuthd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 14th argument `azimuthd`";
+    capi_azimuthd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,azimuthd_Dims,azimuthd_Rank,  capi_azimuthd_intent,azimuthd_capi,capi_errmess);
+    if (capi_azimuthd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        azimuthd = (double *)(PyArray_DATA(capi_azimuthd_as_array));
+
+    /* Processing variable uinfd */
+    uinfd_Dims[0]=nbdirs;
+    capi_uinfd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 16th argument `uinfd`";
+    capi_uinfd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,uinfd_Dims,uinfd_Rank,  capi_uinfd_intent,uinfd_capi,capi_errmess);
+    if (capi_uinfd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        uinfd = (double *)(PyArray_DATA(capi_uinfd_as_array));
+
+    /* Processing variable omegarpmd */
+    omegarpmd_Dims[0]=nbdirs;
+    capi_omegarpmd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 18th argument `omegarpmd`";
+    capi_omegarpmd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,omegarpmd_Dims,omegarpmd_Rank,  capi_omegarpmd_intent,omegarpmd_capi,capi_errmess);
+    if (capi_omegarpmd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        omegarpmd = (double *)(PyArray_DATA(capi_omegarpmd_as_array));
+
+    /* Processing variable hubhtd */
+    hubhtd_Dims[0]=nbdirs;
+    capi_hubhtd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.windcomponents_dv: failed to create array from the 20th argument `hubhtd`";
+    capi_hubhtd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,hubhtd_Dims,hubhtd_Rank,  capi_hubhtd_intent,hubhtd_capi,capi_errmess);
+    if (capi_hubhtd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        hubhtd = (double *)(PyArray_DATA(capi_hubhtd_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&n,r,rd,precurve,precurved,presweep,presweepd,&precone,preconed,&yaw,yawd,&tilt,tiltd,&azimuth,azimuthd,&uinf,uinfd,&omegarpm,omegarpmd,&hubht,hubhtd,&shearexp,vx,vxd,vy,vyd,&nbdirs);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("NNNN",capi_vx_as_array,capi_vxd_as_array,capi_vy_as_array,capi_vyd_as_array);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_hubhtd_as_array!=hubhtd_capi) {
+        Py_XDECREF(capi_hubhtd_as_array); }
+    }  /* if (capi_hubhtd_as_array == NULL) ... else of hubhtd */
+    /* End of cleaning variable hubhtd */
+    if((PyObject *)capi_omegarpmd_as_array!=omegarpmd_capi) {
+        Py_XDECREF(capi_omegarpmd_as_array); }
+    }  /* if (capi_omegarpmd_as_array == NULL) ... else of omegarpmd */
+    /* End of cleaning variable omegarpmd */
+    if((PyObject *)capi_uinfd_as_array!=uinfd_capi) {
+        Py_XDECREF(capi_uinfd_as_array); }
+    }  /* if (capi_uinfd_as_array == NULL) ... else of uinfd */
+    /* End of cleaning variable uinfd */
+    if((PyObject *)capi_azimuthd_as_array!=azimuthd_capi) {
+        Py_XDECREF(capi_azimuthd_as_array); }
+    }  /* if (capi_azimuthd_as_array == NULL) ... else of azimuthd */
+    /* End of cleaning variable azimuthd */
+    if((PyObject *)capi_tiltd_as_array!=tiltd_capi) {
+        Py_XDECREF(capi_tiltd_as_array); }
+    }  /* if (capi_tiltd_as_array == NULL) ... else of tiltd */
+    /* End of cleaning variable tiltd */
+    if((PyObject *)capi_yawd_as_array!=yawd_capi) {
+        Py_XDECREF(capi_yawd_as_array); }
+    }  /* if (capi_yawd_as_array == NULL) ... else of yawd */
+    /* End of cleaning variable yawd */
+    if((PyObject *)capi_preconed_as_array!=preconed_capi) {
+        Py_XDECREF(capi_preconed_as_array); }
+    }  /* if (capi_preconed_as_array == NULL) ... else of preconed */
+    /* End of cleaning variable preconed */
+    if((PyObject *)capi_presweepd_as_array!=presweepd_capi) {
+        Py_XDECREF(capi_presweepd_as_array); }
+    }  /* if (capi_presweepd_as_array == NULL) ... else of presweepd */
+    /* End of cleaning variable presweepd */
+    if((PyObject *)capi_precurved_as_array!=precurved_capi) {
+        Py_XDECREF(capi_precurved_as_array); }
+    }  /* if (capi_precurved_as_array == NULL) ... else of precurved */
+    /* End of cleaning variable precurved */
+    }  /* if (capi_vyd_as_array == NULL) ... else of vyd */
+    /* End of cleaning variable vyd */
+    }  /* if (capi_vxd_as_array == NULL) ... else of vxd */
+    /* End of cleaning variable vxd */
+    }  /* if (capi_vy_as_array == NULL) ... else of vy */
+    /* End of cleaning variable vy */
+    }  /* if (capi_vx_as_array == NULL) ... else of vx */
+    /* End of cleaning variable vx */
+    } /*CHECKSCALAR(shape(rd, 0) == nbdirs)*/
+    } /*if (f2py_success) of nbdirs*/
+    /* End of cleaning variable nbdirs */
+    if((PyObject *)capi_rd_as_array!=rd_capi) {
+        Py_XDECREF(capi_rd_as_array); }
+    }  /* if (capi_rd_as_array == NULL) ... else of rd */
+    /* End of cleaning variable rd */
+    if((PyObject *)capi_presweep_as_array!=presweep_capi) {
+        Py_XDECREF(capi_presweep_as_array); }
+    }  /* if (capi_presweep_as_array == NULL) ... else of presweep */
+    /* End of cleaning variable presweep */
+    if((PyObject *)capi_precurve_as_array!=precurve_capi) {
+        Py_XDECREF(capi_precurve_as_array); }
+    }  /* if (capi_precurve_as_array == NULL) ... else of precurve */
+    /* End of cleaning variable precurve */
+    } /*CHECKSCALAR(shape(r, 0) == n)*/
+    } /*if (f2py_success) of n*/
+    /* End of cleaning variable n */
+    } /*if (f2py_success) of shearexp*/
+    /* End of cleaning variable shearexp */
+    } /*if (f2py_success) of hubht*/
+    /* End of cleaning variable hubht */
+    } /*if (f2py_success) of omegarpm*/
+    /* End of cleaning variable omegarpm */
+    } /*if (f2py_success) of uinf*/
+    /* End of cleaning variable uinf */
+    } /*if (f2py_success) of azimuth*/
+    /* End of cleaning variable azimuth */
+    } /*if (f2py_success) of tilt*/
+    /* End of cleaning variable tilt */
+    } /*if (f2py_success) of yaw*/
+    /* End of cleaning variable yaw */
+    } /*if (f2py_success) of precone*/
+    /* End of cleaning variable precone */
+    if((PyObject *)capi_r_as_array!=r_capi) {
+        Py_XDECREF(capi_r_as_array); }
+    }  /* if (capi_r_as_array == NULL) ... else of r */
+    /* End of cleaning variable r */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/************************** end of windcomponents_dv **************************/
+
+/***************************** definecurvature_dv *****************************/
+static char doc_f2py_rout__bem_definecurvature_dv[] = "\
+x_az,x_azd,y_az,y_azd,z_az,z_azd,cone,coned,s = definecurvature_dv(r,rd,precurve,precurved,presweep,presweepd,precone,preconed,[n,nbdirs])\n\nWrapper for ``definecurvature_dv``.\
+\n\nParameters\n----------\n"
+"r : input rank-1 array('d') with bounds (n)\n"
+"rd : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"precurve : input rank-1 array('d') with bounds (n)\n"
+"precurved : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"presweep : input rank-1 array('d') with bounds (n)\n"
+"presweepd : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"precone : input float\n"
+"preconed : input rank-1 array('d') with bounds (nbdirs)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: shape(r, 0)\n"
+"nbdirs : input int, optional\n    Default: shape(rd, 0)\n"
+"\nReturns\n-------\n"
+"x_az : rank-1 array('d') with bounds (n)\n"
+"x_azd : rank-2 array('d') with bounds (nbdirs,n)\n"
+"y_az : rank-1 array('d') with bounds (n)\n"
+"y_azd : rank-2 array('d') with bounds (nbdirs,n)\n"
+"z_az : rank-1 array('d') with bounds (n)\n"
+"z_azd : rank-2 array('d') with bounds (nbdirs,n)\n"
+"cone : rank-1 array('d') with bounds (n)\n"
+"coned : rank-2 array('d') with bounds (nbdirs,n)\n"
+"s : rank-1 array('d') with bounds (n)";
+/* extern void F_FUNC_US(definecurvature_dv,DEFINECURVATURE_DV)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*); */
+static PyObject *f2py_rout__bem_definecurvature_dv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int n = 0;
+    PyObject *n_capi = Py_None;
+    double *r = NULL;
+    npy_intp r_Dims[1] = {-1};
+    const int r_Rank = 1;
+    PyArrayObject *capi_r_as_array = NULL;
+    int capi_r_intent = 0;
+    PyObject *r_capi = Py_None;
+    double *rd = NULL;
+    npy_intp rd_Dims[2] = {-1, -1};
+    const int rd_Rank = 2;
+    PyArrayObject *capi_rd_as_array = NULL;
+    int capi_rd_intent = 0;
+    PyObject *rd_capi = Py_None;
+    double *precurve = NULL;
+    npy_intp precurve_Dims[1] = {-1};
+    const int precurve_Rank = 1;
+    PyArrayObject *capi_precurve_as_array = NULL;
+    int capi_precurve_intent = 0;
+    PyObject *precurve_capi = Py_None;
+    double *precurved = NULL;
+    npy_intp precurved_Dims[2] = {-1, -1};
+    const int precurved_Rank = 2;
+    PyArrayObject *capi_precurved_as_array = NULL;
+    int capi_precurved_intent = 0;
+    PyObject *precurved_capi = Py_None;
+    double *presweep = NULL;
+    npy_intp presweep_Dims[1] = {-1};
+    const int presweep_Rank = 1;
+    PyArrayObject *capi_presweep_as_array = NULL;
+    int capi_presweep_intent = 0;
+    PyObject *presweep_capi = Py_None;
+    double *presweepd = NULL;
+    npy_intp presweepd_Dims[2] = {-1, -1};
+    const int presweepd_Rank = 2;
+    PyArrayObject *capi_presweepd_as_array = NULL;
+    int capi_presweepd_intent = 0;
+    PyObject *presweepd_capi = Py_None;
+    double precone = 0;
+    PyObject *precone_capi = Py_None;
+    double *preconed = NULL;
+    npy_intp preconed_Dims[1] = {-1};
+    const int preconed_Rank = 1;
+    PyArrayObject *capi_preconed_as_array = NULL;
+    int capi_preconed_intent = 0;
+    PyObject *preconed_capi = Py_None;
+    double *x_az = NULL;
+    npy_intp x_az_Dims[1] = {-1};
+    const int x_az_Rank = 1;
+    PyArrayObject *capi_x_az_as_array = NULL;
+    int capi_x_az_intent = 0;
+    double *x_azd = NULL;
+    npy_intp x_azd_Dims[2] = {-1, -1};
+    const int x_azd_Rank = 2;
+    PyArrayObject *capi_x_azd_as_array = NULL;
+    int capi_x_azd_intent = 0;
+    double *y_az = NULL;
+    npy_intp y_az_Dims[1] = {-1};
+    const int y_az_Rank = 1;
+    PyArrayObject *capi_y_az_as_array = NULL;
+    int capi_y_az_intent = 0;
+    double *y_azd = NULL;
+    npy_intp y_azd_Dims[2] = {-1, -1};
+    const int y_azd_Rank = 2;
+    PyArrayObject *capi_y_azd_as_array = NULL;
+    int capi_y_azd_intent = 0;
+    double *z_az = NULL;
+    npy_intp z_az_Dims[1] = {-1};
+    const int z_az_Rank = 1;
+    PyArrayObject *capi_z_az_as_array = NULL;
+    int capi_z_az_intent = 0;
+    double *z_azd = NULL;
+    npy_intp z_azd_Dims[2] = {-1, -1};
+    const int z_azd_Rank = 2;
+    PyArrayObject *capi_z_azd_as_array = NULL;
+    int capi_z_azd_intent = 0;
+    double *cone = NULL;
+    npy_intp cone_Dims[1] = {-1};
+    const int cone_Rank = 1;
+    PyArrayObject *capi_cone_as_array = NULL;
+    int capi_cone_intent = 0;
+    double *coned = NULL;
+    npy_intp coned_Dims[2] = {-1, -1};
+    const int coned_Rank = 2;
+    PyArrayObject *capi_coned_as_array = NULL;
+    int capi_coned_intent = 0;
+    double *s = NULL;
+    npy_intp s_Dims[1] = {-1};
+    const int s_Rank = 1;
+    PyArrayObject *capi_s_as_array = NULL;
+    int capi_s_intent = 0;
+    int nbdirs = 0;
+    PyObject *nbdirs_capi = Py_None;
+    static char *capi_kwlist[] = {"r","rd","precurve","precurved","presweep","presweepd","precone","preconed","n","nbdirs",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOO|OO:_bem.definecurvature_dv",\
+        capi_kwlist,&r_capi,&rd_capi,&precurve_capi,&precurved_capi,&presweep_capi,&presweepd_capi,&precone_capi,&preconed_capi,&n_capi,&nbdirs_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable r */
+    ;
+    capi_r_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the 1st argument `r`";
+    capi_r_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,r_Dims,r_Rank,  capi_r_intent,r_capi,capi_errmess);
+    if (capi_r_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        r = (double *)(PyArray_DATA(capi_r_as_array));
+
+    /* Processing variable precone */
+        f2py_success = double_from_pyobj(&precone,precone_capi,"_bem.definecurvature_dv() 7th argument (precone) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable n */
+    if (n_capi == Py_None) n = shape(r, 0); else
+        f2py_success = int_from_pyobj(&n,n_capi,"_bem.definecurvature_dv() 1st keyword (n) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(r, 0) == n,"shape(r, 0) == n","1st keyword n","definecurvature_dv:n=%d",n) {
+    /* Processing variable precurve */
+    precurve_Dims[0]=n;
+    capi_precurve_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the 3rd argument `precurve`";
+    capi_precurve_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurve_Dims,precurve_Rank,  capi_precurve_intent,precurve_capi,capi_errmess);
+    if (capi_precurve_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurve = (double *)(PyArray_DATA(capi_precurve_as_array));
+
+    /* Processing variable presweep */
+    presweep_Dims[0]=n;
+    capi_presweep_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the 5th argument `presweep`";
+    capi_presweep_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweep_Dims,presweep_Rank,  capi_presweep_intent,presweep_capi,capi_errmess);
+    if (capi_presweep_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweep = (double *)(PyArray_DATA(capi_presweep_as_array));
+
+    /* Processing variable rd */
+    rd_Dims[1]=n;
+    capi_rd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the 2nd argument `rd`";
+    capi_rd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,rd_Dims,rd_Rank,  capi_rd_intent,rd_capi,capi_errmess);
+    if (capi_rd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        rd = (double *)(PyArray_DATA(capi_rd_as_array));
+
+    /* Processing variable nbdirs */
+    if (nbdirs_capi == Py_None) nbdirs = shape(rd, 0); else
+        f2py_success = int_from_pyobj(&nbdirs,nbdirs_capi,"_bem.definecurvature_dv() 2nd keyword (nbdirs) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(rd, 0) == nbdirs,"shape(rd, 0) == nbdirs","2nd keyword nbdirs","definecurvature_dv:nbdirs=%d",nbdirs) {
+    /* Processing variable x_az */
+    x_az_Dims[0]=n;
+    capi_x_az_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the hidden `x_az`";
+    capi_x_az_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,x_az_Dims,x_az_Rank,  capi_x_az_intent,Py_None,capi_errmess);
+    if (capi_x_az_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        x_az = (double *)(PyArray_DATA(capi_x_az_as_array));
+
+    /* Processing variable y_az */
+    y_az_Dims[0]=n;
+    capi_y_az_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the hidden `y_az`";
+    capi_y_az_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,y_az_Dims,y_az_Rank,  capi_y_az_intent,Py_None,capi_errmess);
+    if (capi_y_az_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        y_az = (double *)(PyArray_DATA(capi_y_az_as_array));
+
+    /* Processing variable z_az */
+    z_az_Dims[0]=n;
+    capi_z_az_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the hidden `z_az`";
+    capi_z_az_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,z_az_Dims,z_az_Rank,  capi_z_az_intent,Py_None,capi_errmess);
+    if (capi_z_az_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        z_az = (double *)(PyArray_DATA(capi_z_az_as_array));
+
+    /* Processing variable cone */
+    cone_Dims[0]=n;
+    capi_cone_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the hidden `cone`";
+    capi_cone_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,cone_Dims,cone_Rank,  capi_cone_intent,Py_None,capi_errmess);
+    if (capi_cone_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        cone = (double *)(PyArray_DATA(capi_cone_as_array));
+
+    /* Processing variable s */
+    s_Dims[0]=n;
+    capi_s_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the hidden `s`";
+    capi_s_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,s_Dims,s_Rank,  capi_s_intent,Py_None,capi_errmess);
+    if (capi_s_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        s = (double *)(PyArray_DATA(capi_s_as_array));
+
+    /* Processing variable x_azd */
+    x_azd_Dims[0]=nbdirs,x_azd_Dims[1]=n;
+    capi_x_azd_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the hidden `x_azd`";
+    capi_x_azd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,x_azd_Dims,x_azd_Rank,  capi_x_azd_intent,Py_None,capi_errmess);
+    if (capi_x_azd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        x_azd = (double *)(PyArray_DATA(capi_x_azd_as_array));
+
+    /* Processing variable y_azd */
+    y_azd_Dims[0]=nbdirs,y_azd_Dims[1]=n;
+    capi_y_azd_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the hidden `y_azd`";
+    capi_y_azd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,y_azd_Dims,y_azd_Rank,  capi_y_azd_intent,Py_None,capi_errmess);
+    if (capi_y_azd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        y_azd = (double *)(PyArray_DATA(capi_y_azd_as_array));
+
+    /* Processing variable z_azd */
+    z_azd_Dims[0]=nbdirs,z_azd_Dims[1]=n;
+    capi_z_azd_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the hidden `z_azd`";
+    capi_z_azd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,z_azd_Dims,z_azd_Rank,  capi_z_azd_intent,Py_None,capi_errmess);
+    if (capi_z_azd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        z_azd = (double *)(PyArray_DATA(capi_z_azd_as_array));
+
+    /* Processing variable coned */
+    coned_Dims[0]=nbdirs,coned_Dims[1]=n;
+    capi_coned_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the hidden `coned`";
+    capi_coned_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,coned_Dims,coned_Rank,  capi_coned_intent,Py_None,capi_errmess);
+    if (capi_coned_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        coned = (double *)(PyArray_DATA(capi_coned_as_array));
+
+    /* Processing variable precurved */
+    precurved_Dims[0]=nbdirs,precurved_Dims[1]=n;
+    capi_precurved_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the 4th argument `precurved`";
+    capi_precurved_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurved_Dims,precurved_Rank,  capi_precurved_intent,precurved_capi,capi_errmess);
+    if (capi_precurved_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurved = (double *)(PyArray_DATA(capi_precurved_as_array));
+
+    /* Processing variable presweepd */
+    presweepd_Dims[0]=nbdirs,presweepd_Dims[1]=n;
+    capi_presweepd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the 6th argument `presweepd`";
+    capi_presweepd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweepd_Dims,presweepd_Rank,  capi_presweepd_intent,presweepd_capi,capi_errmess);
+    if (capi_presweepd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweepd = (double *)(PyArray_DATA(capi_presweepd_as_array));
+
+    /* Processing variable preconed */
+    preconed_Dims[0]=nbdirs;
+    capi_preconed_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv: failed to create array from the 8th argument `preconed`";
+    capi_preconed_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,preconed_Dims,preconed_Rank,  capi_preconed_intent,preconed_capi,capi_errmess);
+    if (capi_preconed_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        preconed = (double *)(PyArray_DATA(capi_preconed_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&n,r,rd,precurve,precurved,presweep,presweepd,&precone,preconed,x_az,x_azd,y_az,y_azd,z_az,z_azd,cone,coned,s,&nbdirs);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("NNNNNNNNN",capi_x_az_as_array,capi_x_azd_as_array,capi_y_az_as_array,capi_y_azd_as_array,capi_z_az_as_array,capi_z_azd_as_array,capi_cone_as_array,capi_coned_as_array,capi_s_as_array);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_preconed_as_array!=preconed_capi) {
+        Py_XDECREF(capi_preconed_as_array); }
+    }  /* if (capi_preconed_as_array == NULL) ... else of preconed */
+    /* End of cleaning variable preconed */
+    if((PyObject *)capi_presweepd_as_array!=presweepd_capi) {
+        Py_XDECREF(capi_presweepd_as_array); }
+    }  /* if (capi_presweepd_as_array == NULL) ... else of presweepd */
+    /* End of cleaning variable presweepd */
+    if((PyObject *)capi_precurved_as_array!=precurved_capi) {
+        Py_XDECREF(capi_precurved_as_array); }
+    }  /* if (capi_precurved_as_array == NULL) ... else of precurved */
+    /* End of cleaning variable precurved */
+    }  /* if (capi_coned_as_array == NULL) ... else of coned */
+    /* End of cleaning variable coned */
+    }  /* if (capi_z_azd_as_array == NULL) ... else of z_azd */
+    /* End of cleaning variable z_azd */
+    }  /* if (capi_y_azd_as_array == NULL) ... else of y_azd */
+    /* End of cleaning variable y_azd */
+    }  /* if (capi_x_azd_as_array == NULL) ... else of x_azd */
+    /* End of cleaning variable x_azd */
+    }  /* if (capi_s_as_array == NULL) ... else of s */
+    /* End of cleaning variable s */
+    }  /* if (capi_cone_as_array == NULL) ... else of cone */
+    /* End of cleaning variable cone */
+    }  /* if (capi_z_az_as_array == NULL) ... else of z_az */
+    /* End of cleaning variable z_az */
+    }  /* if (capi_y_az_as_array == NULL) ... else of y_az */
+    /* End of cleaning variable y_az */
+    }  /* if (capi_x_az_as_array == NULL) ... else of x_az */
+    /* End of cleaning variable x_az */
+    } /*CHECKSCALAR(shape(rd, 0) == nbdirs)*/
+    } /*if (f2py_success) of nbdirs*/
+    /* End of cleaning variable nbdirs */
+    if((PyObject *)capi_rd_as_array!=rd_capi) {
+        Py_XDECREF(capi_rd_as_array); }
+    }  /* if (capi_rd_as_array == NULL) ... else of rd */
+    /* End of cleaning variable rd */
+    if((PyObject *)capi_presweep_as_array!=presweep_capi) {
+        Py_XDECREF(capi_presweep_as_array); }
+    }  /* if (capi_presweep_as_array == NULL) ... else of presweep */
+    /* End of cleaning variable presweep */
+    if((PyObject *)capi_precurve_as_array!=precurve_capi) {
+        Py_XDECREF(capi_precurve_as_array); }
+    }  /* if (capi_precurve_as_array == NULL) ... else of precurve */
+    /* End of cleaning variable precurve */
+    } /*CHECKSCALAR(shape(r, 0) == n)*/
+    } /*if (f2py_success) of n*/
+    /* End of cleaning variable n */
+    } /*if (f2py_success) of precone*/
+    /* End of cleaning variable precone */
+    if((PyObject *)capi_r_as_array!=r_capi) {
+        Py_XDECREF(capi_r_as_array); }
+    }  /* if (capi_r_as_array == NULL) ... else of r */
+    /* End of cleaning variable r */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/************************* end of definecurvature_dv *************************/
+
+/****************************** thrusttorque_bv ******************************/
+static char doc_f2py_rout__bem_thrusttorque_bv[] = "\
+npb,tpb,rb,precurveb,presweepb,preconeb,rhubb,rtipb,precurvetipb,presweeptipb = thrusttorque_bv(np,tp,r,precurve,presweep,precone,rhub,rtip,precurvetip,presweeptip,tb,qb,[n,nbdirs])\n\nWrapper for ``thrusttorque_bv``.\
+\n\nParameters\n----------\n"
+"np : input rank-1 array('d') with bounds (n)\n"
+"tp : input rank-1 array('d') with bounds (n)\n"
+"r : input rank-1 array('d') with bounds (n)\n"
+"precurve : input rank-1 array('d') with bounds (n)\n"
+"presweep : input rank-1 array('d') with bounds (n)\n"
+"precone : input float\n"
+"rhub : input float\n"
+"rtip : input float\n"
+"precurvetip : input float\n"
+"presweeptip : input float\n"
+"tb : input rank-1 array('d') with bounds (nbdirs)\n"
+"qb : input rank-1 array('d') with bounds (nbdirs)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: shape(np, 0)\n"
+"nbdirs : input int, optional\n    Default: shape(tb, 0)\n"
+"\nReturns\n-------\n"
+"npb : rank-2 array('d') with bounds (nbdirs,n)\n"
+"tpb : rank-2 array('d') with bounds (nbdirs,n)\n"
+"rb : rank-2 array('d') with bounds (nbdirs,n)\n"
+"precurveb : rank-2 array('d') with bounds (nbdirs,n)\n"
+"presweepb : rank-2 array('d') with bounds (nbdirs,n)\n"
+"preconeb : rank-1 array('d') with bounds (nbdirs)\n"
+"rhubb : rank-1 array('d') with bounds (nbdirs)\n"
+"rtipb : rank-1 array('d') with bounds (nbdirs)\n"
+"precurvetipb : rank-1 array('d') with bounds (nbdirs)\n"
+"presweeptipb : rank-1 array('d') with bounds (nbdirs)";
+/* extern void F_FUNC_US(thrusttorque_bv,THRUSTTORQUE_BV)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*); */
+static PyObject *f2py_rout__bem_thrusttorque_bv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int n = 0;
+    PyObject *n_capi = Py_None;
+    double *np = NULL;
+    npy_intp np_Dims[1] = {-1};
+    const int np_Rank = 1;
+    PyArrayObject *capi_np_as_array = NULL;
+    int capi_np_intent = 0;
+    PyObject *np_capi = Py_None;
+    double *tp = NULL;
+    npy_intp tp_Dims[1] = {-1};
+    const int tp_Rank = 1;
+    PyArrayObject *capi_tp_as_array = NULL;
+    int capi_tp_intent = 0;
+    PyObject *tp_capi = Py_None;
+    double *r = NULL;
+    npy_intp r_Dims[1] = {-1};
+    const int r_Rank = 1;
+    PyArrayObject *capi_r_as_array = NULL;
+    int capi_r_intent = 0;
+    PyObject *r_capi = Py_None;
+    double *precurve = NULL;
+    npy_intp precurve_Dims[1] = {-1};
+    const int precurve_Rank = 1;
+    PyArrayObject *capi_precurve_as_array = NULL;
+    int capi_precurve_intent = 0;
+    PyObject *precurve_capi = Py_None;
+    double *presweep = NULL;
+    npy_intp presweep_Dims[1] = {-1};
+    const int presweep_Rank = 1;
+    PyArrayObject *capi_presweep_as_array = NULL;
+    int capi_presweep_intent = 0;
+    PyObject *presweep_capi = Py_None;
+    double precone = 0;
+    PyObject *precone_capi = Py_None;
+    double rhub = 0;
+    PyObject *rhub_capi = Py_None;
+    double rtip = 0;
+    PyObject *rtip_capi = Py_None;
+    double precurvetip = 0;
+    PyObject *precurvetip_capi = Py_None;
+    double presweeptip = 0;
+    PyObject *presweeptip_capi = Py_None;
+    double *tb = NULL;
+    npy_intp tb_Dims[1] = {-1};
+    const int tb_Rank = 1;
+    PyArrayObject *capi_tb_as_array = NULL;
+    int capi_tb_intent = 0;
+    PyObject *tb_capi = Py_None;
+    double *qb = NULL;
+    npy_intp qb_Dims[1] = {-1};
+    const int qb_Rank = 1;
+    PyArrayObject *capi_qb_as_array = NULL;
+    int capi_qb_intent = 0;
+    PyObject *qb_capi = Py_None;
+    double *npb = NULL;
+    npy_intp npb_Dims[2] = {-1, -1};
+    const int npb_Rank = 2;
+    PyArrayObject *capi_npb_as_array = NULL;
+    int capi_npb_intent = 0;
+    double *tpb = NULL;
+    npy_intp tpb_Dims[2] = {-1, -1};
+    const int tpb_Rank = 2;
+    PyArrayObject *capi_tpb_as_array = NULL;
+    int capi_tpb_intent = 0;
+    double *rb = NULL;
+    npy_intp rb_Dims[2] = {-1, -1};
+    const int rb_Rank = 2;
+    PyArrayObject *capi_rb_as_array = NULL;
+    int capi_rb_intent = 0;
+    double *precurveb = NULL;
+    npy_intp precurveb_Dims[2] = {-1, -1};
+    const int precurveb_Rank = 2;
+    PyArrayObject *capi_precurveb_as_array = NULL;
+    int capi_precurveb_intent = 0;
+    double *presweepb = NULL;
+    npy_intp presweepb_Dims[2] = {-1, -1};
+    const int presweepb_Rank = 2;
+    PyArrayObject *capi_presweepb_as_array = NULL;
+    int capi_presweepb_intent = 0;
+    double *preconeb = NULL;
+    npy_intp preconeb_Dims[1] = {-1};
+    const int preconeb_Rank = 1;
+    PyArrayObject *capi_preconeb_as_array = NULL;
+    int capi_preconeb_intent = 0;
+    double *rhubb = NULL;
+    npy_intp rhubb_Dims[1] = {-1};
+    const int rhubb_Rank = 1;
+    PyArrayObject *capi_rhubb_as_array = NULL;
+    int capi_rhubb_intent = 0;
+    double *rtipb = NULL;
+    npy_intp rtipb_Dims[1] = {-1};
+    const int rtipb_Rank = 1;
+    PyArrayObject *capi_rtipb_as_array = NULL;
+    int capi_rtipb_intent = 0;
+    double *precurvetipb = NULL;
+    npy_intp precurvetipb_Dims[1] = {-1};
+    const int precurvetipb_Rank = 1;
+    PyArrayObject *capi_precurvetipb_as_array = NULL;
+    int capi_precurvetipb_intent = 0;
+    double *presweeptipb = NULL;
+    npy_intp presweeptipb_Dims[1] = {-1};
+    const int presweeptipb_Rank = 1;
+    PyArrayObject *capi_presweeptipb_as_array = NULL;
+    int capi_presweeptipb_intent = 0;
+    int nbdirs = 0;
+    PyObject *nbdirs_capi = Py_None;
+    static char *capi_kwlist[] = {"np","tp","r","precurve","presweep","precone","rhub","rtip","precurvetip","presweeptip","tb","qb","n","nbdirs",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOOOOOO|OO:_bem.thrusttorque_bv",\
+        capi_kwlist,&np_capi,&tp_capi,&r_capi,&precurve_capi,&presweep_capi,&precone_capi,&rhub_capi,&rtip_capi,&precurvetip_capi,&presweeptip_capi,&tb_capi,&qb_capi,&n_capi,&nbdirs_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable np */
+    ;
+    capi_np_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the 1st argument `np`";
+    capi_np_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,np_Dims,np_Rank,  capi_np_intent,np_capi,capi_errmess);
+    if (capi_np_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        np = (double *)(PyArray_DATA(capi_np_as_array));
+
+    /* Processing variable precone */
+        f2py_success = double_from_pyobj(&precone,precone_capi,"_bem.thrusttorque_bv() 6th argument (precone) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable rhub */
+        f2py_success = double_from_pyobj(&rhub,rhub_capi,"_bem.thrusttorque_bv() 7th argument (rhub) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable rtip */
+        f2py_success = double_from_pyobj(&rtip,rtip_capi,"_bem.thrusttorque_bv() 8th argument (rtip) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable precurvetip */
+        f2py_success = double_from_pyobj(&precurvetip,precurvetip_capi,"_bem.thrusttorque_bv() 9th argument (precurvetip) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable presweeptip */
+        f2py_success = double_from_pyobj(&presweeptip,presweeptip_capi,"_bem.thrusttorque_bv() 10th argument (presweeptip) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable tb */
+    ;
+    capi_tb_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the 11st argument `tb`";
+    capi_tb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,tb_Dims,tb_Rank,  capi_tb_intent,tb_capi,capi_errmess);
+    if (capi_tb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        tb = (double *)(PyArray_DATA(capi_tb_as_array));
+
+    /* Processing variable n */
+    if (n_capi == Py_None) n = shape(np, 0); else
+        f2py_success = int_from_pyobj(&n,n_capi,"_bem.thrusttorque_bv() 1st keyword (n) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(np, 0) == n,"shape(np, 0) == n","1st keyword n","thrusttorque_bv:n=%d",n) {
+    /* Processing variable tp */
+    tp_Dims[0]=n;
+    capi_tp_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the 2nd argument `tp`";
+    capi_tp_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,tp_Dims,tp_Rank,  capi_tp_intent,tp_capi,capi_errmess);
+    if (capi_tp_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        tp = (double *)(PyArray_DATA(capi_tp_as_array));
+
+    /* Processing variable r */
+    r_Dims[0]=n;
+    capi_r_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the 3rd argument `r`";
+    capi_r_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,r_Dims,r_Rank,  capi_r_intent,r_capi,capi_errmess);
+    if (capi_r_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        r = (double *)(PyArray_DATA(capi_r_as_array));
+
+    /* Processing variable precurve */
+    precurve_Dims[0]=n;
+    capi_precurve_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the 4th argument `precurve`";
+    capi_precurve_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurve_Dims,precurve_Rank,  capi_precurve_intent,precurve_capi,capi_errmess);
+    if (capi_precurve_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurve = (double *)(PyArray_DATA(capi_precurve_as_array));
+
+    /* Processing variable presweep */
+    presweep_Dims[0]=n;
+    capi_presweep_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the 5th argument `presweep`";
+    capi_presweep_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweep_Dims,presweep_Rank,  capi_presweep_intent,presweep_capi,capi_errmess);
+    if (capi_presweep_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweep = (double *)(PyArray_DATA(capi_presweep_as_array));
+
+    /* Processing variable nbdirs */
+    if (nbdirs_capi == Py_None) nbdirs = shape(tb, 0); else
+        f2py_success = int_from_pyobj(&nbdirs,nbdirs_capi,"_bem.thrusttorque_bv() 2nd keyword (nbdirs) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(tb, 0) == nbdirs,"shape(tb, 0) == nbdirs","2nd keyword nbdirs","thrusttorque_bv:nbdirs=%d",nbdirs) {
+    /* Processing variable npb */
+    npb_Dims[0]=nbdirs,npb_Dims[1]=n;
+    capi_npb_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the hidden `npb`";
+    capi_npb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,npb_Dims,npb_Rank,  capi_npb_intent,Py_None,capi_errmess);
+    if (capi_npb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        npb = (double *)(PyArray_DATA(capi_npb_as_array));
+
+    /* Processing variable tpb */
+    tpb_Dims[0]=nbdirs,tpb_Dims[1]=n;
+    capi_tpb_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the hidden `tpb`";
+    capi_tpb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,tpb_Dims,tpb_Rank,  capi_tpb_intent,Py_None,capi_errmess);
+    if (capi_tpb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        tpb = (double *)(PyArray_DATA(capi_tpb_as_array));
+
+    /* Processing variable rb */
+    rb_Dims[0]=nbdirs,rb_Dims[1]=n;
+    capi_rb_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the hidden `rb`";
+    capi_rb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,rb_Dims,rb_Rank,  capi_rb_intent,Py_None,capi_errmess);
+    if (capi_rb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        rb = (double *)(PyArray_DATA(capi_rb_as_array));
+
+    /* Processing variable precurveb */
+    precurveb_Dims[0]=nbdirs,precurveb_Dims[1]=n;
+    capi_precurveb_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the hidden `precurveb`";
+    capi_precurveb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurveb_Dims,precurveb_Rank,  capi_precurveb_intent,Py_None,capi_errmess);
+    if (capi_precurveb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurveb = (double *)(PyArray_DATA(capi_precurveb_as_array));
+
+    /* Processing variable presweepb */
+    presweepb_Dims[0]=nbdirs,presweepb_Dims[1]=n;
+    capi_presweepb_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the hidden `presweepb`";
+    capi_presweepb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweepb_Dims,presweepb_Rank,  capi_presweepb_intent,Py_None,capi_errmess);
+    if (capi_presweepb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweepb = (double *)(PyArray_DATA(capi_presweepb_as_array));
+
+    /* Processing variable preconeb */
+    preconeb_Dims[0]=nbdirs;
+    capi_preconeb_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the hidden `preconeb`";
+    capi_preconeb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,preconeb_Dims,preconeb_Rank,  capi_preconeb_intent,Py_None,capi_errmess);
+    if (capi_preconeb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        preconeb = (double *)(PyArray_DATA(capi_preconeb_as_array));
+
+    /* Processing variable rhubb */
+    rhubb_Dims[0]=nbdirs;
+    capi_rhubb_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the hidden `rhubb`";
+    capi_rhubb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,rhubb_Dims,rhubb_Rank,  capi_rhubb_intent,Py_None,capi_errmess);
+    if (capi_rhubb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        rhubb = (double *)(PyArray_DATA(capi_rhubb_as_array));
+
+    /* Processing variable rtipb */
+    rtipb_Dims[0]=nbdirs;
+    capi_rtipb_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the hidden `rtipb`";
+    capi_rtipb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,rtipb_Dims,rtipb_Rank,  capi_rtipb_intent,Py_None,capi_errmess);
+    if (capi_rtipb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        rtipb = (double *)(PyArray_DATA(capi_rtipb_as_array));
+
+    /* Processing variable precurvetipb */
+    precurvetipb_Dims[0]=nbdirs;
+    capi_precurvetipb_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the hidden `precurvetipb`";
+    capi_precurvetipb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurvetipb_Dims,precurvetipb_Rank,  capi_precurvetipb_intent,Py_None,capi_errmess);
+    if (capi_precurvetipb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurvetipb = (double *)(PyArray_DATA(capi_precurvetipb_as_array));
+
+    /* Processing variable presweeptipb */
+    presweeptipb_Dims[0]=nbdirs;
+    capi_presweeptipb_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the hidden `presweeptipb`";
+    capi_presweeptipb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweeptipb_Dims,presweeptipb_Rank,  capi_presweeptipb_intent,Py_None,capi_errmess);
+    if (capi_presweeptipb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweeptipb = (double *)(PyArray_DATA(capi_presweeptipb_as_array));
+
+    /* Processing variable qb */
+    qb_Dims[0]=nbdirs;
+    capi_qb_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.thrusttorque_bv: failed to create array from the 12nd argument `qb`";
+    capi_qb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,qb_Dims,qb_Rank,  capi_qb_intent,qb_capi,capi_errmess);
+    if (capi_qb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        qb = (double *)(PyArray_DATA(capi_qb_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&n,np,tp,r,precurve,presweep,&precone,&rhub,&rtip,&precurvetip,&presweeptip,tb,qb,npb,tpb,rb,precurveb,presweepb,preconeb,rhubb,rtipb,precurvetipb,presweeptipb,&nbdirs);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("NNNNNNNNNN",capi_npb_as_array,capi_tpb_as_array,capi_rb_as_array,capi_precurveb_as_array,capi_presweepb_as_array,capi_preconeb_as_array,capi_rhubb_as_array,capi_rtipb_as_array,capi_precurvetipb_as_array,capi_presweeptipb_as_array);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_qb_as_array!=qb_capi) {
+        Py_XDECREF(capi_qb_as_array); }
+    }  /* if (capi_qb_as_array == NULL) ... else of qb */
+    /* End of cleaning variable qb */
+    }  /* if (capi_presweeptipb_as_array == NULL) ... else of presweeptipb */
+    /* End of cleaning variable presweeptipb */
+    }  /* if (capi_precurvetipb_as_array == NULL) ... else of precurvetipb */
+    /* End of cleaning variable precurvetipb */
+    }  /* if (capi_rtipb_as_array == NULL) ... else of rtipb */
+    /* End of cleaning variable rtipb */
+    }  /* if (capi_rhubb_as_array == NULL) ... else of rhubb */
+    /* End of cleaning variable rhubb */
+    }  /* if (capi_preconeb_as_array == NULL) ... else of preconeb */
+    /* End of cleaning variable preconeb */
+    }  /* if (capi_presweepb_as_array == NULL) ... else of presweepb */
+    /* End of cleaning variable presweepb */
+    }  /* if (capi_precurveb_as_array == NULL) ... else of precurveb */
+    /* End of cleaning variable precurveb */
+    }  /* if (capi_rb_as_array == NULL) ... else of rb */
+    /* End of cleaning variable rb */
+    }  /* if (capi_tpb_as_array == NULL) ... else of tpb */
+    /* End of cleaning variable tpb */
+    }  /* if (capi_npb_as_array == NULL) ... else of npb */
+    /* End of cleaning variable npb */
+    } /*CHECKSCALAR(shape(tb, 0) == nbdirs)*/
+    } /*if (f2py_success) of nbdirs*/
+    /* End of cleaning variable nbdirs */
+    if((PyObject *)capi_presweep_as_array!=presweep_capi) {
+        Py_XDECREF(capi_presweep_as_array); }
+    }  /* if (capi_presweep_as_array == NULL) ... else of presweep */
+    /* End of cleaning variable presweep */
+    if((PyObject *)capi_precurve_as_array!=precurve_capi) {
+        Py_XDECREF(capi_precurve_as_array); }
+    }  /* if (capi_precurve_as_array == NULL) ... else of precurve */
+    /* End of cleaning variable precurve */
+    if((PyObject *)capi_r_as_array!=r_capi) {
+        Py_XDECREF(capi_r_as_array); }
+    }  /* if (capi_r_as_array == NULL) ... else of r */
+    /* End of cleaning variable r */
+    if((PyObject *)capi_tp_as_array!=tp_capi) {
+        Py_XDECREF(capi_tp_as_array); }
+    }  /* if (capi_tp_as_array == NULL) ... else of tp */
+    /* End of cleaning variable tp */
+    } /*CHECKSCALAR(shape(np, 0) == n)*/
+    } /*if (f2py_success) of n*/
+    /* End of cleaning variable n */
+    if((PyObject *)capi_tb_as_array!=tb_capi) {
+        Py_XDECREF(capi_tb_as_array); }
+    }  /* if (capi_tb_as_array == NULL) ... else of tb */
+    /* End of cleaning variable tb */
+    } /*if (f2py_success) of presweeptip*/
+    /* End of cleaning variable presweeptip */
+    } /*if (f2py_success) of precurvetip*/
+    /* End of cleaning variable precurvetip */
+    } /*if (f2py_success) of rtip*/
+    /* End of cleaning variable rtip */
+    } /*if (f2py_success) of rhub*/
+    /* End of cleaning variable rhub */
+    } /*if (f2py_success) of precone*/
+    /* End of cleaning variable precone */
+    if((PyObject *)capi_np_as_array!=np_capi) {
+        Py_XDECREF(capi_np_as_array); }
+    }  /* if (capi_np_as_array == NULL) ... else of np */
+    /* End of cleaning variable np */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/*************************** end of thrusttorque_bv ***************************/
+
+/***************************** definecurvature_bv *****************************/
+static char doc_f2py_rout__bem_definecurvature_bv[] = "\
+definecurvature_bv(r,rb,precurve,precurveb,presweep,presweepb,precone,preconeb,x_az,x_azb,y_az,z_az,z_azb,cone,coneb,s,sb,[n,nbdirs])\n\nWrapper for ``definecurvature_bv``.\
+\n\nParameters\n----------\n"
+"r : input rank-1 array('d') with bounds (n)\n"
+"rb : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"precurve : input rank-1 array('d') with bounds (n)\n"
+"precurveb : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"presweep : input rank-1 array('d') with bounds (n)\n"
+"presweepb : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"precone : input float\n"
+"preconeb : input rank-1 array('d') with bounds (nbdirs)\n"
+"x_az : input rank-1 array('d') with bounds (n)\n"
+"x_azb : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"y_az : input rank-1 array('d') with bounds (n)\n"
+"z_az : input rank-1 array('d') with bounds (n)\n"
+"z_azb : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"cone : input rank-1 array('d') with bounds (n)\n"
+"coneb : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"s : input rank-1 array('d') with bounds (n)\n"
+"sb : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: shape(r, 0)\n"
+"nbdirs : input int, optional\n    Default: shape(rb, 0)";
+/* extern void F_FUNC_US(definecurvature_bv,DEFINECURVATURE_BV)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*); */
+static PyObject *f2py_rout__bem_definecurvature_bv(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int n = 0;
+    PyObject *n_capi = Py_None;
+    double *r = NULL;
+    npy_intp r_Dims[1] = {-1};
+    const int r_Rank = 1;
+    PyArrayObject *capi_r_as_array = NULL;
+    int capi_r_intent = 0;
+    PyObject *r_capi = Py_None;
+    double *rb = NULL;
+    npy_intp rb_Dims[2] = {-1, -1};
+    const int rb_Rank = 2;
+    PyArrayObject *capi_rb_as_array = NULL;
+    int capi_rb_intent = 0;
+    PyObject *rb_capi = Py_None;
+    double *precurve = NULL;
+    npy_intp precurve_Dims[1] = {-1};
+    const int precurve_Rank = 1;
+    PyArrayObject *capi_precurve_as_array = NULL;
+    int capi_precurve_intent = 0;
+    PyObject *precurve_capi = Py_None;
+    double *precurveb = NULL;
+    npy_intp precurveb_Dims[2] = {-1, -1};
+    const int precurveb_Rank = 2;
+    PyArrayObject *capi_precurveb_as_array = NULL;
+    int capi_precurveb_intent = 0;
+    PyObject *precurveb_capi = Py_None;
+    double *presweep = NULL;
+    npy_intp presweep_Dims[1] = {-1};
+    const int presweep_Rank = 1;
+    PyArrayObject *capi_presweep_as_array = NULL;
+    int capi_presweep_intent = 0;
+    PyObject *presweep_capi = Py_None;
+    double *presweepb = NULL;
+    npy_intp presweepb_Dims[2] = {-1, -1};
+    const int presweepb_Rank = 2;
+    PyArrayObject *capi_presweepb_as_array = NULL;
+    int capi_presweepb_intent = 0;
+    PyObject *presweepb_capi = Py_None;
+    double precone = 0;
+    PyObject *precone_capi = Py_None;
+    double *preconeb = NULL;
+    npy_intp preconeb_Dims[1] = {-1};
+    const int preconeb_Rank = 1;
+    PyArrayObject *capi_preconeb_as_array = NULL;
+    int capi_preconeb_intent = 0;
+    PyObject *preconeb_capi = Py_None;
+    double *x_az = NULL;
+    npy_intp x_az_Dims[1] = {-1};
+    const int x_az_Rank = 1;
+    PyArrayObject *capi_x_az_as_array = NULL;
+    int capi_x_az_intent = 0;
+    PyObject *x_az_capi = Py_None;
+    double *x_azb = NULL;
+    npy_intp x_azb_Dims[2] = {-1, -1};
+    const int x_azb_Rank = 2;
+    PyArrayObject *capi_x_azb_as_array = NULL;
+    int capi_x_azb_intent = 0;
+    PyObject *x_azb_capi = Py_None;
+    double *y_az = NULL;
+    npy_intp y_az_Dims[1] = {-1};
+    const int y_az_Rank = 1;
+    PyArrayObject *capi_y_az_as_array = NULL;
+    int capi_y_az_intent = 0;
+    PyObject *y_az_capi = Py_None;
+    double *z_az = NULL;
+    npy_intp z_az_Dims[1] = {-1};
+    const int z_az_Rank = 1;
+    PyArrayObject *capi_z_az_as_array = NULL;
+    int capi_z_az_intent = 0;
+    PyObject *z_az_capi = Py_None;
+    double *z_azb = NULL;
+    npy_intp z_azb_Dims[2] = {-1, -1};
+    const int z_azb_Rank = 2;
+    PyArrayObject *capi_z_azb_as_array = NULL;
+    int capi_z_azb_intent = 0;
+    PyObject *z_azb_capi = Py_None;
+    double *cone = NULL;
+    npy_intp cone_Dims[1] = {-1};
+    const int cone_Rank = 1;
+    PyArrayObject *capi_cone_as_array = NULL;
+    int capi_cone_intent = 0;
+    PyObject *cone_capi = Py_None;
+    double *coneb = NULL;
+    npy_intp coneb_Dims[2] = {-1, -1};
+    const int coneb_Rank = 2;
+    PyArrayObject *capi_coneb_as_array = NULL;
+    int capi_coneb_intent = 0;
+    PyObject *coneb_capi = Py_None;
+    double *s = NULL;
+    npy_intp s_Dims[1] = {-1};
+    const int s_Rank = 1;
+    PyArrayObject *capi_s_as_array = NULL;
+    int capi_s_intent = 0;
+    PyObject *s_capi = Py_None;
+    double *sb = NULL;
+    npy_intp sb_Dims[2] = {-1, -1};
+    const int sb_Rank = 2;
+    PyArrayObject *capi_sb_as_array = NULL;
+    int capi_sb_intent = 0;
+    PyObject *sb_capi = Py_None;
+    int nbdirs = 0;
+    PyObject *nbdirs_capi = Py_None;
+    static char *capi_kwlist[] = {"r","rb","precurve","precurveb","presweep","presweepb","precone","preconeb","x_az","x_azb","y_az","z_az","z_azb","cone","coneb","s","sb","n","nbdirs",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOOOOOOOOOOO|OO:_bem.definecurvature_bv",\
+        capi_kwlist,&r_capi,&rb_capi,&precurve_capi,&precurveb_capi,&presweep_capi,&presweepb_capi,&precone_capi,&preconeb_capi,&x_az_capi,&x_azb_capi,&y_az_capi,&z_az_capi,&z_azb_capi,&cone_capi,&coneb_capi,&s_capi,&sb_capi,&n_capi,&nbdirs_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable r */
+    ;
+    capi_r_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 1st argument `r`";
+    capi_r_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,r_Dims,r_Rank,  capi_r_intent,r_capi,capi_errmess);
+    if (capi_r_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        r = (double *)(PyArray_DATA(capi_r_as_array));
+
+    /* Processing variable precone */
+        f2py_success = double_from_pyobj(&precone,precone_capi,"_bem.definecurvature_bv() 7th argument (precone) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable n */
+    if (n_capi == Py_None) n = shape(r, 0); else
+        f2py_success = int_from_pyobj(&n,n_capi,"_bem.definecurvature_bv() 1st keyword (n) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(r, 0) == n,"shape(r, 0) == n","1st keyword n","definecurvature_bv:n=%d",n) {
+    /* Processing variable precurve */
+    precurve_Dims[0]=n;
+    capi_precurve_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 3rd argument `precurve`";
+    capi_precurve_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurve_Dims,precurve_Rank,  capi_precurve_intent,precurve_capi,capi_errmess);
+    if (capi_precurve_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurve = (double *)(PyArray_DATA(capi_precurve_as_array));
+
+    /* Processing variable presweep */
+    presweep_Dims[0]=n;
+    capi_presweep_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 5th argument `presweep`";
+    capi_presweep_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweep_Dims,presweep_Rank,  capi_presweep_intent,presweep_capi,capi_errmess);
+    if (capi_presweep_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweep = (double *)(PyArray_DATA(capi_presweep_as_array));
+
+    /* Processing variable rb */
+    rb_Dims[1]=n;
+    capi_rb_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 2nd argument `rb`";
+    capi_rb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,rb_Dims,rb_Rank,  capi_rb_intent,rb_capi,capi_errmess);
+    if (capi_rb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        rb = (double *)(PyArray_DATA(capi_rb_as_array));
+
+    /* Processing variable nbdirs */
+    if (nbdirs_capi == Py_None) nbdirs = shape(rb, 0); else
+        f2py_success = int_from_pyobj(&nbdirs,nbdirs_capi,"_bem.definecurvature_bv() 2nd keyword (nbdirs) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(rb, 0) == nbdirs,"shape(rb, 0) == nbdirs","2nd keyword nbdirs","definecurvature_bv:nbdirs=%d",nbdirs) {
+    /* Processing variable x_az */
+    x_az_Dims[0]=n;
+    capi_x_az_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 9th argument `x_az`";
+    capi_x_az_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,x_az_Dims,x_az_Rank,  capi_x_az_intent,x_az_capi,capi_errmess);
+    if (capi_x_az_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        x_az = (double *)(PyArray_DATA(capi_x_az_as_array));
+
+    /* Processing variable y_az */
+    y_az_Dims[0]=n;
+    capi_y_az_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 11st argument `y_az`";
+    capi_y_az_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,y_az_Dims,y_az_Rank,  capi_y_az_intent,y_az_capi,capi_errmess);
+    if (capi_y_az_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        y_az = (double *)(PyArray_DATA(capi_y_az_as_array));
+
+    /* Processing variable z_az */
+    z_az_Dims[0]=n;
+    capi_z_az_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 12nd argument `z_az`";
+    capi_z_az_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,z_az_Dims,z_az_Rank,  capi_z_az_intent,z_az_capi,capi_errmess);
+    if (capi_z_az_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        z_az = (double *)(PyArray_DATA(capi_z_az_as_array));
+
+    /* Processing variable cone */
+    cone_Dims[0]=n;
+    capi_cone_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 14th argument `cone`";
+    capi_cone_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,cone_Dims,cone_Rank,  capi_cone_intent,cone_capi,capi_errmess);
+    if (capi_cone_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        cone = (double *)(PyArray_DATA(capi_cone_as_array));
+
+    /* Processing variable s */
+    s_Dims[0]=n;
+    capi_s_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 16th argument `s`";
+    capi_s_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,s_Dims,s_Rank,  capi_s_intent,s_capi,capi_errmess);
+    if (capi_s_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        s = (double *)(PyArray_DATA(capi_s_as_array));
+
+    /* Processing variable x_azb */
+    x_azb_Dims[0]=nbdirs,x_azb_Dims[1]=n;
+    capi_x_azb_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 10th argument `x_azb`";
+    capi_x_azb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,x_azb_Dims,x_azb_Rank,  capi_x_azb_intent,x_azb_capi,capi_errmess);
+    if (capi_x_azb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        x_azb = (double *)(PyArray_DATA(capi_x_azb_as_array));
+
+    /* Processing variable z_azb */
+    z_azb_Dims[0]=nbdirs,z_azb_Dims[1]=n;
+    capi_z_azb_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 13rd argument `z_azb`";
+    capi_z_azb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,z_azb_Dims,z_azb_Rank,  capi_z_azb_intent,z_azb_capi,capi_errmess);
+    if (capi_z_azb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        z_azb = (double *)(PyArray_DATA(capi_z_azb_as_array));
+
+    /* Processing variable coneb */
+    coneb_Dims[0]=nbdirs,coneb_Dims[1]=n;
+    capi_coneb_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 15th argument `coneb`";
+    capi_coneb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,coneb_Dims,coneb_Rank,  capi_coneb_intent,coneb_capi,capi_errmess);
+    if (capi_coneb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        coneb = (double *)(PyArray_DATA(capi_coneb_as_array));
+
+    /* Processing variable sb */
+    sb_Dims[0]=nbdirs,sb_Dims[1]=n;
+    capi_sb_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 17th argument `sb`";
+    capi_sb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,sb_Dims,sb_Rank,  capi_sb_intent,sb_capi,capi_errmess);
+    if (capi_sb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        sb = (double *)(PyArray_DATA(capi_sb_as_array));
+
+    /* Processing variable precurveb */
+    precurveb_Dims[0]=nbdirs,precurveb_Dims[1]=n;
+    capi_precurveb_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 4th argument `precurveb`";
+    capi_precurveb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurveb_Dims,precurveb_Rank,  capi_precurveb_intent,precurveb_capi,capi_errmess);
+    if (capi_precurveb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurveb = (double *)(PyArray_DATA(capi_precurveb_as_array));
+
+    /* Processing variable presweepb */
+    presweepb_Dims[0]=nbdirs,presweepb_Dims[1]=n;
+    capi_presweepb_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 6th argument `presweepb`";
+    capi_presweepb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweepb_Dims,presweepb_Rank,  capi_presweepb_intent,presweepb_capi,capi_errmess);
+    if (capi_presweepb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweepb = (double *)(PyArray_DATA(capi_presweepb_as_array));
+
+    /* Processing variable preconeb */
+    preconeb_Dims[0]=nbdirs;
+    capi_preconeb_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_bv: failed to create array from the 8th argument `preconeb`";
+    capi_preconeb_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,preconeb_Dims,preconeb_Rank,  capi_preconeb_intent,preconeb_capi,capi_errmess);
+    if (capi_preconeb_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        preconeb = (double *)(PyArray_DATA(capi_preconeb_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&n,r,rb,precurve,precurveb,presweep,presweepb,&precone,preconeb,x_az,x_azb,y_az,z_az,z_azb,cone,coneb,s,sb,&nbdirs);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_preconeb_as_array!=preconeb_capi) {
+        Py_XDECREF(capi_preconeb_as_array); }
+    }  /* if (capi_preconeb_as_array == NULL) ... else of preconeb */
+    /* End of cleaning variable preconeb */
+    if((PyObject *)capi_presweepb_as_array!=presweepb_capi) {
+        Py_XDECREF(capi_presweepb_as_array); }
+    }  /* if (capi_presweepb_as_array == NULL) ... else of presweepb */
+    /* End of cleaning variable presweepb */
+    if((PyObject *)capi_precurveb_as_array!=precurveb_capi) {
+        Py_XDECREF(capi_precurveb_as_array); }
+    }  /* if (capi_precurveb_as_array == NULL) ... else of precurveb */
+    /* End of cleaning variable precurveb */
+    if((PyObject *)capi_sb_as_array!=sb_capi) {
+        Py_XDECREF(capi_sb_as_array); }
+    }  /* if (capi_sb_as_array == NULL) ... else of sb */
+    /* End of cleaning variable sb */
+    if((PyObject *)capi_coneb_as_array!=coneb_capi) {
+        Py_XDECREF(capi_coneb_as_array); }
+    }  /* if (capi_coneb_as_array == NULL) ... else of coneb */
+    /* End of cleaning variable coneb */
+    if((PyObject *)capi_z_azb_as_array!=z_azb_capi) {
+        Py_XDECREF(capi_z_azb_as_array); }
+    }  /* if (capi_z_azb_as_array == NULL) ... else of z_azb */
+    /* End of cleaning variable z_azb */
+    if((PyObject *)capi_x_azb_as_array!=x_azb_capi) {
+        Py_XDECREF(capi_x_azb_as_array); }
+    }  /* if (capi_x_azb_as_array == NULL) ... else of x_azb */
+    /* End of cleaning variable x_azb */
+    if((PyObject *)capi_s_as_array!=s_capi) {
+        Py_XDECREF(capi_s_as_array); }
+    }  /* if (capi_s_as_array == NULL) ... else of s */
+    /* End of cleaning variable s */
+    if((PyObject *)capi_cone_as_array!=cone_capi) {
+        Py_XDECREF(capi_cone_as_array); }
+    }  /* if (capi_cone_as_array == NULL) ... else of cone */
+    /* End of cleaning variable cone */
+    if((PyObject *)capi_z_az_as_array!=z_az_capi) {
+        Py_XDECREF(capi_z_az_as_array); }
+    }  /* if (capi_z_az_as_array == NULL) ... else of z_az */
+    /* End of cleaning variable z_az */
+    if((PyObject *)capi_y_az_as_array!=y_az_capi) {
+        Py_XDECREF(capi_y_az_as_array); }
+    }  /* if (capi_y_az_as_array == NULL) ... else of y_az */
+    /* End of cleaning variable y_az */
+    if((PyObject *)capi_x_az_as_array!=x_az_capi) {
+        Py_XDECREF(capi_x_az_as_array); }
+    }  /* if (capi_x_az_as_array == NULL) ... else of x_az */
+    /* End of cleaning variable x_az */
+    } /*CHECKSCALAR(shape(rb, 0) == nbdirs)*/
+    } /*if (f2py_success) of nbdirs*/
+    /* End of cleaning variable nbdirs */
+    if((PyObject *)capi_rb_as_array!=rb_capi) {
+        Py_XDECREF(capi_rb_as_array); }
+    }  /* if (capi_rb_as_array == NULL) ... else of rb */
+    /* End of cleaning variable rb */
+    if((PyObject *)capi_presweep_as_array!=presweep_capi) {
+        Py_XDECREF(capi_presweep_as_array); }
+    }  /* if (capi_presweep_as_array == NULL) ... else of presweep */
+    /* End of cleaning variable presweep */
+    if((PyObject *)capi_precurve_as_array!=precurve_capi) {
+        Py_XDECREF(capi_precurve_as_array); }
+    }  /* if (capi_precurve_as_array == NULL) ... else of precurve */
+    /* End of cleaning variable precurve */
+    } /*CHECKSCALAR(shape(r, 0) == n)*/
+    } /*if (f2py_success) of n*/
+    /* End of cleaning variable n */
+    } /*if (f2py_success) of precone*/
+    /* End of cleaning variable precone */
+    if((PyObject *)capi_r_as_array!=r_capi) {
+        Py_XDECREF(capi_r_as_array); }
+    }  /* if (capi_r_as_array == NULL) ... else of r */
+    /* End of cleaning variable r */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/************************* end of definecurvature_bv *************************/
+
+/**************************** definecurvature_dv2 ****************************/
+static char doc_f2py_rout__bem_definecurvature_dv2[] = "\
+x_az,x_azd,y_az,y_azd,z_az,z_azd,cone,coned,s,sd = definecurvature_dv2(r,rd,precurve,precurved,presweep,presweepd,precone,preconed,[n,nbdirs])\n\nWrapper for ``definecurvature_dv2``.\
+\n\nParameters\n----------\n"
+"r : input rank-1 array('d') with bounds (n)\n"
+"rd : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"precurve : input rank-1 array('d') with bounds (n)\n"
+"precurved : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"presweep : input rank-1 array('d') with bounds (n)\n"
+"presweepd : input rank-2 array('d') with bounds (nbdirs,n)\n"
+"precone : input float\n"
+"preconed : input rank-1 array('d') with bounds (nbdirs)\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: shape(r, 0)\n"
+"nbdirs : input int, optional\n    Default: shape(rd, 0)\n"
+"\nReturns\n-------\n"
+"x_az : rank-1 array('d') with bounds (n)\n"
+"x_azd : rank-2 array('d') with bounds (nbdirs,n)\n"
+"y_az : rank-1 array('d') with bounds (n)\n"
+"y_azd : rank-2 array('d') with bounds (nbdirs,n)\n"
+"z_az : rank-1 array('d') with bounds (n)\n"
+"z_azd : rank-2 array('d') with bounds (nbdirs,n)\n"
+"cone : rank-1 array('d') with bounds (n)\n"
+"coned : rank-2 array('d') with bounds (nbdirs,n)\n"
+"s : rank-1 array('d') with bounds (n)\n"
+"sd : rank-2 array('d') with bounds (nbdirs,n)";
+/* extern void F_FUNC_US(definecurvature_dv2,DEFINECURVATURE_DV2)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*); */
+static PyObject *f2py_rout__bem_definecurvature_dv2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int n = 0;
+    PyObject *n_capi = Py_None;
+    double *r = NULL;
+    npy_intp r_Dims[1] = {-1};
+    const int r_Rank = 1;
+    PyArrayObject *capi_r_as_array = NULL;
+    int capi_r_intent = 0;
+    PyObject *r_capi = Py_None;
+    double *rd = NULL;
+    npy_intp rd_Dims[2] = {-1, -1};
+    const int rd_Rank = 2;
+    PyArrayObject *capi_rd_as_array = NULL;
+    int capi_rd_intent = 0;
+    PyObject *rd_capi = Py_None;
+    double *precurve = NULL;
+    npy_intp precurve_Dims[1] = {-1};
+    const int precurve_Rank = 1;
+    PyArrayObject *capi_precurve_as_array = NULL;
+    int capi_precurve_intent = 0;
+    PyObject *precurve_capi = Py_None;
+    double *precurved = NULL;
+    npy_intp precurved_Dims[2] = {-1, -1};
+    const int precurved_Rank = 2;
+    PyArrayObject *capi_precurved_as_array = NULL;
+    int capi_precurved_intent = 0;
+    PyObject *precurved_capi = Py_None;
+    double *presweep = NULL;
+    npy_intp presweep_Dims[1] = {-1};
+    const int presweep_Rank = 1;
+    PyArrayObject *capi_presweep_as_array = NULL;
+    int capi_presweep_intent = 0;
+    PyObject *presweep_capi = Py_None;
+    double *presweepd = NULL;
+    npy_intp presweepd_Dims[2] = {-1, -1};
+    const int presweepd_Rank = 2;
+    PyArrayObject *capi_presweepd_as_array = NULL;
+    int capi_presweepd_intent = 0;
+    PyObject *presweepd_capi = Py_None;
+    double precone = 0;
+    PyObject *precone_capi = Py_None;
+    double *preconed = NULL;
+    npy_intp preconed_Dims[1] = {-1};
+    const int preconed_Rank = 1;
+    PyArrayObject *capi_preconed_as_array = NULL;
+    int capi_preconed_intent = 0;
+    PyObject *preconed_capi = Py_None;
+    double *x_az = NULL;
+    npy_intp x_az_Dims[1] = {-1};
+    const int x_az_Rank = 1;
+    PyArrayObject *capi_x_az_as_array = NULL;
+    int capi_x_az_intent = 0;
+    double *x_azd = NULL;
+    npy_intp x_azd_Dims[2] = {-1, -1};
+    const int x_azd_Rank = 2;
+    PyArrayObject *capi_x_azd_as_array = NULL;
+    int capi_x_azd_intent = 0;
+    double *y_az = NULL;
+    npy_intp y_az_Dims[1] = {-1};
+    const int y_az_Rank = 1;
+    PyArrayObject *capi_y_az_as_array = NULL;
+    int capi_y_az_intent = 0;
+    double *y_azd = NULL;
+    npy_intp y_azd_Dims[2] = {-1, -1};
+    const int y_azd_Rank = 2;
+    PyArrayObject *capi_y_azd_as_array = NULL;
+    int capi_y_azd_intent = 0;
+    double *z_az = NULL;
+    npy_intp z_az_Dims[1] = {-1};
+    const int z_az_Rank = 1;
+    PyArrayObject *capi_z_az_as_array = NULL;
+    int capi_z_az_intent = 0;
+    double *z_azd = NULL;
+    npy_intp z_azd_Dims[2] = {-1, -1};
+    const int z_azd_Rank = 2;
+    PyArrayObject *capi_z_azd_as_array = NULL;
+    int capi_z_azd_intent = 0;
+    double *cone = NULL;
+    npy_intp cone_Dims[1] = {-1};
+    const int cone_Rank = 1;
+    PyArrayObject *capi_cone_as_array = NULL;
+    int capi_cone_intent = 0;
+    double *coned = NULL;
+    npy_intp coned_Dims[2] = {-1, -1};
+    const int coned_Rank = 2;
+    PyArrayObject *capi_coned_as_array = NULL;
+    int capi_coned_intent = 0;
+    double *s = NULL;
+    npy_intp s_Dims[1] = {-1};
+    const int s_Rank = 1;
+    PyArrayObject *capi_s_as_array = NULL;
+    int capi_s_intent = 0;
+    double *sd = NULL;
+    npy_intp sd_Dims[2] = {-1, -1};
+    const int sd_Rank = 2;
+    PyArrayObject *capi_sd_as_array = NULL;
+    int capi_sd_intent = 0;
+    int nbdirs = 0;
+    PyObject *nbdirs_capi = Py_None;
+    static char *capi_kwlist[] = {"r","rd","precurve","precurved","presweep","presweepd","precone","preconed","n","nbdirs",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOO|OO:_bem.definecurvature_dv2",\
+        capi_kwlist,&r_capi,&rd_capi,&precurve_capi,&precurved_capi,&presweep_capi,&presweepd_capi,&precone_capi,&preconed_capi,&n_capi,&nbdirs_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable r */
+    ;
+    capi_r_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the 1st argument `r`";
+    capi_r_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,r_Dims,r_Rank,  capi_r_intent,r_capi,capi_errmess);
+    if (capi_r_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        r = (double *)(PyArray_DATA(capi_r_as_array));
+
+    /* Processing variable precone */
+        f2py_success = double_from_pyobj(&precone,precone_capi,"_bem.definecurvature_dv2() 7th argument (precone) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable n */
+    if (n_capi == Py_None) n = shape(r, 0); else
+        f2py_success = int_from_pyobj(&n,n_capi,"_bem.definecurvature_dv2() 1st keyword (n) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(r, 0) == n,"shape(r, 0) == n","1st keyword n","definecurvature_dv2:n=%d",n) {
+    /* Processing variable precurve */
+    precurve_Dims[0]=n;
+    capi_precurve_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the 3rd argument `precurve`";
+    capi_precurve_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurve_Dims,precurve_Rank,  capi_precurve_intent,precurve_capi,capi_errmess);
+    if (capi_precurve_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurve = (double *)(PyArray_DATA(capi_precurve_as_array));
+
+    /* Processing variable presweep */
+    presweep_Dims[0]=n;
+    capi_presweep_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the 5th argument `presweep`";
+    capi_presweep_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweep_Dims,presweep_Rank,  capi_presweep_intent,presweep_capi,capi_errmess);
+    if (capi_presweep_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweep = (double *)(PyArray_DATA(capi_presweep_as_array));
+
+    /* Processing variable rd */
+    rd_Dims[1]=n;
+    capi_rd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the 2nd argument `rd`";
+    capi_rd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,rd_Dims,rd_Rank,  capi_rd_intent,rd_capi,capi_errmess);
+    if (capi_rd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        rd = (double *)(PyArray_DATA(capi_rd_as_array));
+
+    /* Processing variable nbdirs */
+    if (nbdirs_capi == Py_None) nbdirs = shape(rd, 0); else
+        f2py_success = int_from_pyobj(&nbdirs,nbdirs_capi,"_bem.definecurvature_dv2() 2nd keyword (nbdirs) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(rd, 0) == nbdirs,"shape(rd, 0) == nbdirs","2nd keyword nbdirs","definecurvature_dv2:nbdirs=%d",nbdirs) {
+    /* Processing variable preconed */
+    preconed_Dims[0]=nbdirs;
+    capi_preconed_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the 8th argument `preconed`";
+    capi_preconed_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,preconed_Dims,preconed_Rank,  capi_preconed_intent,preconed_capi,capi_errmess);
+    if (capi_preconed_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        preconed = (double *)(PyArray_DATA(capi_preconed_as_array));
+
+    /* Processing variable x_az */
+    x_az_Dims[0]=n;
+    capi_x_az_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the hidden `x_az`";
+    capi_x_az_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,x_az_Dims,x_az_Rank,  capi_x_az_intent,Py_None,capi_errmess);
+    if (capi_x_az_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        x_az = (double *)(PyArray_DATA(capi_x_az_as_array));
+
+    /* Processing variable y_az */
+    y_az_Dims[0]=n;
+    capi_y_az_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the hidden `y_az`";
+    capi_y_az_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,y_az_Dims,y_az_Rank,  capi_y_az_intent,Py_None,capi_errmess);
+    if (capi_y_az_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        y_az = (double *)(PyArray_DATA(capi_y_az_as_array));
+
+    /* Processing variable z_az */
+    z_az_Dims[0]=n;
+    capi_z_az_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the hidden `z_az`";
+    capi_z_az_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,z_az_Dims,z_az_Rank,  capi_z_az_intent,Py_None,capi_errmess);
+    if (capi_z_az_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        z_az = (double *)(PyArray_DATA(capi_z_az_as_array));
+
+    /* Processing variable cone */
+    cone_Dims[0]=n;
+    capi_cone_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the hidden `cone`";
+    capi_cone_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,cone_Dims,cone_Rank,  capi_cone_intent,Py_None,capi_errmess);
+    if (capi_cone_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        cone = (double *)(PyArray_DATA(capi_cone_as_array));
+
+    /* Processing variable s */
+    s_Dims[0]=n;
+    capi_s_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the hidden `s`";
+    capi_s_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,s_Dims,s_Rank,  capi_s_intent,Py_None,capi_errmess);
+    if (capi_s_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        s = (double *)(PyArray_DATA(capi_s_as_array));
+
+    /* Processing variable x_azd */
+    x_azd_Dims[0]=nbdirs,x_azd_Dims[1]=n;
+    capi_x_azd_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the hidden `x_azd`";
+    capi_x_azd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,x_azd_Dims,x_azd_Rank,  capi_x_azd_intent,Py_None,capi_errmess);
+    if (capi_x_azd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        x_azd = (double *)(PyArray_DATA(capi_x_azd_as_array));
+
+    /* Processing variable y_azd */
+    y_azd_Dims[0]=nbdirs,y_azd_Dims[1]=n;
+    capi_y_azd_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the hidden `y_azd`";
+    capi_y_azd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,y_azd_Dims,y_azd_Rank,  capi_y_azd_intent,Py_None,capi_errmess);
+    if (capi_y_azd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        y_azd = (double *)(PyArray_DATA(capi_y_azd_as_array));
+
+    /* Processing variable z_azd */
+    z_azd_Dims[0]=nbdirs,z_azd_Dims[1]=n;
+    capi_z_azd_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the hidden `z_azd`";
+    capi_z_azd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,z_azd_Dims,z_azd_Rank,  capi_z_azd_intent,Py_None,capi_errmess);
+    if (capi_z_azd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        z_azd = (double *)(PyArray_DATA(capi_z_azd_as_array));
+
+    /* Processing variable coned */
+    coned_Dims[0]=nbdirs,coned_Dims[1]=n;
+    capi_coned_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the hidden `coned`";
+    capi_coned_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,coned_Dims,coned_Rank,  capi_coned_intent,Py_None,capi_errmess);
+    if (capi_coned_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        coned = (double *)(PyArray_DATA(capi_coned_as_array));
+
+    /* Processing variable sd */
+    sd_Dims[0]=nbdirs,sd_Dims[1]=n;
+    capi_sd_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the hidden `sd`";
+    capi_sd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,sd_Dims,sd_Rank,  capi_sd_intent,Py_None,capi_errmess);
+    if (capi_sd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        sd = (double *)(PyArray_DATA(capi_sd_as_array));
+
+    /* Processing variable precurved */
+    precurved_Dims[0]=nbdirs,precurved_Dims[1]=n;
+    capi_precurved_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the 4th argument `precurved`";
+    capi_precurved_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,precurved_Dims,precurved_Rank,  capi_precurved_intent,precurved_capi,capi_errmess);
+    if (capi_precurved_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        precurved = (double *)(PyArray_DATA(capi_precurved_as_array));
+
+    /* Processing variable presweepd */
+    presweepd_Dims[0]=nbdirs,presweepd_Dims[1]=n;
+    capi_presweepd_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_bem._bem.definecurvature_dv2: failed to create array from the 6th argument `presweepd`";
+    capi_presweepd_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,presweepd_Dims,presweepd_Rank,  capi_presweepd_intent,presweepd_capi,capi_errmess);
+    if (capi_presweepd_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _bem_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        presweepd = (double *)(PyArray_DATA(capi_presweepd_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&n,r,rd,precurve,precurved,presweep,presweepd,&precone,preconed,x_az,x_azd,y_az,y_azd,z_az,z_azd,cone,coned,s,sd,&nbdirs);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("NNNNNNNNNN",capi_x_az_as_array,capi_x_azd_as_array,capi_y_az_as_array,capi_y_azd_as_array,capi_z_az_as_array,capi_z_azd_as_array,capi_cone_as_array,capi_coned_as_array,capi_s_as_array,capi_sd_as_array);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_presweepd_as_array!=presweepd_capi) {
+        Py_XDECREF(capi_presweepd_as_array); }
+    }  /* if (capi_presweepd_as_array == NULL) ... else of presweepd */
+    /* End of cleaning variable presweepd */
+    if((PyObject *)capi_precurved_as_array!=precurved_capi) {
+        Py_XDECREF(capi_precurved_as_array); }
+    }  /* if (capi_precurved_as_array == NULL) ... else of precurved */
+    /* End of cleaning variable precurved */
+    }  /* if (capi_sd_as_array == NULL) ... else of sd */
+    /* End of cleaning variable sd */
+    }  /* if (capi_coned_as_array == NULL) ... else of coned */
+    /* End of cleaning variable coned */
+    }  /* if (capi_z_azd_as_array == NULL) ... else of z_azd */
+    /* End of cleaning variable z_azd */
+    }  /* if (capi_y_azd_as_array == NULL) ... else of y_azd */
+    /* End of cleaning variable y_azd */
+    }  /* if (capi_x_azd_as_array == NULL) ... else of x_azd */
+    /* End of cleaning variable x_azd */
+    }  /* if (capi_s_as_array == NULL) ... else of s */
+    /* End of cleaning variable s */
+    }  /* if (capi_cone_as_array == NULL) ... else of cone */
+    /* End of cleaning variable cone */
+    }  /* if (capi_z_az_as_array == NULL) ... else of z_az */
+    /* End of cleaning variable z_az */
+    }  /* if (capi_y_az_as_array == NULL) ... else of y_az */
+    /* End of cleaning variable y_az */
+    }  /* if (capi_x_az_as_array == NULL) ... else of x_az */
+    /* End of cleaning variable x_az */
+    if((PyObject *)capi_preconed_as_array!=preconed_capi) {
+        Py_XDECREF(capi_preconed_as_array); }
+    }  /* if (capi_preconed_as_array == NULL) ... else of preconed */
+    /* End of cleaning variable preconed */
+    } /*CHECKSCALAR(shape(rd, 0) == nbdirs)*/
+    } /*if (f2py_success) of nbdirs*/
+    /* End of cleaning variable nbdirs */
+    if((PyObject *)capi_rd_as_array!=rd_capi) {
+        Py_XDECREF(capi_rd_as_array); }
+    }  /* if (capi_rd_as_array == NULL) ... else of rd */
+    /* End of cleaning variable rd */
+    if((PyObject *)capi_presweep_as_array!=presweep_capi) {
+        Py_XDECREF(capi_presweep_as_array); }
+    }  /* if (capi_presweep_as_array == NULL) ... else of presweep */
+    /* End of cleaning variable presweep */
+    if((PyObject *)capi_precurve_as_array!=precurve_capi) {
+        Py_XDECREF(capi_precurve_as_array); }
+    }  /* if (capi_precurve_as_array == NULL) ... else of precurve */
+    /* End of cleaning variable precurve */
+    } /*CHECKSCALAR(shape(r, 0) == n)*/
+    } /*if (f2py_success) of n*/
+    /* End of cleaning variable n */
+    } /*if (f2py_success) of precone*/
+    /* End of cleaning variable precone */
+    if((PyObject *)capi_r_as_array!=r_capi) {
+        Py_XDECREF(capi_r_as_array); }
+    }  /* if (capi_r_as_array == NULL) ... else of r */
+    /* End of cleaning variable r */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/************************* end of definecurvature_dv2 *************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+    {"inductionfactors",-1,{{-1}},0,0,(char *)  F_FUNC(inductionfactors,INDUCTIONFACTORS),  (f2py_init_func)f2py_rout__bem_inductionfactors,doc_f2py_rout__bem_inductionfactors},
+    {"relativewind",-1,{{-1}},0,0,(char *)  F_FUNC(relativewind,RELATIVEWIND),  (f2py_init_func)f2py_rout__bem_relativewind,doc_f2py_rout__bem_relativewind},
+    {"definecurvature",-1,{{-1}},0,0,(char *)  F_FUNC(definecurvature,DEFINECURVATURE),  (f2py_init_func)f2py_rout__bem_definecurvature,doc_f2py_rout__bem_definecurvature},
+    {"windcomponents",-1,{{-1}},0,0,(char *)  F_FUNC(windcomponents,WINDCOMPONENTS),  (f2py_init_func)f2py_rout__bem_windcomponents,doc_f2py_rout__bem_windcomponents},
+    {"thrusttorque",-1,{{-1}},0,0,(char *)  F_FUNC(thrusttorque,THRUSTTORQUE),  (f2py_init_func)f2py_rout__bem_thrusttorque,doc_f2py_rout__bem_thrusttorque},
+    {"inductionfactors_dv",-1,{{-1}},0,0,(char *)  F_FUNC_US(inductionfactors_dv,INDUCTIONFACTORS_DV),  (f2py_init_func)f2py_rout__bem_inductionfactors_dv,doc_f2py_rout__bem_inductionfactors_dv},
+    {"relativewind_dv",-1,{{-1}},0,0,(char *)  F_FUNC_US(relativewind_dv,RELATIVEWIND_DV),  (f2py_init_func)f2py_rout__bem_relativewind_dv,doc_f2py_rout__bem_relativewind_dv},
+    {"windcomponents_dv",-1,{{-1}},0,0,(char *)  F_FUNC_US(windcomponents_dv,WINDCOMPONENTS_DV),  (f2py_init_func)f2py_rout__bem_windcomponents_dv,doc_f2py_rout__bem_windcomponents_dv},
+    {"definecurvature_dv",-1,{{-1}},0,0,(char *)  F_FUNC_US(definecurvature_dv,DEFINECURVATURE_DV),  (f2py_init_func)f2py_rout__bem_definecurvature_dv,doc_f2py_rout__bem_definecurvature_dv},
+    {"thrusttorque_bv",-1,{{-1}},0,0,(char *)  F_FUNC_US(thrusttorque_bv,THRUSTTORQUE_BV),  (f2py_init_func)f2py_rout__bem_thrusttorque_bv,doc_f2py_rout__bem_thrusttorque_bv},
+    {"definecurvature_bv",-1,{{-1}},0,0,(char *)  F_FUNC_US(definecurvature_bv,DEFINECURVATURE_BV),  (f2py_init_func)f2py_rout__bem_definecurvature_bv,doc_f2py_rout__bem_definecurvature_bv},
+    {"definecurvature_dv2",-1,{{-1}},0,0,(char *)  F_FUNC_US(definecurvature_dv2,DEFINECURVATURE_DV2),  (f2py_init_func)f2py_rout__bem_definecurvature_dv2,doc_f2py_rout__bem_definecurvature_dv2},
+
+/*eof routine_defs*/
+    {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+    {NULL,NULL}
+};
+
+static struct PyModuleDef moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_bem",
+    NULL,
+    -1,
+    f2py_module_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC PyInit__bem(void) {
+    int i;
+    PyObject *m,*d, *s, *tmp;
+    m = _bem_module = PyModule_Create(&moduledef);
+    Py_SET_TYPE(&PyFortran_Type, &PyType_Type);
+    import_array();
+    if (PyErr_Occurred())
+        {PyErr_SetString(PyExc_ImportError, "can't initialize module _bem (failed to import numpy)"); return m;}
+    d = PyModule_GetDict(m);
+    s = PyUnicode_FromString("1.24.4");
+    PyDict_SetItemString(d, "__version__", s);
+    Py_DECREF(s);
+    s = PyUnicode_FromString(
+        "This module '_bem' is auto-generated with f2py (version:1.24.4).\nFunctions:\n"
+"    fzero,a,ap = inductionfactors(r,chord,rhub,rtip,phi,cl,cd,b,vx,vy,usecd=1,hubloss=1,tiploss=1,wakerotation=1)\n"
+"    alpha,w,re = relativewind(phi,a,ap,vx,vy,pitch,chord,theta,rho,mu)\n"
+"    x_az,y_az,z_az,cone,s = definecurvature(r,precurve,presweep,precone,n=shape(r, 0))\n"
+"    vx,vy = windcomponents(r,precurve,presweep,precone,yaw,tilt,azimuth,uinf,omegarpm,hubht,shearexp,n=shape(r, 0))\n"
+"    t,q,m = thrusttorque(np,tp,r,precurve,presweep,precone,rhub,rtip,precurvetip,presweeptip,n=shape(np, 0))\n"
+"    fzero,a,ap,fzerod,ad,apd = inductionfactors_dv(r,chord,rhub,rtip,phi,cl,cd,b,vx,vy,rd,chordd,rhubd,rtipd,phid,cld,cdd,vxd,vyd,usecd=1,hubloss=1,tiploss=1,wakerotation=1,nbdirs=shape(rd, 0))\n"
+"    alpha,alphad,w,wd,re,red = relativewind_dv(phi,phid,a,ad,ap,apd,vx,vxd,vy,vyd,pitch,pitchd,chord,chordd,theta,thetad,rho,mu,nbdirs=shape(phid, 0))\n"
+"    vx,vxd,vy,vyd = windcomponents_dv(r,rd,precurve,precurved,presweep,presweepd,precone,preconed,yaw,yawd,tilt,tiltd,azimuth,azimuthd,uinf,uinfd,omegarpm,omegarpmd,hubht,hubhtd,shearexp,n=shape(r, 0),nbdirs=shape(rd, 0))\n"
+"    x_az,x_azd,y_az,y_azd,z_az,z_azd,cone,coned,s = definecurvature_dv(r,rd,precurve,precurved,presweep,presweepd,precone,preconed,n=shape(r, 0),nbdirs=shape(rd, 0))\n"
+"    npb,tpb,rb,precurveb,presweepb,preconeb,rhubb,rtipb,precurvetipb,presweeptipb = thrusttorque_bv(np,tp,r,precurve,presweep,precone,rhub,rtip,precurvetip,presweeptip,tb,qb,n=shape(np, 0),nbdirs=shape(tb, 0))\n"
+"    definecurvature_bv(r,rb,precurve,precurveb,presweep,presweepb,precone,preconeb,x_az,x_azb,y_az,z_az,z_azb,cone,coneb,s,sb,n=shape(r, 0),nbdirs=shape(rb, 0))\n"
+"    x_az,x_azd,y_az,y_azd,z_az,z_azd,cone,coned,s,sd = definecurvature_dv2(r,rd,precurve,precurved,presweep,presweepd,precone,preconed,n=shape(r, 0),nbdirs=shape(rd, 0))\n"
+".");
+    PyDict_SetItemString(d, "__doc__", s);
+    Py_DECREF(s);
+    s = PyUnicode_FromString("1.24.4");
+    PyDict_SetItemString(d, "__f2py_numpy_version__", s);
+    Py_DECREF(s);
+    _bem_error = PyErr_NewException ("_bem.error", NULL, NULL);
+    /*
+     * Store the error object inside the dict, so that it could get deallocated.
+     * (in practice, this is a module, so it likely will not and cannot.)
+     */
+    PyDict_SetItemString(d, "__bem_error", _bem_error);
+    Py_DECREF(_bem_error);
+    for(i=0;f2py_routine_defs[i].name!=NULL;i++) {
+        tmp = PyFortranObject_NewAsAttr(&f2py_routine_defs[i]);
+        PyDict_SetItemString(d, f2py_routine_defs[i].name, tmp);
+        Py_DECREF(tmp);
+    }
+
+
+
+
+
+
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+    if (! PyErr_Occurred())
+        on_exit(f2py_report_on_exit,(void*)"_bem");
+#endif
+    return m;
+}
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,169 @@
+!     -*- f90 -*-
+!     This file is autogenerated with f2py (version:1.24.4)
+!     It contains Fortran 90 wrappers to fortran functions.
+
+      subroutine f2pywrap_precomp_seg_info (ch, rle, nseg, nseg_u, nseg_&
+     &p, xnode_u, ynode_u, xnode_l, ynode_l, ndl1, ndu1, loc_web, weby_u&
+     &, weby_l, n_scts, nsecnode, xsec_node, isur, idsect, yseg, zseg, w&
+     &seg, sthseg, cthseg, s2thseg, c2thseg, f2py_loc_web_d0, f2py_weby_&
+     &u_d0, f2py_weby_l_d0, f2py_isur_d0, f2py_idsect_d0, f2py_yseg_d0, &
+     &f2py_zseg_d0, f2py_wseg_d0, f2py_sthseg_d0, f2py_cthseg_d0, f2py_s&
+     &2thseg_d0, f2py_c2thseg_d0)
+      use precomp, only : seg_info
+      real(kind=8) ch
+      real(kind=8) rle
+      integer nseg
+      integer nseg_u
+      integer nseg_p
+      integer ndl1
+      integer ndu1
+      integer nsecnode
+      integer f2py_loc_web_d0
+      integer f2py_weby_u_d0
+      integer f2py_weby_l_d0
+      integer f2py_isur_d0
+      integer f2py_idsect_d0
+      integer f2py_yseg_d0
+      integer f2py_zseg_d0
+      integer f2py_wseg_d0
+      integer f2py_sthseg_d0
+      integer f2py_cthseg_d0
+      integer f2py_s2thseg_d0
+      integer f2py_c2thseg_d0
+      real(kind=8) xnode_u(300)
+      real(kind=8) ynode_u(300)
+      real(kind=8) xnode_l(300)
+      real(kind=8) ynode_l(300)
+      real(kind=8) loc_web(f2py_loc_web_d0)
+      real(kind=8) weby_u(f2py_weby_u_d0)
+      real(kind=8) weby_l(f2py_weby_l_d0)
+      integer n_scts(2)
+      real(kind=8) xsec_node(2,nsecnode)
+      integer isur(f2py_isur_d0)
+      integer idsect(f2py_idsect_d0)
+      real(kind=8) yseg(f2py_yseg_d0)
+      real(kind=8) zseg(f2py_zseg_d0)
+      real(kind=8) wseg(f2py_wseg_d0)
+      real(kind=8) sthseg(f2py_sthseg_d0)
+      real(kind=8) cthseg(f2py_cthseg_d0)
+      real(kind=8) s2thseg(f2py_s2thseg_d0)
+      real(kind=8) c2thseg(f2py_c2thseg_d0)
+      call seg_info(ch, rle, nseg, nseg_u, nseg_p, xnode_u, ynode_u, xno&
+     &de_l, ynode_l, ndl1, ndu1, loc_web, weby_u, weby_l, n_scts, nsecno&
+     &de, xsec_node, isur, idsect, yseg, zseg, wseg, sthseg, cthseg, s2t&
+     &hseg, c2thseg)
+      end subroutine f2pywrap_precomp_seg_info
+      subroutine f2pywrap_precomp_q_bars (mat, thp, density, q11, q22, q&
+     &12, q66, qbar11, qbar22, qbar12, qbar16, qbar26, qbar66, rho_m, f2&
+     &py_density_d0, f2py_q11_d0, f2py_q22_d0, f2py_q12_d0, f2py_q66_d0)
+      use precomp, only : q_bars
+      integer mat
+      real(kind=8) thp
+      real(kind=8) qbar11
+      real(kind=8) qbar22
+      real(kind=8) qbar12
+      real(kind=8) qbar16
+      real(kind=8) qbar26
+      real(kind=8) qbar66
+      real(kind=8) rho_m
+      integer f2py_density_d0
+      integer f2py_q11_d0
+      integer f2py_q22_d0
+      integer f2py_q12_d0
+      integer f2py_q66_d0
+      real(kind=8) density(f2py_density_d0)
+      real(kind=8) q11(f2py_q11_d0)
+      real(kind=8) q22(f2py_q22_d0)
+      real(kind=8) q12(f2py_q12_d0)
+      real(kind=8) q66(f2py_q66_d0)
+      call q_bars(mat, thp, density, q11, q22, q12, q66, qbar11, qbar22,&
+     & qbar12, qbar16, qbar26, qbar66, rho_m)
+      end subroutine f2pywrap_precomp_q_bars
+      
+      subroutine f2pyinitprecomp(f2pysetupfunc)
+      use precomp, only : dbp
+      use precomp, only : pi
+      use precomp, only : r2d
+      use precomp, only : eps
+      use precomp, only : properties
+      use precomp, only : embed_us
+      use precomp, only : embed_ls
+      use precomp, only : tw_rate
+      use precomp, only : q_tildas
+      interface 
+      subroutine f2pywrap_precomp_seg_info (ch, rle, nseg, nseg_u, nseg_&
+     &p, xnode_u, ynode_u, xnode_l, ynode_l, ndl1, ndu1, loc_web, weby_u&
+     &, weby_l, n_scts, nsecnode, xsec_node, isur, idsect, yseg, zseg, w&
+     &seg, sthseg, cthseg, s2thseg, c2thseg, f2py_loc_web_d0, f2py_weby_&
+     &u_d0, f2py_weby_l_d0, f2py_isur_d0, f2py_idsect_d0, f2py_yseg_d0, &
+     &f2py_zseg_d0, f2py_wseg_d0, f2py_sthseg_d0, f2py_cthseg_d0, f2py_s&
+     &2thseg_d0, f2py_c2thseg_d0)
+      real(kind=8) ch
+      real(kind=8) rle
+      integer nseg
+      integer nseg_u
+      integer nseg_p
+      integer ndl1
+      integer ndu1
+      integer nsecnode
+      integer f2py_loc_web_d0
+      integer f2py_weby_u_d0
+      integer f2py_weby_l_d0
+      integer f2py_isur_d0
+      integer f2py_idsect_d0
+      integer f2py_yseg_d0
+      integer f2py_zseg_d0
+      integer f2py_wseg_d0
+      integer f2py_sthseg_d0
+      integer f2py_cthseg_d0
+      integer f2py_s2thseg_d0
+      integer f2py_c2thseg_d0
+      real(kind=8) xnode_u(300)
+      real(kind=8) ynode_u(300)
+      real(kind=8) xnode_l(300)
+      real(kind=8) ynode_l(300)
+      real(kind=8) loc_web(f2py_loc_web_d0)
+      real(kind=8) weby_u(f2py_weby_u_d0)
+      real(kind=8) weby_l(f2py_weby_l_d0)
+      integer n_scts(2)
+      real(kind=8) xsec_node(2,nsecnode)
+      integer isur(f2py_isur_d0)
+      integer idsect(f2py_idsect_d0)
+      real(kind=8) yseg(f2py_yseg_d0)
+      real(kind=8) zseg(f2py_zseg_d0)
+      real(kind=8) wseg(f2py_wseg_d0)
+      real(kind=8) sthseg(f2py_sthseg_d0)
+      real(kind=8) cthseg(f2py_cthseg_d0)
+      real(kind=8) s2thseg(f2py_s2thseg_d0)
+      real(kind=8) c2thseg(f2py_c2thseg_d0)
+      end subroutine f2pywrap_precomp_seg_info 
+      subroutine f2pywrap_precomp_q_bars (mat, thp, density, q11, q22, q&
+     &12, q66, qbar11, qbar22, qbar12, qbar16, qbar26, qbar66, rho_m, f2&
+     &py_density_d0, f2py_q11_d0, f2py_q22_d0, f2py_q12_d0, f2py_q66_d0)
+      integer mat
+      real(kind=8) thp
+      real(kind=8) qbar11
+      real(kind=8) qbar22
+      real(kind=8) qbar12
+      real(kind=8) qbar16
+      real(kind=8) qbar26
+      real(kind=8) qbar66
+      real(kind=8) rho_m
+      integer f2py_density_d0
+      integer f2py_q11_d0
+      integer f2py_q22_d0
+      integer f2py_q12_d0
+      integer f2py_q66_d0
+      real(kind=8) density(f2py_density_d0)
+      real(kind=8) q11(f2py_q11_d0)
+      real(kind=8) q22(f2py_q22_d0)
+      real(kind=8) q12(f2py_q12_d0)
+      real(kind=8) q66(f2py_q66_d0)
+      end subroutine f2pywrap_precomp_q_bars
+      end interface
+      external f2pysetupfunc
+      call f2pysetupfunc(dbp,pi,r2d,eps,properties,embed_us,embed_ls,f2p&
+     &ywrap_precomp_seg_info,tw_rate,f2pywrap_precomp_q_bars,q_tildas)
+      end subroutine f2pyinitprecomp
+
+
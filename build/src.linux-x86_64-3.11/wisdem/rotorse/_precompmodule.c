@@ -0,0 +1,2694 @@
+/* File: _precompmodule.c
+ * This file is auto-generated with f2py (version:1.24.4).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Mon Oct 19 08:34:28 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+
+/* Unconditionally included */
+#include <Python.h>
+#include <numpy/npy_os.h>
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "fortranobject.h"
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *_precomp_error;
+static PyObject *_precomp_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef signed char signed_char;
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#define PRINTPYOBJERR(obj)\
+    fprintf(stderr,"_precomp.error is related to ");\
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+
+#define pyobj_from_int1(v) (PyLong_FromLong(v))
+/* See fortranobject.h for definitions. The macros here are provided for BC. */
+#define rank f2py_rank
+#define shape f2py_shape
+#define fshape f2py_shape
+#define len f2py_len
+#define flen f2py_flen
+#define slen f2py_slen
+#define size f2py_size
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(_precomp_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+/* New SciPy */
+#define TRYPYARRAYTEMPLATECHAR case NPY_STRING: *(char *)(PyArray_DATA(arr))=*v; break;
+#define TRYPYARRAYTEMPLATELONG case NPY_LONG: *(long *)(PyArray_DATA(arr))=*v; break;
+#define TRYPYARRAYTEMPLATEOBJECT case NPY_OBJECT: PyArray_SETITEM(arr,PyArray_DATA(arr),pyobj_from_ ## ctype ## 1(*v)); break;
+
+#define TRYPYARRAYTEMPLATE(ctype,typecode) \
+        PyArrayObject *arr = NULL;\
+        if (!obj) return -2;\
+        if (!PyArray_Check(obj)) return -1;\
+        if (!(arr=(PyArrayObject *)obj)) {fprintf(stderr,"TRYPYARRAYTEMPLATE:");PRINTPYOBJERR(obj);return 0;}\
+        if (PyArray_DESCR(arr)->type==typecode)  {*(ctype *)(PyArray_DATA(arr))=*v; return 1;}\
+        switch (PyArray_TYPE(arr)) {\
+                case NPY_DOUBLE: *(npy_double *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_INT: *(npy_int *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_LONG: *(npy_long *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_FLOAT: *(npy_float *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_CDOUBLE: *(npy_double *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_CFLOAT: *(npy_float *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_BOOL: *(npy_bool *)(PyArray_DATA(arr))=(*v!=0); break;\
+                case NPY_UBYTE: *(npy_ubyte *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_BYTE: *(npy_byte *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_SHORT: *(npy_short *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_USHORT: *(npy_ushort *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_UINT: *(npy_uint *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_ULONG: *(npy_ulong *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_LONGLONG: *(npy_longlong *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_ULONGLONG: *(npy_ulonglong *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_LONGDOUBLE: *(npy_longdouble *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_CLONGDOUBLE: *(npy_longdouble *)(PyArray_DATA(arr))=*v; break;\
+                case NPY_OBJECT: PyArray_SETITEM(arr, PyArray_DATA(arr), pyobj_from_ ## ctype ## 1(*v)); break;\
+        default: return -2;\
+        };\
+        return 1
+
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int
+double_from_pyobj(double* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+        *v = PyFloat_AsDouble(obj);
+        return !(*v == -1.0 && PyErr_Occurred());
+    }
+
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+        *v = PyFloat_AsDouble(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1.0 && PyErr_Occurred());
+    }
+
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
+
+    if (tmp) {
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = _precomp_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int
+int_from_pyobj(int* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+
+    if (PyLong_Check(obj)) {
+        *v = Npy__PyLong_AsInt(obj);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    tmp = PyNumber_Long(obj);
+    if (tmp) {
+        *v = Npy__PyLong_AsInt(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
+
+    if (tmp) {
+        if (int_from_pyobj(v, tmp, errmess)) {
+            Py_DECREF(tmp);
+            return 1;
+        }
+        Py_DECREF(tmp);
+    }
+
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err == NULL) {
+            err = _precomp_error;
+        }
+        PyErr_SetString(err, errmess);
+    }
+    return 0;
+}
+
+static int try_pyarr_from_int(PyObject* obj,int* v) {
+    TRYPYARRAYTEMPLATE(int,'i');
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/********************************* properties *********************************/
+static char doc_f2py_rout__precomp_precomp_properties[] = "\
+eifbar,eilbar,gjbar,eabar,eiflbar,sfbar,slbar,sftbar,sltbar,satbar,z_sc,y_sc,ztc_ref,ytc_ref,mass,area,iflap_eta,ilag_zeta,tw_iner,zcm_ref,ycm_ref = properties(chord,tw_aero_d,tw_prime_d,le_loc,xnode,ynode,e1,e2,g12,anu12,density,xsec_nodeu,n_laminau,n_pliesu,t_lamu,tht_lamu,mat_lamu,xsec_nodel,n_laminal,n_pliesl,t_laml,tht_laml,mat_laml,nweb,loc_web,n_laminaw,n_pliesw,t_lamw,tht_lamw,mat_lamw,[n_af_nodes,n_materials,n_sctu,n_sctl,nwebin,n_laminatotalu,n_laminatotall,n_laminatotalw])\n\nWrapper for ``properties``.\
+\n\nParameters\n----------\n"
+"chord : input float\n"
+"tw_aero_d : input float\n"
+"tw_prime_d : input float\n"
+"le_loc : input float\n"
+"xnode : input rank-1 array('d') with bounds (n_af_nodes)\n"
+"ynode : input rank-1 array('d') with bounds (n_af_nodes)\n"
+"e1 : input rank-1 array('d') with bounds (n_materials)\n"
+"e2 : input rank-1 array('d') with bounds (n_materials)\n"
+"g12 : input rank-1 array('d') with bounds (n_materials)\n"
+"anu12 : input rank-1 array('d') with bounds (n_materials)\n"
+"density : input rank-1 array('d') with bounds (n_materials)\n"
+"xsec_nodeu : input rank-1 array('d') with bounds (1 + n_sctu)\n"
+"n_laminau : input rank-1 array('i') with bounds (n_sctu)\n"
+"n_pliesu : input rank-1 array('i') with bounds (n_laminatotalu)\n"
+"t_lamu : input rank-1 array('d') with bounds (n_laminatotalu)\n"
+"tht_lamu : input rank-1 array('d') with bounds (n_laminatotalu)\n"
+"mat_lamu : input rank-1 array('i') with bounds (n_laminatotalu)\n"
+"xsec_nodel : input rank-1 array('d') with bounds (1 + n_sctl)\n"
+"n_laminal : input rank-1 array('i') with bounds (n_sctl)\n"
+"n_pliesl : input rank-1 array('i') with bounds (n_laminatotall)\n"
+"t_laml : input rank-1 array('d') with bounds (n_laminatotall)\n"
+"tht_laml : input rank-1 array('d') with bounds (n_laminatotall)\n"
+"mat_laml : input rank-1 array('i') with bounds (n_laminatotall)\n"
+"nweb : input int\n"
+"loc_web : input rank-1 array('d') with bounds (nwebin)\n"
+"n_laminaw : input rank-1 array('i') with bounds (nwebin)\n"
+"n_pliesw : input rank-1 array('i') with bounds (n_laminatotalw)\n"
+"t_lamw : input rank-1 array('d') with bounds (n_laminatotalw)\n"
+"tht_lamw : input rank-1 array('d') with bounds (n_laminatotalw)\n"
+"mat_lamw : input rank-1 array('i') with bounds (n_laminatotalw)\n"
+"\nOther Parameters\n----------------\n"
+"n_af_nodes : input int, optional\n    Default: shape(xnode, 0)\n"
+"n_materials : input int, optional\n    Default: shape(e1, 0)\n"
+"n_sctu : input int, optional\n    Default: -1 + shape(xsec_nodeu, 0)\n"
+"n_sctl : input int, optional\n    Default: -1 + shape(xsec_nodel, 0)\n"
+"nwebin : input int, optional\n    Default: shape(loc_web, 0)\n"
+"n_laminatotalu : input int, optional\n    Default: shape(n_pliesu, 0)\n"
+"n_laminatotall : input int, optional\n    Default: shape(n_pliesl, 0)\n"
+"n_laminatotalw : input int, optional\n    Default: shape(n_pliesw, 0)\n"
+"\nReturns\n-------\n"
+"eifbar : float\n"
+"eilbar : float\n"
+"gjbar : float\n"
+"eabar : float\n"
+"eiflbar : float\n"
+"sfbar : float\n"
+"slbar : float\n"
+"sftbar : float\n"
+"sltbar : float\n"
+"satbar : float\n"
+"z_sc : float\n"
+"y_sc : float\n"
+"ztc_ref : float\n"
+"ytc_ref : float\n"
+"mass : float\n"
+"area : float\n"
+"iflap_eta : float\n"
+"ilag_zeta : float\n"
+"tw_iner : float\n"
+"zcm_ref : float\n"
+"ycm_ref : float";
+/*  */
+static PyObject *f2py_rout__precomp_precomp_properties(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int*,double*,double*,int*,double*,int*,int*,double*,double*,int*,int*,double*,int*,int*,double*,double*,int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int*,int*,int*,int*,int*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    double chord = 0;
+    PyObject *chord_capi = Py_None;
+    double tw_aero_d = 0;
+    PyObject *tw_aero_d_capi = Py_None;
+    double tw_prime_d = 0;
+    PyObject *tw_prime_d_capi = Py_None;
+    double le_loc = 0;
+    PyObject *le_loc_capi = Py_None;
+    double *xnode = NULL;
+    npy_intp xnode_Dims[1] = {-1};
+    const int xnode_Rank = 1;
+    PyArrayObject *capi_xnode_as_array = NULL;
+    int capi_xnode_intent = 0;
+    PyObject *xnode_capi = Py_None;
+    double *ynode = NULL;
+    npy_intp ynode_Dims[1] = {-1};
+    const int ynode_Rank = 1;
+    PyArrayObject *capi_ynode_as_array = NULL;
+    int capi_ynode_intent = 0;
+    PyObject *ynode_capi = Py_None;
+    double *e1 = NULL;
+    npy_intp e1_Dims[1] = {-1};
+    const int e1_Rank = 1;
+    PyArrayObject *capi_e1_as_array = NULL;
+    int capi_e1_intent = 0;
+    PyObject *e1_capi = Py_None;
+    double *e2 = NULL;
+    npy_intp e2_Dims[1] = {-1};
+    const int e2_Rank = 1;
+    PyArrayObject *capi_e2_as_array = NULL;
+    int capi_e2_intent = 0;
+    PyObject *e2_capi = Py_None;
+    double *g12 = NULL;
+    npy_intp g12_Dims[1] = {-1};
+    const int g12_Rank = 1;
+    PyArrayObject *capi_g12_as_array = NULL;
+    int capi_g12_intent = 0;
+    PyObject *g12_capi = Py_None;
+    double *anu12 = NULL;
+    npy_intp anu12_Dims[1] = {-1};
+    const int anu12_Rank = 1;
+    PyArrayObject *capi_anu12_as_array = NULL;
+    int capi_anu12_intent = 0;
+    PyObject *anu12_capi = Py_None;
+    double *density = NULL;
+    npy_intp density_Dims[1] = {-1};
+    const int density_Rank = 1;
+    PyArrayObject *capi_density_as_array = NULL;
+    int capi_density_intent = 0;
+    PyObject *density_capi = Py_None;
+    double *xsec_nodeu = NULL;
+    npy_intp xsec_nodeu_Dims[1] = {-1};
+    const int xsec_nodeu_Rank = 1;
+    PyArrayObject *capi_xsec_nodeu_as_array = NULL;
+    int capi_xsec_nodeu_intent = 0;
+    PyObject *xsec_nodeu_capi = Py_None;
+    int *n_laminau = NULL;
+    npy_intp n_laminau_Dims[1] = {-1};
+    const int n_laminau_Rank = 1;
+    PyArrayObject *capi_n_laminau_as_array = NULL;
+    int capi_n_laminau_intent = 0;
+    PyObject *n_laminau_capi = Py_None;
+    int *n_pliesu = NULL;
+    npy_intp n_pliesu_Dims[1] = {-1};
+    const int n_pliesu_Rank = 1;
+    PyArrayObject *capi_n_pliesu_as_array = NULL;
+    int capi_n_pliesu_intent = 0;
+    PyObject *n_pliesu_capi = Py_None;
+    double *t_lamu = NULL;
+    npy_intp t_lamu_Dims[1] = {-1};
+    const int t_lamu_Rank = 1;
+    PyArrayObject *capi_t_lamu_as_array = NULL;
+    int capi_t_lamu_intent = 0;
+    PyObject *t_lamu_capi = Py_None;
+    double *tht_lamu = NULL;
+    npy_intp tht_lamu_Dims[1] = {-1};
+    const int tht_lamu_Rank = 1;
+    PyArrayObject *capi_tht_lamu_as_array = NULL;
+    int capi_tht_lamu_intent = 0;
+    PyObject *tht_lamu_capi = Py_None;
+    int *mat_lamu = NULL;
+    npy_intp mat_lamu_Dims[1] = {-1};
+    const int mat_lamu_Rank = 1;
+    PyArrayObject *capi_mat_lamu_as_array = NULL;
+    int capi_mat_lamu_intent = 0;
+    PyObject *mat_lamu_capi = Py_None;
+    double *xsec_nodel = NULL;
+    npy_intp xsec_nodel_Dims[1] = {-1};
+    const int xsec_nodel_Rank = 1;
+    PyArrayObject *capi_xsec_nodel_as_array = NULL;
+    int capi_xsec_nodel_intent = 0;
+    PyObject *xsec_nodel_capi = Py_None;
+    int *n_laminal = NULL;
+    npy_intp n_laminal_Dims[1] = {-1};
+    const int n_laminal_Rank = 1;
+    PyArrayObject *capi_n_laminal_as_array = NULL;
+    int capi_n_laminal_intent = 0;
+    PyObject *n_laminal_capi = Py_None;
+    int *n_pliesl = NULL;
+    npy_intp n_pliesl_Dims[1] = {-1};
+    const int n_pliesl_Rank = 1;
+    PyArrayObject *capi_n_pliesl_as_array = NULL;
+    int capi_n_pliesl_intent = 0;
+    PyObject *n_pliesl_capi = Py_None;
+    double *t_laml = NULL;
+    npy_intp t_laml_Dims[1] = {-1};
+    const int t_laml_Rank = 1;
+    PyArrayObject *capi_t_laml_as_array = NULL;
+    int capi_t_laml_intent = 0;
+    PyObject *t_laml_capi = Py_None;
+    double *tht_laml = NULL;
+    npy_intp tht_laml_Dims[1] = {-1};
+    const int tht_laml_Rank = 1;
+    PyArrayObject *capi_tht_laml_as_array = NULL;
+    int capi_tht_laml_intent = 0;
+    PyObject *tht_laml_capi = Py_None;
+    int *mat_laml = NULL;
+    npy_intp mat_laml_Dims[1] = {-1};
+    const int mat_laml_Rank = 1;
+    PyArrayObject *capi_mat_laml_as_array = NULL;
+    int capi_mat_laml_intent = 0;
+    PyObject *mat_laml_capi = Py_None;
+    int nweb = 0;
+    PyObject *nweb_capi = Py_None;
+    double *loc_web = NULL;
+    npy_intp loc_web_Dims[1] = {-1};
+    const int loc_web_Rank = 1;
+    PyArrayObject *capi_loc_web_as_array = NULL;
+    int capi_loc_web_intent = 0;
+    PyObject *loc_web_capi = Py_None;
+    int *n_laminaw = NULL;
+    npy_intp n_laminaw_Dims[1] = {-1};
+    const int n_laminaw_Rank = 1;
+    PyArrayObject *capi_n_laminaw_as_array = NULL;
+    int capi_n_laminaw_intent = 0;
+    PyObject *n_laminaw_capi = Py_None;
+    int *n_pliesw = NULL;
+    npy_intp n_pliesw_Dims[1] = {-1};
+    const int n_pliesw_Rank = 1;
+    PyArrayObject *capi_n_pliesw_as_array = NULL;
+    int capi_n_pliesw_intent = 0;
+    PyObject *n_pliesw_capi = Py_None;
+    double *t_lamw = NULL;
+    npy_intp t_lamw_Dims[1] = {-1};
+    const int t_lamw_Rank = 1;
+    PyArrayObject *capi_t_lamw_as_array = NULL;
+    int capi_t_lamw_intent = 0;
+    PyObject *t_lamw_capi = Py_None;
+    double *tht_lamw = NULL;
+    npy_intp tht_lamw_Dims[1] = {-1};
+    const int tht_lamw_Rank = 1;
+    PyArrayObject *capi_tht_lamw_as_array = NULL;
+    int capi_tht_lamw_intent = 0;
+    PyObject *tht_lamw_capi = Py_None;
+    int *mat_lamw = NULL;
+    npy_intp mat_lamw_Dims[1] = {-1};
+    const int mat_lamw_Rank = 1;
+    PyArrayObject *capi_mat_lamw_as_array = NULL;
+    int capi_mat_lamw_intent = 0;
+    PyObject *mat_lamw_capi = Py_None;
+    double eifbar = 0;
+    double eilbar = 0;
+    double gjbar = 0;
+    double eabar = 0;
+    double eiflbar = 0;
+    double sfbar = 0;
+    double slbar = 0;
+    double sftbar = 0;
+    double sltbar = 0;
+    double satbar = 0;
+    double z_sc = 0;
+    double y_sc = 0;
+    double ztc_ref = 0;
+    double ytc_ref = 0;
+    double mass = 0;
+    double area = 0;
+    double iflap_eta = 0;
+    double ilag_zeta = 0;
+    double tw_iner = 0;
+    double zcm_ref = 0;
+    double ycm_ref = 0;
+    int n_af_nodes = 0;
+    PyObject *n_af_nodes_capi = Py_None;
+    int n_materials = 0;
+    PyObject *n_materials_capi = Py_None;
+    int n_sctu = 0;
+    PyObject *n_sctu_capi = Py_None;
+    int n_sctl = 0;
+    PyObject *n_sctl_capi = Py_None;
+    int nwebin = 0;
+    PyObject *nwebin_capi = Py_None;
+    int n_laminatotalu = 0;
+    PyObject *n_laminatotalu_capi = Py_None;
+    int n_laminatotall = 0;
+    PyObject *n_laminatotall_capi = Py_None;
+    int n_laminatotalw = 0;
+    PyObject *n_laminatotalw_capi = Py_None;
+    static char *capi_kwlist[] = {"chord","tw_aero_d","tw_prime_d","le_loc","xnode","ynode","e1","e2","g12","anu12","density","xsec_nodeu","n_laminau","n_pliesu","t_lamu","tht_lamu","mat_lamu","xsec_nodel","n_laminal","n_pliesl","t_laml","tht_laml","mat_laml","nweb","loc_web","n_laminaw","n_pliesw","t_lamw","tht_lamw","mat_lamw","n_af_nodes","n_materials","n_sctu","n_sctl","nwebin","n_laminatotalu","n_laminatotall","n_laminatotalw",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOOOOOOOOOOOOOOOOOOOOOOOO|OOOOOOOO:_precomp.precomp.properties",\
+        capi_kwlist,&chord_capi,&tw_aero_d_capi,&tw_prime_d_capi,&le_loc_capi,&xnode_capi,&ynode_capi,&e1_capi,&e2_capi,&g12_capi,&anu12_capi,&density_capi,&xsec_nodeu_capi,&n_laminau_capi,&n_pliesu_capi,&t_lamu_capi,&tht_lamu_capi,&mat_lamu_capi,&xsec_nodel_capi,&n_laminal_capi,&n_pliesl_capi,&t_laml_capi,&tht_laml_capi,&mat_laml_capi,&nweb_capi,&loc_web_capi,&n_laminaw_capi,&n_pliesw_capi,&t_lamw_capi,&tht_lamw_capi,&mat_lamw_capi,&n_af_nodes_capi,&n_materials_capi,&n_sctu_capi,&n_sctl_capi,&nwebin_capi,&n_laminatotalu_capi,&n_laminatotall_capi,&n_laminatotalw_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable chord */
+        f2py_success = double_from_pyobj(&chord,chord_capi,"_precomp.precomp.properties() 1st argument (chord) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable tw_aero_d */
+        f2py_success = double_from_pyobj(&tw_aero_d,tw_aero_d_capi,"_precomp.precomp.properties() 2nd argument (tw_aero_d) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable tw_prime_d */
+        f2py_success = double_from_pyobj(&tw_prime_d,tw_prime_d_capi,"_precomp.precomp.properties() 3rd argument (tw_prime_d) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable le_loc */
+        f2py_success = double_from_pyobj(&le_loc,le_loc_capi,"_precomp.precomp.properties() 4th argument (le_loc) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable xnode */
+    ;
+    capi_xnode_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 5th argument `xnode`";
+    capi_xnode_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,xnode_Dims,xnode_Rank,  capi_xnode_intent,xnode_capi,capi_errmess);
+    if (capi_xnode_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        xnode = (double *)(PyArray_DATA(capi_xnode_as_array));
+
+    /* Processing variable e1 */
+    ;
+    capi_e1_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 7th argument `e1`";
+    capi_e1_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,e1_Dims,e1_Rank,  capi_e1_intent,e1_capi,capi_errmess);
+    if (capi_e1_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        e1 = (double *)(PyArray_DATA(capi_e1_as_array));
+
+    /* Processing variable xsec_nodeu */
+    ;
+    capi_xsec_nodeu_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 12nd argument `xsec_nodeu`";
+    capi_xsec_nodeu_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,xsec_nodeu_Dims,xsec_nodeu_Rank,  capi_xsec_nodeu_intent,xsec_nodeu_capi,capi_errmess);
+    if (capi_xsec_nodeu_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        xsec_nodeu = (double *)(PyArray_DATA(capi_xsec_nodeu_as_array));
+
+    /* Processing variable n_pliesu */
+    ;
+    capi_n_pliesu_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 14th argument `n_pliesu`";
+    capi_n_pliesu_as_array = ndarray_from_pyobj(  NPY_INT,1,n_pliesu_Dims,n_pliesu_Rank,  capi_n_pliesu_intent,n_pliesu_capi,capi_errmess);
+    if (capi_n_pliesu_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        n_pliesu = (int *)(PyArray_DATA(capi_n_pliesu_as_array));
+
+    /* Processing variable xsec_nodel */
+    ;
+    capi_xsec_nodel_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 18th argument `xsec_nodel`";
+    capi_xsec_nodel_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,xsec_nodel_Dims,xsec_nodel_Rank,  capi_xsec_nodel_intent,xsec_nodel_capi,capi_errmess);
+    if (capi_xsec_nodel_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        xsec_nodel = (double *)(PyArray_DATA(capi_xsec_nodel_as_array));
+
+    /* Processing variable n_pliesl */
+    ;
+    capi_n_pliesl_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 20th argument `n_pliesl`";
+    capi_n_pliesl_as_array = ndarray_from_pyobj(  NPY_INT,1,n_pliesl_Dims,n_pliesl_Rank,  capi_n_pliesl_intent,n_pliesl_capi,capi_errmess);
+    if (capi_n_pliesl_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        n_pliesl = (int *)(PyArray_DATA(capi_n_pliesl_as_array));
+
+    /* Processing variable nweb */
+        f2py_success = int_from_pyobj(&nweb,nweb_capi,"_precomp.precomp.properties() 24th argument (nweb) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable loc_web */
+    ;
+    capi_loc_web_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 25th argument `loc_web`";
+    capi_loc_web_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,loc_web_Dims,loc_web_Rank,  capi_loc_web_intent,loc_web_capi,capi_errmess);
+    if (capi_loc_web_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        loc_web = (double *)(PyArray_DATA(capi_loc_web_as_array));
+
+    /* Processing variable n_pliesw */
+    ;
+    capi_n_pliesw_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 27th argument `n_pliesw`";
+    capi_n_pliesw_as_array = ndarray_from_pyobj(  NPY_INT,1,n_pliesw_Dims,n_pliesw_Rank,  capi_n_pliesw_intent,n_pliesw_capi,capi_errmess);
+    if (capi_n_pliesw_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        n_pliesw = (int *)(PyArray_DATA(capi_n_pliesw_as_array));
+
+    /* Processing variable eifbar */
+    /* Processing variable eilbar */
+    /* Processing variable gjbar */
+    /* Processing variable eabar */
+    /* Processing variable eiflbar */
+    /* Processing variable sfbar */
+    /* Processing variable slbar */
+    /* Processing variable sftbar */
+    /* Processing variable sltbar */
+    /* Processing variable satbar */
+    /* Processing variable z_sc */
+    /* Processing variable y_sc */
+    /* Processing variable ztc_ref */
+    /* Processing variable ytc_ref */
+    /* Processing variable mass */
+    /* Processing variable area */
+    /* Processing variable iflap_eta */
+    /* Processing variable ilag_zeta */
+    /* Processing variable tw_iner */
+    /* Processing variable zcm_ref */
+    /* Processing variable ycm_ref */
+    /* Processing variable n_af_nodes */
+    if (n_af_nodes_capi == Py_None) n_af_nodes = shape(xnode, 0); else
+        f2py_success = int_from_pyobj(&n_af_nodes,n_af_nodes_capi,"_precomp.precomp.properties() 1st keyword (n_af_nodes) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(xnode, 0) == n_af_nodes,"shape(xnode, 0) == n_af_nodes","1st keyword n_af_nodes","properties:n_af_nodes=%d",n_af_nodes) {
+    /* Processing variable n_materials */
+    if (n_materials_capi == Py_None) n_materials = shape(e1, 0); else
+        f2py_success = int_from_pyobj(&n_materials,n_materials_capi,"_precomp.precomp.properties() 2nd keyword (n_materials) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(e1, 0) == n_materials,"shape(e1, 0) == n_materials","2nd keyword n_materials","properties:n_materials=%d",n_materials) {
+    /* Processing variable n_sctu */
+    if (n_sctu_capi == Py_None) n_sctu = -1 + shape(xsec_nodeu, 0); else
+        f2py_success = int_from_pyobj(&n_sctu,n_sctu_capi,"_precomp.precomp.properties() 3rd keyword (n_sctu) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(xsec_nodeu, 0) == 1 + n_sctu,"shape(xsec_nodeu, 0) == 1 + n_sctu","3rd keyword n_sctu","properties:n_sctu=%d",n_sctu) {
+    /* Processing variable n_sctl */
+    if (n_sctl_capi == Py_None) n_sctl = -1 + shape(xsec_nodel, 0); else
+        f2py_success = int_from_pyobj(&n_sctl,n_sctl_capi,"_precomp.precomp.properties() 4th keyword (n_sctl) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(xsec_nodel, 0) == 1 + n_sctl,"shape(xsec_nodel, 0) == 1 + n_sctl","4th keyword n_sctl","properties:n_sctl=%d",n_sctl) {
+    /* Processing variable nwebin */
+    if (nwebin_capi == Py_None) nwebin = shape(loc_web, 0); else
+        f2py_success = int_from_pyobj(&nwebin,nwebin_capi,"_precomp.precomp.properties() 5th keyword (nwebin) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(loc_web, 0) == nwebin,"shape(loc_web, 0) == nwebin","5th keyword nwebin","properties:nwebin=%d",nwebin) {
+    /* Processing variable n_laminatotalu */
+    if (n_laminatotalu_capi == Py_None) n_laminatotalu = shape(n_pliesu, 0); else
+        f2py_success = int_from_pyobj(&n_laminatotalu,n_laminatotalu_capi,"_precomp.precomp.properties() 6th keyword (n_laminatotalu) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(n_pliesu, 0) == n_laminatotalu,"shape(n_pliesu, 0) == n_laminatotalu","6th keyword n_laminatotalu","properties:n_laminatotalu=%d",n_laminatotalu) {
+    /* Processing variable n_laminatotall */
+    if (n_laminatotall_capi == Py_None) n_laminatotall = shape(n_pliesl, 0); else
+        f2py_success = int_from_pyobj(&n_laminatotall,n_laminatotall_capi,"_precomp.precomp.properties() 7th keyword (n_laminatotall) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(n_pliesl, 0) == n_laminatotall,"shape(n_pliesl, 0) == n_laminatotall","7th keyword n_laminatotall","properties:n_laminatotall=%d",n_laminatotall) {
+    /* Processing variable n_laminatotalw */
+    if (n_laminatotalw_capi == Py_None) n_laminatotalw = shape(n_pliesw, 0); else
+        f2py_success = int_from_pyobj(&n_laminatotalw,n_laminatotalw_capi,"_precomp.precomp.properties() 8th keyword (n_laminatotalw) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(n_pliesw, 0) == n_laminatotalw,"shape(n_pliesw, 0) == n_laminatotalw","8th keyword n_laminatotalw","properties:n_laminatotalw=%d",n_laminatotalw) {
+    /* Processing variable ynode */
+    ynode_Dims[0]=n_af_nodes;
+    capi_ynode_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 6th argument `ynode`";
+    capi_ynode_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,ynode_Dims,ynode_Rank,  capi_ynode_intent,ynode_capi,capi_errmess);
+    if (capi_ynode_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        ynode = (double *)(PyArray_DATA(capi_ynode_as_array));
+
+    /* Processing variable e2 */
+    e2_Dims[0]=n_materials;
+    capi_e2_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 8th argument `e2`";
+    capi_e2_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,e2_Dims,e2_Rank,  capi_e2_intent,e2_capi,capi_errmess);
+    if (capi_e2_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        e2 = (double *)(PyArray_DATA(capi_e2_as_array));
+
+    /* Processing variable g12 */
+    g12_Dims[0]=n_materials;
+    capi_g12_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 9th argument `g12`";
+    capi_g12_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,g12_Dims,g12_Rank,  capi_g12_intent,g12_capi,capi_errmess);
+    if (capi_g12_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        g12 = (double *)(PyArray_DATA(capi_g12_as_array));
+
+    /* Processing variable anu12 */
+    anu12_Dims[0]=n_materials;
+    capi_anu12_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 10th argument `anu12`";
+    capi_anu12_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,anu12_Dims,anu12_Rank,  capi_anu12_intent,anu12_capi,capi_errmess);
+    if (capi_anu12_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        anu12 = (double *)(PyArray_DATA(capi_anu12_as_array));
+
+    /* Processing variable density */
+    density_Dims[0]=n_materials;
+    capi_density_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 11st argument `density`";
+    capi_density_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,density_Dims,density_Rank,  capi_density_intent,density_capi,capi_errmess);
+    if (capi_density_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        density = (double *)(PyArray_DATA(capi_density_as_array));
+
+    /* Processing variable n_laminau */
+    n_laminau_Dims[0]=n_sctu;
+    capi_n_laminau_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 13rd argument `n_laminau`";
+    capi_n_laminau_as_array = ndarray_from_pyobj(  NPY_INT,1,n_laminau_Dims,n_laminau_Rank,  capi_n_laminau_intent,n_laminau_capi,capi_errmess);
+    if (capi_n_laminau_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        n_laminau = (int *)(PyArray_DATA(capi_n_laminau_as_array));
+
+    /* Processing variable mat_lamu */
+    mat_lamu_Dims[0]=n_laminatotalu;
+    capi_mat_lamu_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 17th argument `mat_lamu`";
+    capi_mat_lamu_as_array = ndarray_from_pyobj(  NPY_INT,1,mat_lamu_Dims,mat_lamu_Rank,  capi_mat_lamu_intent,mat_lamu_capi,capi_errmess);
+    if (capi_mat_lamu_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        mat_lamu = (int *)(PyArray_DATA(capi_mat_lamu_as_array));
+
+    /* Processing variable t_lamu */
+    t_lamu_Dims[0]=n_laminatotalu;
+    capi_t_lamu_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 15th argument `t_lamu`";
+    capi_t_lamu_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,t_lamu_Dims,t_lamu_Rank,  capi_t_lamu_intent,t_lamu_capi,capi_errmess);
+    if (capi_t_lamu_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        t_lamu = (double *)(PyArray_DATA(capi_t_lamu_as_array));
+
+    /* Processing variable tht_lamu */
+    tht_lamu_Dims[0]=n_laminatotalu;
+    capi_tht_lamu_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 16th argument `tht_lamu`";
+    capi_tht_lamu_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,tht_lamu_Dims,tht_lamu_Rank,  capi_tht_lamu_intent,tht_lamu_capi,capi_errmess);
+    if (capi_tht_lamu_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        tht_lamu = (double *)(PyArray_DATA(capi_tht_lamu_as_array));
+
+    /* Processing variable n_laminal */
+    n_laminal_Dims[0]=n_sctl;
+    capi_n_laminal_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 19th argument `n_laminal`";
+    capi_n_laminal_as_array = ndarray_from_pyobj(  NPY_INT,1,n_laminal_Dims,n_laminal_Rank,  capi_n_laminal_intent,n_laminal_capi,capi_errmess);
+    if (capi_n_laminal_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        n_laminal = (int *)(PyArray_DATA(capi_n_laminal_as_array));
+
+    /* Processing variable mat_laml */
+    mat_laml_Dims[0]=n_laminatotall;
+    capi_mat_laml_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 23rd argument `mat_laml`";
+    capi_mat_laml_as_array = ndarray_from_pyobj(  NPY_INT,1,mat_laml_Dims,mat_laml_Rank,  capi_mat_laml_intent,mat_laml_capi,capi_errmess);
+    if (capi_mat_laml_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        mat_laml = (int *)(PyArray_DATA(capi_mat_laml_as_array));
+
+    /* Processing variable t_laml */
+    t_laml_Dims[0]=n_laminatotall;
+    capi_t_laml_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 21st argument `t_laml`";
+    capi_t_laml_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,t_laml_Dims,t_laml_Rank,  capi_t_laml_intent,t_laml_capi,capi_errmess);
+    if (capi_t_laml_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        t_laml = (double *)(PyArray_DATA(capi_t_laml_as_array));
+
+    /* Processing variable tht_laml */
+    tht_laml_Dims[0]=n_laminatotall;
+    capi_tht_laml_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 22nd argument `tht_laml`";
+    capi_tht_laml_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,tht_laml_Dims,tht_laml_Rank,  capi_tht_laml_intent,tht_laml_capi,capi_errmess);
+    if (capi_tht_laml_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        tht_laml = (double *)(PyArray_DATA(capi_tht_laml_as_array));
+
+    /* Processing variable n_laminaw */
+    n_laminaw_Dims[0]=nwebin;
+    capi_n_laminaw_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 26th argument `n_laminaw`";
+    capi_n_laminaw_as_array = ndarray_from_pyobj(  NPY_INT,1,n_laminaw_Dims,n_laminaw_Rank,  capi_n_laminaw_intent,n_laminaw_capi,capi_errmess);
+    if (capi_n_laminaw_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        n_laminaw = (int *)(PyArray_DATA(capi_n_laminaw_as_array));
+
+    /* Processing variable mat_lamw */
+    mat_lamw_Dims[0]=n_laminatotalw;
+    capi_mat_lamw_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 30th argument `mat_lamw`";
+    capi_mat_lamw_as_array = ndarray_from_pyobj(  NPY_INT,1,mat_lamw_Dims,mat_lamw_Rank,  capi_mat_lamw_intent,mat_lamw_capi,capi_errmess);
+    if (capi_mat_lamw_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        mat_lamw = (int *)(PyArray_DATA(capi_mat_lamw_as_array));
+
+    /* Processing variable t_lamw */
+    t_lamw_Dims[0]=n_laminatotalw;
+    capi_t_lamw_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 28th argument `t_lamw`";
+    capi_t_lamw_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,t_lamw_Dims,t_lamw_Rank,  capi_t_lamw_intent,t_lamw_capi,capi_errmess);
+    if (capi_t_lamw_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        t_lamw = (double *)(PyArray_DATA(capi_t_lamw_as_array));
+
+    /* Processing variable tht_lamw */
+    tht_lamw_Dims[0]=n_laminatotalw;
+    capi_tht_lamw_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.properties: failed to create array from the 29th argument `tht_lamw`";
+    capi_tht_lamw_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,tht_lamw_Dims,tht_lamw_Rank,  capi_tht_lamw_intent,tht_lamw_capi,capi_errmess);
+    if (capi_tht_lamw_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        tht_lamw = (double *)(PyArray_DATA(capi_tht_lamw_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&chord,&tw_aero_d,&tw_prime_d,&le_loc,xnode,ynode,e1,e2,g12,anu12,density,xsec_nodeu,n_laminau,n_pliesu,t_lamu,tht_lamu,mat_lamu,xsec_nodel,n_laminal,n_pliesl,t_laml,tht_laml,mat_laml,&nweb,loc_web,n_laminaw,n_pliesw,t_lamw,tht_lamw,mat_lamw,&eifbar,&eilbar,&gjbar,&eabar,&eiflbar,&sfbar,&slbar,&sftbar,&sltbar,&satbar,&z_sc,&y_sc,&ztc_ref,&ytc_ref,&mass,&area,&iflap_eta,&ilag_zeta,&tw_iner,&zcm_ref,&ycm_ref,&n_af_nodes,&n_materials,&n_sctu,&n_sctl,&nwebin,&n_laminatotalu,&n_laminatotall,&n_laminatotalw);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("ddddddddddddddddddddd",eifbar,eilbar,gjbar,eabar,eiflbar,sfbar,slbar,sftbar,sltbar,satbar,z_sc,y_sc,ztc_ref,ytc_ref,mass,area,iflap_eta,ilag_zeta,tw_iner,zcm_ref,ycm_ref);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    if((PyObject *)capi_tht_lamw_as_array!=tht_lamw_capi) {
+        Py_XDECREF(capi_tht_lamw_as_array); }
+    }  /* if (capi_tht_lamw_as_array == NULL) ... else of tht_lamw */
+    /* End of cleaning variable tht_lamw */
+    if((PyObject *)capi_t_lamw_as_array!=t_lamw_capi) {
+        Py_XDECREF(capi_t_lamw_as_array); }
+    }  /* if (capi_t_lamw_as_array == NULL) ... else of t_lamw */
+    /* End of cleaning variable t_lamw */
+    if((PyObject *)capi_mat_lamw_as_array!=mat_lamw_capi) {
+        Py_XDECREF(capi_mat_lamw_as_array); }
+    }  /* if (capi_mat_lamw_as_array == NULL) ... else of mat_lamw */
+    /* End of cleaning variable mat_lamw */
+    if((PyObject *)capi_n_laminaw_as_array!=n_laminaw_capi) {
+        Py_XDECREF(capi_n_laminaw_as_array); }
+    }  /* if (capi_n_laminaw_as_array == NULL) ... else of n_laminaw */
+    /* End of cleaning variable n_laminaw */
+    if((PyObject *)capi_tht_laml_as_array!=tht_laml_capi) {
+        Py_XDECREF(capi_tht_laml_as_array); }
+    }  /* if (capi_tht_laml_as_array == NULL) ... else of tht_laml */
+    /* End of cleaning variable tht_laml */
+    if((PyObject *)capi_t_laml_as_array!=t_laml_capi) {
+        Py_XDECREF(capi_t_laml_as_array); }
+    }  /* if (capi_t_laml_as_array == NULL) ... else of t_laml */
+    /* End of cleaning variable t_laml */
+    if((PyObject *)capi_mat_laml_as_array!=mat_laml_capi) {
+        Py_XDECREF(capi_mat_laml_as_array); }
+    }  /* if (capi_mat_laml_as_array == NULL) ... else of mat_laml */
+    /* End of cleaning variable mat_laml */
+    if((PyObject *)capi_n_laminal_as_array!=n_laminal_capi) {
+        Py_XDECREF(capi_n_laminal_as_array); }
+    }  /* if (capi_n_laminal_as_array == NULL) ... else of n_laminal */
+    /* End of cleaning variable n_laminal */
+    if((PyObject *)capi_tht_lamu_as_array!=tht_lamu_capi) {
+        Py_XDECREF(capi_tht_lamu_as_array); }
+    }  /* if (capi_tht_lamu_as_array == NULL) ... else of tht_lamu */
+    /* End of cleaning variable tht_lamu */
+    if((PyObject *)capi_t_lamu_as_array!=t_lamu_capi) {
+        Py_XDECREF(capi_t_lamu_as_array); }
+    }  /* if (capi_t_lamu_as_array == NULL) ... else of t_lamu */
+    /* End of cleaning variable t_lamu */
+    if((PyObject *)capi_mat_lamu_as_array!=mat_lamu_capi) {
+        Py_XDECREF(capi_mat_lamu_as_array); }
+    }  /* if (capi_mat_lamu_as_array == NULL) ... else of mat_lamu */
+    /* End of cleaning variable mat_lamu */
+    if((PyObject *)capi_n_laminau_as_array!=n_laminau_capi) {
+        Py_XDECREF(capi_n_laminau_as_array); }
+    }  /* if (capi_n_laminau_as_array == NULL) ... else of n_laminau */
+    /* End of cleaning variable n_laminau */
+    if((PyObject *)capi_density_as_array!=density_capi) {
+        Py_XDECREF(capi_density_as_array); }
+    }  /* if (capi_density_as_array == NULL) ... else of density */
+    /* End of cleaning variable density */
+    if((PyObject *)capi_anu12_as_array!=anu12_capi) {
+        Py_XDECREF(capi_anu12_as_array); }
+    }  /* if (capi_anu12_as_array == NULL) ... else of anu12 */
+    /* End of cleaning variable anu12 */
+    if((PyObject *)capi_g12_as_array!=g12_capi) {
+        Py_XDECREF(capi_g12_as_array); }
+    }  /* if (capi_g12_as_array == NULL) ... else of g12 */
+    /* End of cleaning variable g12 */
+    if((PyObject *)capi_e2_as_array!=e2_capi) {
+        Py_XDECREF(capi_e2_as_array); }
+    }  /* if (capi_e2_as_array == NULL) ... else of e2 */
+    /* End of cleaning variable e2 */
+    if((PyObject *)capi_ynode_as_array!=ynode_capi) {
+        Py_XDECREF(capi_ynode_as_array); }
+    }  /* if (capi_ynode_as_array == NULL) ... else of ynode */
+    /* End of cleaning variable ynode */
+    } /*CHECKSCALAR(shape(n_pliesw, 0) == n_laminatotalw)*/
+    } /*if (f2py_success) of n_laminatotalw*/
+    /* End of cleaning variable n_laminatotalw */
+    } /*CHECKSCALAR(shape(n_pliesl, 0) == n_laminatotall)*/
+    } /*if (f2py_success) of n_laminatotall*/
+    /* End of cleaning variable n_laminatotall */
+    } /*CHECKSCALAR(shape(n_pliesu, 0) == n_laminatotalu)*/
+    } /*if (f2py_success) of n_laminatotalu*/
+    /* End of cleaning variable n_laminatotalu */
+    } /*CHECKSCALAR(shape(loc_web, 0) == nwebin)*/
+    } /*if (f2py_success) of nwebin*/
+    /* End of cleaning variable nwebin */
+    } /*CHECKSCALAR(shape(xsec_nodel, 0) == 1 + n_sctl)*/
+    } /*if (f2py_success) of n_sctl*/
+    /* End of cleaning variable n_sctl */
+    } /*CHECKSCALAR(shape(xsec_nodeu, 0) == 1 + n_sctu)*/
+    } /*if (f2py_success) of n_sctu*/
+    /* End of cleaning variable n_sctu */
+    } /*CHECKSCALAR(shape(e1, 0) == n_materials)*/
+    } /*if (f2py_success) of n_materials*/
+    /* End of cleaning variable n_materials */
+    } /*CHECKSCALAR(shape(xnode, 0) == n_af_nodes)*/
+    } /*if (f2py_success) of n_af_nodes*/
+    /* End of cleaning variable n_af_nodes */
+    /* End of cleaning variable ycm_ref */
+    /* End of cleaning variable zcm_ref */
+    /* End of cleaning variable tw_iner */
+    /* End of cleaning variable ilag_zeta */
+    /* End of cleaning variable iflap_eta */
+    /* End of cleaning variable area */
+    /* End of cleaning variable mass */
+    /* End of cleaning variable ytc_ref */
+    /* End of cleaning variable ztc_ref */
+    /* End of cleaning variable y_sc */
+    /* End of cleaning variable z_sc */
+    /* End of cleaning variable satbar */
+    /* End of cleaning variable sltbar */
+    /* End of cleaning variable sftbar */
+    /* End of cleaning variable slbar */
+    /* End of cleaning variable sfbar */
+    /* End of cleaning variable eiflbar */
+    /* End of cleaning variable eabar */
+    /* End of cleaning variable gjbar */
+    /* End of cleaning variable eilbar */
+    /* End of cleaning variable eifbar */
+    if((PyObject *)capi_n_pliesw_as_array!=n_pliesw_capi) {
+        Py_XDECREF(capi_n_pliesw_as_array); }
+    }  /* if (capi_n_pliesw_as_array == NULL) ... else of n_pliesw */
+    /* End of cleaning variable n_pliesw */
+    if((PyObject *)capi_loc_web_as_array!=loc_web_capi) {
+        Py_XDECREF(capi_loc_web_as_array); }
+    }  /* if (capi_loc_web_as_array == NULL) ... else of loc_web */
+    /* End of cleaning variable loc_web */
+    } /*if (f2py_success) of nweb*/
+    /* End of cleaning variable nweb */
+    if((PyObject *)capi_n_pliesl_as_array!=n_pliesl_capi) {
+        Py_XDECREF(capi_n_pliesl_as_array); }
+    }  /* if (capi_n_pliesl_as_array == NULL) ... else of n_pliesl */
+    /* End of cleaning variable n_pliesl */
+    if((PyObject *)capi_xsec_nodel_as_array!=xsec_nodel_capi) {
+        Py_XDECREF(capi_xsec_nodel_as_array); }
+    }  /* if (capi_xsec_nodel_as_array == NULL) ... else of xsec_nodel */
+    /* End of cleaning variable xsec_nodel */
+    if((PyObject *)capi_n_pliesu_as_array!=n_pliesu_capi) {
+        Py_XDECREF(capi_n_pliesu_as_array); }
+    }  /* if (capi_n_pliesu_as_array == NULL) ... else of n_pliesu */
+    /* End of cleaning variable n_pliesu */
+    if((PyObject *)capi_xsec_nodeu_as_array!=xsec_nodeu_capi) {
+        Py_XDECREF(capi_xsec_nodeu_as_array); }
+    }  /* if (capi_xsec_nodeu_as_array == NULL) ... else of xsec_nodeu */
+    /* End of cleaning variable xsec_nodeu */
+    if((PyObject *)capi_e1_as_array!=e1_capi) {
+        Py_XDECREF(capi_e1_as_array); }
+    }  /* if (capi_e1_as_array == NULL) ... else of e1 */
+    /* End of cleaning variable e1 */
+    if((PyObject *)capi_xnode_as_array!=xnode_capi) {
+        Py_XDECREF(capi_xnode_as_array); }
+    }  /* if (capi_xnode_as_array == NULL) ... else of xnode */
+    /* End of cleaning variable xnode */
+    } /*if (f2py_success) of le_loc*/
+    /* End of cleaning variable le_loc */
+    } /*if (f2py_success) of tw_prime_d*/
+    /* End of cleaning variable tw_prime_d */
+    } /*if (f2py_success) of tw_aero_d*/
+    /* End of cleaning variable tw_aero_d */
+    } /*if (f2py_success) of chord*/
+    /* End of cleaning variable chord */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/***************************** end of properties *****************************/
+
+/********************************** embed_us **********************************/
+static char doc_f2py_rout__precomp_precomp_embed_us[] = "\
+y,newnode = embed_us(x,nodes_u,xnode_u,ynode_u)\n\nWrapper for ``embed_us``.\
+\n\nParameters\n----------\n"
+"x : input float\n"
+"nodes_u : in/output rank-0 array(int,'i')\n"
+"xnode_u : in/output rank-1 array('d') with bounds (300)\n"
+"ynode_u : in/output rank-1 array('d') with bounds (300)\n"
+"\nReturns\n-------\n"
+"y : float\n"
+"newnode : int";
+/*  */
+static PyObject *f2py_rout__precomp_precomp_embed_us(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,int*,int*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    double x = 0;
+    PyObject *x_capi = Py_None;
+    double y = 0;
+    int nodes_u = 0;
+    PyObject *nodes_u_capi = Py_None;
+    int newnode = 0;
+    double *xnode_u = NULL;
+    npy_intp xnode_u_Dims[1] = {-1};
+    const int xnode_u_Rank = 1;
+    PyArrayObject *capi_xnode_u_as_array = NULL;
+    int capi_xnode_u_intent = 0;
+    PyObject *xnode_u_capi = Py_None;
+    double *ynode_u = NULL;
+    npy_intp ynode_u_Dims[1] = {-1};
+    const int ynode_u_Rank = 1;
+    PyArrayObject *capi_ynode_u_as_array = NULL;
+    int capi_ynode_u_intent = 0;
+    PyObject *ynode_u_capi = Py_None;
+    static char *capi_kwlist[] = {"x","nodes_u","xnode_u","ynode_u",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOO|:_precomp.precomp.embed_us",\
+        capi_kwlist,&x_capi,&nodes_u_capi,&xnode_u_capi,&ynode_u_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable x */
+        f2py_success = double_from_pyobj(&x,x_capi,"_precomp.precomp.embed_us() 1st argument (x) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable nodes_u */
+        f2py_success = int_from_pyobj(&nodes_u,nodes_u_capi,"_precomp.precomp.embed_us() 2nd argument (nodes_u) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable xnode_u */
+    xnode_u_Dims[0]=300;
+    capi_xnode_u_intent |= F2PY_INTENT_INOUT;
+    const char * capi_errmess = "_precomp._precomp.precomp.embed_us: failed to create array from the 3rd argument `xnode_u`";
+    capi_xnode_u_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,xnode_u_Dims,xnode_u_Rank,  capi_xnode_u_intent,xnode_u_capi,capi_errmess);
+    if (capi_xnode_u_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        xnode_u = (double *)(PyArray_DATA(capi_xnode_u_as_array));
+
+    /* Processing variable ynode_u */
+    ynode_u_Dims[0]=300;
+    capi_ynode_u_intent |= F2PY_INTENT_INOUT;
+    const char * capi_errmess = "_precomp._precomp.precomp.embed_us: failed to create array from the 4th argument `ynode_u`";
+    capi_ynode_u_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,ynode_u_Dims,ynode_u_Rank,  capi_ynode_u_intent,ynode_u_capi,capi_errmess);
+    if (capi_ynode_u_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        ynode_u = (double *)(PyArray_DATA(capi_ynode_u_as_array));
+
+    /* Processing variable y */
+    /* Processing variable newnode */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&x,&y,&nodes_u,&newnode,xnode_u,ynode_u);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+    f2py_success = try_pyarr_from_int(nodes_u_capi,&nodes_u);
+    if (f2py_success) {
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("di",y,newnode);
+/*closepyobjfrom*/
+    } /*if (f2py_success) of nodes_u pyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    /* End of cleaning variable newnode */
+    /* End of cleaning variable y */
+    if((PyObject *)capi_ynode_u_as_array!=ynode_u_capi) {
+        Py_XDECREF(capi_ynode_u_as_array); }
+    }  /* if (capi_ynode_u_as_array == NULL) ... else of ynode_u */
+    /* End of cleaning variable ynode_u */
+    if((PyObject *)capi_xnode_u_as_array!=xnode_u_capi) {
+        Py_XDECREF(capi_xnode_u_as_array); }
+    }  /* if (capi_xnode_u_as_array == NULL) ... else of xnode_u */
+    /* End of cleaning variable xnode_u */
+    } /*if (f2py_success) of nodes_u*/
+    /* End of cleaning variable nodes_u */
+    } /*if (f2py_success) of x*/
+    /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/****************************** end of embed_us ******************************/
+
+/********************************** embed_ls **********************************/
+static char doc_f2py_rout__precomp_precomp_embed_ls[] = "\
+y,newnode = embed_ls(x,nodes_l,xnode_l,ynode_l)\n\nWrapper for ``embed_ls``.\
+\n\nParameters\n----------\n"
+"x : input float\n"
+"nodes_l : in/output rank-0 array(int,'i')\n"
+"xnode_l : in/output rank-1 array('d') with bounds (300)\n"
+"ynode_l : in/output rank-1 array('d') with bounds (300)\n"
+"\nReturns\n-------\n"
+"y : float\n"
+"newnode : int";
+/*  */
+static PyObject *f2py_rout__precomp_precomp_embed_ls(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,int*,int*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    double x = 0;
+    PyObject *x_capi = Py_None;
+    double y = 0;
+    int nodes_l = 0;
+    PyObject *nodes_l_capi = Py_None;
+    int newnode = 0;
+    double *xnode_l = NULL;
+    npy_intp xnode_l_Dims[1] = {-1};
+    const int xnode_l_Rank = 1;
+    PyArrayObject *capi_xnode_l_as_array = NULL;
+    int capi_xnode_l_intent = 0;
+    PyObject *xnode_l_capi = Py_None;
+    double *ynode_l = NULL;
+    npy_intp ynode_l_Dims[1] = {-1};
+    const int ynode_l_Rank = 1;
+    PyArrayObject *capi_ynode_l_as_array = NULL;
+    int capi_ynode_l_intent = 0;
+    PyObject *ynode_l_capi = Py_None;
+    static char *capi_kwlist[] = {"x","nodes_l","xnode_l","ynode_l",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOO|:_precomp.precomp.embed_ls",\
+        capi_kwlist,&x_capi,&nodes_l_capi,&xnode_l_capi,&ynode_l_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable x */
+        f2py_success = double_from_pyobj(&x,x_capi,"_precomp.precomp.embed_ls() 1st argument (x) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable nodes_l */
+        f2py_success = int_from_pyobj(&nodes_l,nodes_l_capi,"_precomp.precomp.embed_ls() 2nd argument (nodes_l) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable xnode_l */
+    xnode_l_Dims[0]=300;
+    capi_xnode_l_intent |= F2PY_INTENT_INOUT;
+    const char * capi_errmess = "_precomp._precomp.precomp.embed_ls: failed to create array from the 3rd argument `xnode_l`";
+    capi_xnode_l_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,xnode_l_Dims,xnode_l_Rank,  capi_xnode_l_intent,xnode_l_capi,capi_errmess);
+    if (capi_xnode_l_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        xnode_l = (double *)(PyArray_DATA(capi_xnode_l_as_array));
+
+    /* Processing variable ynode_l */
+    ynode_l_Dims[0]=300;
+    capi_ynode_l_intent |= F2PY_INTENT_INOUT;
+    const char * capi_errmess = "_precomp._precomp.precomp.embed_ls: failed to create array from the 4th argument `ynode_l`";
+    capi_ynode_l_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,ynode_l_Dims,ynode_l_Rank,  capi_ynode_l_intent,ynode_l_capi,capi_errmess);
+    if (capi_ynode_l_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        ynode_l = (double *)(PyArray_DATA(capi_ynode_l_as_array));
+
+    /* Processing variable y */
+    /* Processing variable newnode */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&x,&y,&nodes_l,&newnode,xnode_l,ynode_l);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+    f2py_success = try_pyarr_from_int(nodes_l_capi,&nodes_l);
+    if (f2py_success) {
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("di",y,newnode);
+/*closepyobjfrom*/
+    } /*if (f2py_success) of nodes_l pyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    /* End of cleaning variable newnode */
+    /* End of cleaning variable y */
+    if((PyObject *)capi_ynode_l_as_array!=ynode_l_capi) {
+        Py_XDECREF(capi_ynode_l_as_array); }
+    }  /* if (capi_ynode_l_as_array == NULL) ... else of ynode_l */
+    /* End of cleaning variable ynode_l */
+    if((PyObject *)capi_xnode_l_as_array!=xnode_l_capi) {
+        Py_XDECREF(capi_xnode_l_as_array); }
+    }  /* if (capi_xnode_l_as_array == NULL) ... else of xnode_l */
+    /* End of cleaning variable xnode_l */
+    } /*if (f2py_success) of nodes_l*/
+    /* End of cleaning variable nodes_l */
+    } /*if (f2py_success) of x*/
+    /* End of cleaning variable x */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/****************************** end of embed_ls ******************************/
+
+/********************************** seg_info **********************************/
+static char doc_f2py_rout__precomp_precomp_seg_info[] = "\
+isur,idsect,yseg,zseg,wseg,sthseg,cthseg,s2thseg,c2thseg = seg_info(ch,rle,nseg,nseg_u,nseg_p,xnode_u,ynode_u,xnode_l,ynode_l,ndl1,ndu1,loc_web,weby_u,weby_l,n_scts,xsec_node,[nsecnode])\n\nWrapper for ``seg_info``.\
+\n\nParameters\n----------\n"
+"ch : input float\n"
+"rle : input float\n"
+"nseg : input int\n"
+"nseg_u : input int\n"
+"nseg_p : input int\n"
+"xnode_u : input rank-1 array('d') with bounds (300)\n"
+"ynode_u : input rank-1 array('d') with bounds (300)\n"
+"xnode_l : input rank-1 array('d') with bounds (300)\n"
+"ynode_l : input rank-1 array('d') with bounds (300)\n"
+"ndl1 : input int\n"
+"ndu1 : input int\n"
+"loc_web : input rank-1 array('d') with bounds (f2py_loc_web_d0)\n"
+"weby_u : input rank-1 array('d') with bounds (f2py_weby_u_d0)\n"
+"weby_l : input rank-1 array('d') with bounds (f2py_weby_l_d0)\n"
+"n_scts : input rank-1 array('i') with bounds (2)\n"
+"xsec_node : input rank-2 array('d') with bounds (2,nsecnode)\n"
+"\nOther Parameters\n----------------\n"
+"nsecnode : input int, optional\n    Default: shape(xsec_node, 1)\n"
+"\nReturns\n-------\n"
+"isur : rank-1 array('i') with bounds (f2py_isur_d0)\n"
+"idsect : rank-1 array('i') with bounds (f2py_idsect_d0)\n"
+"yseg : rank-1 array('d') with bounds (f2py_yseg_d0)\n"
+"zseg : rank-1 array('d') with bounds (f2py_zseg_d0)\n"
+"wseg : rank-1 array('d') with bounds (f2py_wseg_d0)\n"
+"sthseg : rank-1 array('d') with bounds (f2py_sthseg_d0)\n"
+"cthseg : rank-1 array('d') with bounds (f2py_cthseg_d0)\n"
+"s2thseg : rank-1 array('d') with bounds (f2py_s2thseg_d0)\n"
+"c2thseg : rank-1 array('d') with bounds (f2py_c2thseg_d0)";
+/* #declfortranroutine# */
+static PyObject *f2py_rout__precomp_precomp_seg_info(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,int*,int*,int*,double*,double*,double*,double*,int*,int*,double*,double*,double*,int*,int*,double*,int*,int*,double*,double*,double*,double*,double*,double*,double*,int*,int*,int*,int*,int*,int*,int*,int*,int*,int*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    double ch = 0;
+    PyObject *ch_capi = Py_None;
+    double rle = 0;
+    PyObject *rle_capi = Py_None;
+    int nseg = 0;
+    PyObject *nseg_capi = Py_None;
+    int nseg_u = 0;
+    PyObject *nseg_u_capi = Py_None;
+    int nseg_p = 0;
+    PyObject *nseg_p_capi = Py_None;
+    double *xnode_u = NULL;
+    npy_intp xnode_u_Dims[1] = {-1};
+    const int xnode_u_Rank = 1;
+    PyArrayObject *capi_xnode_u_as_array = NULL;
+    int capi_xnode_u_intent = 0;
+    PyObject *xnode_u_capi = Py_None;
+    double *ynode_u = NULL;
+    npy_intp ynode_u_Dims[1] = {-1};
+    const int ynode_u_Rank = 1;
+    PyArrayObject *capi_ynode_u_as_array = NULL;
+    int capi_ynode_u_intent = 0;
+    PyObject *ynode_u_capi = Py_None;
+    double *xnode_l = NULL;
+    npy_intp xnode_l_Dims[1] = {-1};
+    const int xnode_l_Rank = 1;
+    PyArrayObject *capi_xnode_l_as_array = NULL;
+    int capi_xnode_l_intent = 0;
+    PyObject *xnode_l_capi = Py_None;
+    double *ynode_l = NULL;
+    npy_intp ynode_l_Dims[1] = {-1};
+    const int ynode_l_Rank = 1;
+    PyArrayObject *capi_ynode_l_as_array = NULL;
+    int capi_ynode_l_intent = 0;
+    PyObject *ynode_l_capi = Py_None;
+    int ndl1 = 0;
+    PyObject *ndl1_capi = Py_None;
+    int ndu1 = 0;
+    PyObject *ndu1_capi = Py_None;
+    double *loc_web = NULL;
+    npy_intp loc_web_Dims[1] = {-1};
+    const int loc_web_Rank = 1;
+    PyArrayObject *capi_loc_web_as_array = NULL;
+    int capi_loc_web_intent = 0;
+    PyObject *loc_web_capi = Py_None;
+    double *weby_u = NULL;
+    npy_intp weby_u_Dims[1] = {-1};
+    const int weby_u_Rank = 1;
+    PyArrayObject *capi_weby_u_as_array = NULL;
+    int capi_weby_u_intent = 0;
+    PyObject *weby_u_capi = Py_None;
+    double *weby_l = NULL;
+    npy_intp weby_l_Dims[1] = {-1};
+    const int weby_l_Rank = 1;
+    PyArrayObject *capi_weby_l_as_array = NULL;
+    int capi_weby_l_intent = 0;
+    PyObject *weby_l_capi = Py_None;
+    int *n_scts = NULL;
+    npy_intp n_scts_Dims[1] = {-1};
+    const int n_scts_Rank = 1;
+    PyArrayObject *capi_n_scts_as_array = NULL;
+    int capi_n_scts_intent = 0;
+    PyObject *n_scts_capi = Py_None;
+    int nsecnode = 0;
+    PyObject *nsecnode_capi = Py_None;
+    double *xsec_node = NULL;
+    npy_intp xsec_node_Dims[2] = {-1, -1};
+    const int xsec_node_Rank = 2;
+    PyArrayObject *capi_xsec_node_as_array = NULL;
+    int capi_xsec_node_intent = 0;
+    PyObject *xsec_node_capi = Py_None;
+    int *isur = NULL;
+    npy_intp isur_Dims[1] = {-1};
+    const int isur_Rank = 1;
+    PyArrayObject *capi_isur_as_array = NULL;
+    int capi_isur_intent = 0;
+    int *idsect = NULL;
+    npy_intp idsect_Dims[1] = {-1};
+    const int idsect_Rank = 1;
+    PyArrayObject *capi_idsect_as_array = NULL;
+    int capi_idsect_intent = 0;
+    double *yseg = NULL;
+    npy_intp yseg_Dims[1] = {-1};
+    const int yseg_Rank = 1;
+    PyArrayObject *capi_yseg_as_array = NULL;
+    int capi_yseg_intent = 0;
+    double *zseg = NULL;
+    npy_intp zseg_Dims[1] = {-1};
+    const int zseg_Rank = 1;
+    PyArrayObject *capi_zseg_as_array = NULL;
+    int capi_zseg_intent = 0;
+    double *wseg = NULL;
+    npy_intp wseg_Dims[1] = {-1};
+    const int wseg_Rank = 1;
+    PyArrayObject *capi_wseg_as_array = NULL;
+    int capi_wseg_intent = 0;
+    double *sthseg = NULL;
+    npy_intp sthseg_Dims[1] = {-1};
+    const int sthseg_Rank = 1;
+    PyArrayObject *capi_sthseg_as_array = NULL;
+    int capi_sthseg_intent = 0;
+    double *cthseg = NULL;
+    npy_intp cthseg_Dims[1] = {-1};
+    const int cthseg_Rank = 1;
+    PyArrayObject *capi_cthseg_as_array = NULL;
+    int capi_cthseg_intent = 0;
+    double *s2thseg = NULL;
+    npy_intp s2thseg_Dims[1] = {-1};
+    const int s2thseg_Rank = 1;
+    PyArrayObject *capi_s2thseg_as_array = NULL;
+    int capi_s2thseg_intent = 0;
+    double *c2thseg = NULL;
+    npy_intp c2thseg_Dims[1] = {-1};
+    const int c2thseg_Rank = 1;
+    PyArrayObject *capi_c2thseg_as_array = NULL;
+    int capi_c2thseg_intent = 0;
+    int f2py_loc_web_d0 = 0;
+    int f2py_weby_u_d0 = 0;
+    int f2py_weby_l_d0 = 0;
+    int f2py_isur_d0 = 0;
+    int f2py_idsect_d0 = 0;
+    int f2py_yseg_d0 = 0;
+    int f2py_zseg_d0 = 0;
+    int f2py_wseg_d0 = 0;
+    int f2py_sthseg_d0 = 0;
+    int f2py_cthseg_d0 = 0;
+    int f2py_s2thseg_d0 = 0;
+    int f2py_c2thseg_d0 = 0;
+    static char *capi_kwlist[] = {"ch","rle","nseg","nseg_u","nseg_p","xnode_u","ynode_u","xnode_l","ynode_l","ndl1","ndu1","loc_web","weby_u","weby_l","n_scts","xsec_node","nsecnode",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOOOOOOOOOO|O:_precomp.precomp.seg_info",\
+        capi_kwlist,&ch_capi,&rle_capi,&nseg_capi,&nseg_u_capi,&nseg_p_capi,&xnode_u_capi,&ynode_u_capi,&xnode_l_capi,&ynode_l_capi,&ndl1_capi,&ndu1_capi,&loc_web_capi,&weby_u_capi,&weby_l_capi,&n_scts_capi,&xsec_node_capi,&nsecnode_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable ch */
+        f2py_success = double_from_pyobj(&ch,ch_capi,"_precomp.precomp.seg_info() 1st argument (ch) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable rle */
+        f2py_success = double_from_pyobj(&rle,rle_capi,"_precomp.precomp.seg_info() 2nd argument (rle) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable nseg */
+        f2py_success = int_from_pyobj(&nseg,nseg_capi,"_precomp.precomp.seg_info() 3rd argument (nseg) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable nseg_u */
+        f2py_success = int_from_pyobj(&nseg_u,nseg_u_capi,"_precomp.precomp.seg_info() 4th argument (nseg_u) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable nseg_p */
+        f2py_success = int_from_pyobj(&nseg_p,nseg_p_capi,"_precomp.precomp.seg_info() 5th argument (nseg_p) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable xnode_u */
+    xnode_u_Dims[0]=300;
+    capi_xnode_u_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the 6th argument `xnode_u`";
+    capi_xnode_u_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,xnode_u_Dims,xnode_u_Rank,  capi_xnode_u_intent,xnode_u_capi,capi_errmess);
+    if (capi_xnode_u_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        xnode_u = (double *)(PyArray_DATA(capi_xnode_u_as_array));
+
+    /* Processing variable ynode_u */
+    ynode_u_Dims[0]=300;
+    capi_ynode_u_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the 7th argument `ynode_u`";
+    capi_ynode_u_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,ynode_u_Dims,ynode_u_Rank,  capi_ynode_u_intent,ynode_u_capi,capi_errmess);
+    if (capi_ynode_u_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        ynode_u = (double *)(PyArray_DATA(capi_ynode_u_as_array));
+
+    /* Processing variable xnode_l */
+    xnode_l_Dims[0]=300;
+    capi_xnode_l_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the 8th argument `xnode_l`";
+    capi_xnode_l_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,xnode_l_Dims,xnode_l_Rank,  capi_xnode_l_intent,xnode_l_capi,capi_errmess);
+    if (capi_xnode_l_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        xnode_l = (double *)(PyArray_DATA(capi_xnode_l_as_array));
+
+    /* Processing variable ynode_l */
+    ynode_l_Dims[0]=300;
+    capi_ynode_l_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the 9th argument `ynode_l`";
+    capi_ynode_l_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,ynode_l_Dims,ynode_l_Rank,  capi_ynode_l_intent,ynode_l_capi,capi_errmess);
+    if (capi_ynode_l_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        ynode_l = (double *)(PyArray_DATA(capi_ynode_l_as_array));
+
+    /* Processing variable ndl1 */
+        f2py_success = int_from_pyobj(&ndl1,ndl1_capi,"_precomp.precomp.seg_info() 10th argument (ndl1) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable ndu1 */
+        f2py_success = int_from_pyobj(&ndu1,ndu1_capi,"_precomp.precomp.seg_info() 11st argument (ndu1) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable loc_web */
+    ;
+    capi_loc_web_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the 12nd argument `loc_web`";
+    capi_loc_web_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,loc_web_Dims,loc_web_Rank,  capi_loc_web_intent,loc_web_capi,capi_errmess);
+    if (capi_loc_web_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        loc_web = (double *)(PyArray_DATA(capi_loc_web_as_array));
+
+    /* Processing variable weby_u */
+    ;
+    capi_weby_u_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the 13rd argument `weby_u`";
+    capi_weby_u_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,weby_u_Dims,weby_u_Rank,  capi_weby_u_intent,weby_u_capi,capi_errmess);
+    if (capi_weby_u_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        weby_u = (double *)(PyArray_DATA(capi_weby_u_as_array));
+
+    /* Processing variable weby_l */
+    ;
+    capi_weby_l_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the 14th argument `weby_l`";
+    capi_weby_l_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,weby_l_Dims,weby_l_Rank,  capi_weby_l_intent,weby_l_capi,capi_errmess);
+    if (capi_weby_l_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        weby_l = (double *)(PyArray_DATA(capi_weby_l_as_array));
+
+    /* Processing variable n_scts */
+    n_scts_Dims[0]=2;
+    capi_n_scts_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the 15th argument `n_scts`";
+    capi_n_scts_as_array = ndarray_from_pyobj(  NPY_INT,1,n_scts_Dims,n_scts_Rank,  capi_n_scts_intent,n_scts_capi,capi_errmess);
+    if (capi_n_scts_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        n_scts = (int *)(PyArray_DATA(capi_n_scts_as_array));
+
+    /* Processing variable xsec_node */
+    xsec_node_Dims[0]=2;
+    capi_xsec_node_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the 16th argument `xsec_node`";
+    capi_xsec_node_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,xsec_node_Dims,xsec_node_Rank,  capi_xsec_node_intent,xsec_node_capi,capi_errmess);
+    if (capi_xsec_node_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        xsec_node = (double *)(PyArray_DATA(capi_xsec_node_as_array));
+
+    /* Processing variable isur */
+    ;
+    capi_isur_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the hidden `isur`";
+    capi_isur_as_array = ndarray_from_pyobj(  NPY_INT,1,isur_Dims,isur_Rank,  capi_isur_intent,Py_None,capi_errmess);
+    if (capi_isur_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        isur = (int *)(PyArray_DATA(capi_isur_as_array));
+
+    /* Processing variable idsect */
+    ;
+    capi_idsect_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the hidden `idsect`";
+    capi_idsect_as_array = ndarray_from_pyobj(  NPY_INT,1,idsect_Dims,idsect_Rank,  capi_idsect_intent,Py_None,capi_errmess);
+    if (capi_idsect_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        idsect = (int *)(PyArray_DATA(capi_idsect_as_array));
+
+    /* Processing variable yseg */
+    ;
+    capi_yseg_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the hidden `yseg`";
+    capi_yseg_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,yseg_Dims,yseg_Rank,  capi_yseg_intent,Py_None,capi_errmess);
+    if (capi_yseg_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        yseg = (double *)(PyArray_DATA(capi_yseg_as_array));
+
+    /* Processing variable zseg */
+    ;
+    capi_zseg_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the hidden `zseg`";
+    capi_zseg_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,zseg_Dims,zseg_Rank,  capi_zseg_intent,Py_None,capi_errmess);
+    if (capi_zseg_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        zseg = (double *)(PyArray_DATA(capi_zseg_as_array));
+
+    /* Processing variable wseg */
+    ;
+    capi_wseg_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the hidden `wseg`";
+    capi_wseg_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,wseg_Dims,wseg_Rank,  capi_wseg_intent,Py_None,capi_errmess);
+    if (capi_wseg_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        wseg = (double *)(PyArray_DATA(capi_wseg_as_array));
+
+    /* Processing variable sthseg */
+    ;
+    capi_sthseg_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the hidden `sthseg`";
+    capi_sthseg_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,sthseg_Dims,sthseg_Rank,  capi_sthseg_intent,Py_None,capi_errmess);
+    if (capi_sthseg_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        sthseg = (double *)(PyArray_DATA(capi_sthseg_as_array));
+
+    /* Processing variable cthseg */
+    ;
+    capi_cthseg_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the hidden `cthseg`";
+    capi_cthseg_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,cthseg_Dims,cthseg_Rank,  capi_cthseg_intent,Py_None,capi_errmess);
+    if (capi_cthseg_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        cthseg = (double *)(PyArray_DATA(capi_cthseg_as_array));
+
+    /* Processing variable s2thseg */
+    ;
+    capi_s2thseg_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the hidden `s2thseg`";
+    capi_s2thseg_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,s2thseg_Dims,s2thseg_Rank,  capi_s2thseg_intent,Py_None,capi_errmess);
+    if (capi_s2thseg_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        s2thseg = (double *)(PyArray_DATA(capi_s2thseg_as_array));
+
+    /* Processing variable c2thseg */
+    ;
+    capi_c2thseg_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_precomp._precomp.precomp.seg_info: failed to create array from the hidden `c2thseg`";
+    capi_c2thseg_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,c2thseg_Dims,c2thseg_Rank,  capi_c2thseg_intent,Py_None,capi_errmess);
+    if (capi_c2thseg_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        c2thseg = (double *)(PyArray_DATA(capi_c2thseg_as_array));
+
+    /* Processing variable nsecnode */
+    if (nsecnode_capi == Py_None) nsecnode = shape(xsec_node, 1); else
+        f2py_success = int_from_pyobj(&nsecnode,nsecnode_capi,"_precomp.precomp.seg_info() 1st keyword (nsecnode) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(xsec_node, 1) == nsecnode,"shape(xsec_node, 1) == nsecnode","1st keyword nsecnode","seg_info:nsecnode=%d",nsecnode) {
+    /* Processing variable f2py_loc_web_d0 */
+    f2py_loc_web_d0 = shape(loc_web, 0);
+    /* Processing variable f2py_weby_u_d0 */
+    f2py_weby_u_d0 = shape(weby_u, 0);
+    /* Processing variable f2py_weby_l_d0 */
+    f2py_weby_l_d0 = shape(weby_l, 0);
+    /* Processing variable f2py_isur_d0 */
+    f2py_isur_d0 = shape(isur, 0);
+    /* Processing variable f2py_idsect_d0 */
+    f2py_idsect_d0 = shape(idsect, 0);
+    /* Processing variable f2py_yseg_d0 */
+    f2py_yseg_d0 = shape(yseg, 0);
+    /* Processing variable f2py_zseg_d0 */
+    f2py_zseg_d0 = shape(zseg, 0);
+    /* Processing variable f2py_wseg_d0 */
+    f2py_wseg_d0 = shape(wseg, 0);
+    /* Processing variable f2py_sthseg_d0 */
+    f2py_sthseg_d0 = shape(sthseg, 0);
+    /* Processing variable f2py_cthseg_d0 */
+    f2py_cthseg_d0 = shape(cthseg, 0);
+    /* Processing variable f2py_s2thseg_d0 */
+    f2py_s2thseg_d0 = shape(s2thseg, 0);
+    /* Processing variable f2py_c2thseg_d0 */
+    f2py_c2thseg_d0 = shape(c2thseg, 0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+    (*f2py_func)(&ch,&rle,&nseg,&nseg_u,&nseg_p,xnode_u,ynode_u,xnode_l,ynode_l,&ndl1,&ndu1,loc_web,weby_u,weby_l,n_scts,&nsecnode,xsec_node,isur,idsect,yseg,zseg,wseg,sthseg,cthseg,s2thseg,c2thseg,&f2py_loc_web_d0,&f2py_weby_u_d0,&f2py_weby_l_d0,&f2py_isur_d0,&f2py_idsect_d0,&f2py_yseg_d0,&f2py_zseg_d0,&f2py_wseg_d0,&f2py_sthseg_d0,&f2py_cthseg_d0,&f2py_s2thseg_d0,&f2py_c2thseg_d0);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("NNNNNNNNN",capi_isur_as_array,capi_idsect_as_array,capi_yseg_as_array,capi_zseg_as_array,capi_wseg_as_array,capi_sthseg_as_array,capi_cthseg_as_array,capi_s2thseg_as_array,capi_c2thseg_as_array);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    /* End of cleaning variable f2py_c2thseg_d0 */
+    /* End of cleaning variable f2py_s2thseg_d0 */
+    /* End of cleaning variable f2py_cthseg_d0 */
+    /* End of cleaning variable f2py_sthseg_d0 */
+    /* End of cleaning variable f2py_wseg_d0 */
+    /* End of cleaning variable f2py_zseg_d0 */
+    /* End of cleaning variable f2py_yseg_d0 */
+    /* End of cleaning variable f2py_idsect_d0 */
+    /* End of cleaning variable f2py_isur_d0 */
+    /* End of cleaning variable f2py_weby_l_d0 */
+    /* End of cleaning variable f2py_weby_u_d0 */
+    /* End of cleaning variable f2py_loc_web_d0 */
+    } /*CHECKSCALAR(shape(xsec_node, 1) == nsecnode)*/
+    } /*if (f2py_success) of nsecnode*/
+    /* End of cleaning variable nsecnode */
+    }  /* if (capi_c2thseg_as_array == NULL) ... else of c2thseg */
+    /* End of cleaning variable c2thseg */
+    }  /* if (capi_s2thseg_as_array == NULL) ... else of s2thseg */
+    /* End of cleaning variable s2thseg */
+    }  /* if (capi_cthseg_as_array == NULL) ... else of cthseg */
+    /* End of cleaning variable cthseg */
+    }  /* if (capi_sthseg_as_array == NULL) ... else of sthseg */
+    /* End of cleaning variable sthseg */
+    }  /* if (capi_wseg_as_array == NULL) ... else of wseg */
+    /* End of cleaning variable wseg */
+    }  /* if (capi_zseg_as_array == NULL) ... else of zseg */
+    /* End of cleaning variable zseg */
+    }  /* if (capi_yseg_as_array == NULL) ... else of yseg */
+    /* End of cleaning variable yseg */
+    }  /* if (capi_idsect_as_array == NULL) ... else of idsect */
+    /* End of cleaning variable idsect */
+    }  /* if (capi_isur_as_array == NULL) ... else of isur */
+    /* End of cleaning variable isur */
+    if((PyObject *)capi_xsec_node_as_array!=xsec_node_capi) {
+        Py_XDECREF(capi_xsec_node_as_array); }
+    }  /* if (capi_xsec_node_as_array == NULL) ... else of xsec_node */
+    /* End of cleaning variable xsec_node */
+    if((PyObject *)capi_n_scts_as_array!=n_scts_capi) {
+        Py_XDECREF(capi_n_scts_as_array); }
+    }  /* if (capi_n_scts_as_array == NULL) ... else of n_scts */
+    /* End of cleaning variable n_scts */
+    if((PyObject *)capi_weby_l_as_array!=weby_l_capi) {
+        Py_XDECREF(capi_weby_l_as_array); }
+    }  /* if (capi_weby_l_as_array == NULL) ... else of weby_l */
+    /* End of cleaning variable weby_l */
+    if((PyObject *)capi_weby_u_as_array!=weby_u_capi) {
+        Py_XDECREF(capi_weby_u_as_array); }
+    }  /* if (capi_weby_u_as_array == NULL) ... else of weby_u */
+    /* End of cleaning variable weby_u */
+    if((PyObject *)capi_loc_web_as_array!=loc_web_capi) {
+        Py_XDECREF(capi_loc_web_as_array); }
+    }  /* if (capi_loc_web_as_array == NULL) ... else of loc_web */
+    /* End of cleaning variable loc_web */
+    } /*if (f2py_success) of ndu1*/
+    /* End of cleaning variable ndu1 */
+    } /*if (f2py_success) of ndl1*/
+    /* End of cleaning variable ndl1 */
+    if((PyObject *)capi_ynode_l_as_array!=ynode_l_capi) {
+        Py_XDECREF(capi_ynode_l_as_array); }
+    }  /* if (capi_ynode_l_as_array == NULL) ... else of ynode_l */
+    /* End of cleaning variable ynode_l */
+    if((PyObject *)capi_xnode_l_as_array!=xnode_l_capi) {
+        Py_XDECREF(capi_xnode_l_as_array); }
+    }  /* if (capi_xnode_l_as_array == NULL) ... else of xnode_l */
+    /* End of cleaning variable xnode_l */
+    if((PyObject *)capi_ynode_u_as_array!=ynode_u_capi) {
+        Py_XDECREF(capi_ynode_u_as_array); }
+    }  /* if (capi_ynode_u_as_array == NULL) ... else of ynode_u */
+    /* End of cleaning variable ynode_u */
+    if((PyObject *)capi_xnode_u_as_array!=xnode_u_capi) {
+        Py_XDECREF(capi_xnode_u_as_array); }
+    }  /* if (capi_xnode_u_as_array == NULL) ... else of xnode_u */
+    /* End of cleaning variable xnode_u */
+    } /*if (f2py_success) of nseg_p*/
+    /* End of cleaning variable nseg_p */
+    } /*if (f2py_success) of nseg_u*/
+    /* End of cleaning variable nseg_u */
+    } /*if (f2py_success) of nseg*/
+    /* End of cleaning variable nseg */
+    } /*if (f2py_success) of rle*/
+    /* End of cleaning variable rle */
+    } /*if (f2py_success) of ch*/
+    /* End of cleaning variable ch */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/****************************** end of seg_info ******************************/
+
+/********************************** tw_rate **********************************/
+static char doc_f2py_rout__precomp_precomp_tw_rate[] = "\
+th_prime = tw_rate(sloc,tw_aero,[naf])\n\nWrapper for ``tw_rate``.\
+\n\nParameters\n----------\n"
+"sloc : input rank-1 array('d') with bounds (naf)\n"
+"tw_aero : input rank-1 array('d') with bounds (naf)\n"
+"\nOther Parameters\n----------------\n"
+"naf : input int, optional\n    Default: shape(sloc, 0)\n"
+"\nReturns\n-------\n"
+"th_prime : rank-1 array('d') with bounds (naf)";
+/*  */
+static PyObject *f2py_rout__precomp_precomp_tw_rate(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int naf = 0;
+    PyObject *naf_capi = Py_None;
+    double *sloc = NULL;
+    npy_intp sloc_Dims[1] = {-1};
+    const int sloc_Rank = 1;
+    PyArrayObject *capi_sloc_as_array = NULL;
+    int capi_sloc_intent = 0;
+    PyObject *sloc_capi = Py_None;
+    double *tw_aero = NULL;
+    npy_intp tw_aero_Dims[1] = {-1};
+    const int tw_aero_Rank = 1;
+    PyArrayObject *capi_tw_aero_as_array = NULL;
+    int capi_tw_aero_intent = 0;
+    PyObject *tw_aero_capi = Py_None;
+    double *th_prime = NULL;
+    npy_intp th_prime_Dims[1] = {-1};
+    const int th_prime_Rank = 1;
+    PyArrayObject *capi_th_prime_as_array = NULL;
+    int capi_th_prime_intent = 0;
+    static char *capi_kwlist[] = {"sloc","tw_aero","naf",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OO|O:_precomp.precomp.tw_rate",\
+        capi_kwlist,&sloc_capi,&tw_aero_capi,&naf_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable sloc */
+    ;
+    capi_sloc_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.tw_rate: failed to create array from the 1st argument `sloc`";
+    capi_sloc_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,sloc_Dims,sloc_Rank,  capi_sloc_intent,sloc_capi,capi_errmess);
+    if (capi_sloc_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        sloc = (double *)(PyArray_DATA(capi_sloc_as_array));
+
+    /* Processing variable naf */
+    if (naf_capi == Py_None) naf = shape(sloc, 0); else
+        f2py_success = int_from_pyobj(&naf,naf_capi,"_precomp.precomp.tw_rate() 1st keyword (naf) can't be converted to int");
+    if (f2py_success) {
+    CHECKSCALAR(shape(sloc, 0) == naf,"shape(sloc, 0) == naf","1st keyword naf","tw_rate:naf=%d",naf) {
+    /* Processing variable tw_aero */
+    tw_aero_Dims[0]=naf;
+    capi_tw_aero_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.tw_rate: failed to create array from the 2nd argument `tw_aero`";
+    capi_tw_aero_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,tw_aero_Dims,tw_aero_Rank,  capi_tw_aero_intent,tw_aero_capi,capi_errmess);
+    if (capi_tw_aero_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        tw_aero = (double *)(PyArray_DATA(capi_tw_aero_as_array));
+
+    /* Processing variable th_prime */
+    th_prime_Dims[0]=naf;
+    capi_th_prime_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_precomp._precomp.precomp.tw_rate: failed to create array from the hidden `th_prime`";
+    capi_th_prime_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,th_prime_Dims,th_prime_Rank,  capi_th_prime_intent,Py_None,capi_errmess);
+    if (capi_th_prime_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        th_prime = (double *)(PyArray_DATA(capi_th_prime_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&naf,sloc,tw_aero,th_prime);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("N",capi_th_prime_as_array);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    }  /* if (capi_th_prime_as_array == NULL) ... else of th_prime */
+    /* End of cleaning variable th_prime */
+    if((PyObject *)capi_tw_aero_as_array!=tw_aero_capi) {
+        Py_XDECREF(capi_tw_aero_as_array); }
+    }  /* if (capi_tw_aero_as_array == NULL) ... else of tw_aero */
+    /* End of cleaning variable tw_aero */
+    } /*CHECKSCALAR(shape(sloc, 0) == naf)*/
+    } /*if (f2py_success) of naf*/
+    /* End of cleaning variable naf */
+    if((PyObject *)capi_sloc_as_array!=sloc_capi) {
+        Py_XDECREF(capi_sloc_as_array); }
+    }  /* if (capi_sloc_as_array == NULL) ... else of sloc */
+    /* End of cleaning variable sloc */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************* end of tw_rate *******************************/
+
+/*********************************** q_bars ***********************************/
+static char doc_f2py_rout__precomp_precomp_q_bars[] = "\
+qbar11,qbar22,qbar12,qbar16,qbar26,qbar66,rho_m = q_bars(mat,thp,density,q11,q22,q12,q66)\n\nWrapper for ``q_bars``.\
+\n\nParameters\n----------\n"
+"mat : input int\n"
+"thp : input float\n"
+"density : input rank-1 array('d') with bounds (f2py_density_d0)\n"
+"q11 : input rank-1 array('d') with bounds (f2py_q11_d0)\n"
+"q22 : input rank-1 array('d') with bounds (f2py_q22_d0)\n"
+"q12 : input rank-1 array('d') with bounds (f2py_q12_d0)\n"
+"q66 : input rank-1 array('d') with bounds (f2py_q66_d0)\n"
+"\nReturns\n-------\n"
+"qbar11 : float\n"
+"qbar22 : float\n"
+"qbar12 : float\n"
+"qbar16 : float\n"
+"qbar26 : float\n"
+"qbar66 : float\n"
+"rho_m : float";
+/* #declfortranroutine# */
+static PyObject *f2py_rout__precomp_precomp_q_bars(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,double*,int*,int*,int*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    int mat = 0;
+    PyObject *mat_capi = Py_None;
+    double thp = 0;
+    PyObject *thp_capi = Py_None;
+    double *density = NULL;
+    npy_intp density_Dims[1] = {-1};
+    const int density_Rank = 1;
+    PyArrayObject *capi_density_as_array = NULL;
+    int capi_density_intent = 0;
+    PyObject *density_capi = Py_None;
+    double *q11 = NULL;
+    npy_intp q11_Dims[1] = {-1};
+    const int q11_Rank = 1;
+    PyArrayObject *capi_q11_as_array = NULL;
+    int capi_q11_intent = 0;
+    PyObject *q11_capi = Py_None;
+    double *q22 = NULL;
+    npy_intp q22_Dims[1] = {-1};
+    const int q22_Rank = 1;
+    PyArrayObject *capi_q22_as_array = NULL;
+    int capi_q22_intent = 0;
+    PyObject *q22_capi = Py_None;
+    double *q12 = NULL;
+    npy_intp q12_Dims[1] = {-1};
+    const int q12_Rank = 1;
+    PyArrayObject *capi_q12_as_array = NULL;
+    int capi_q12_intent = 0;
+    PyObject *q12_capi = Py_None;
+    double *q66 = NULL;
+    npy_intp q66_Dims[1] = {-1};
+    const int q66_Rank = 1;
+    PyArrayObject *capi_q66_as_array = NULL;
+    int capi_q66_intent = 0;
+    PyObject *q66_capi = Py_None;
+    double qbar11 = 0;
+    double qbar22 = 0;
+    double qbar12 = 0;
+    double qbar16 = 0;
+    double qbar26 = 0;
+    double qbar66 = 0;
+    double rho_m = 0;
+    int f2py_density_d0 = 0;
+    int f2py_q11_d0 = 0;
+    int f2py_q22_d0 = 0;
+    int f2py_q12_d0 = 0;
+    int f2py_q66_d0 = 0;
+    static char *capi_kwlist[] = {"mat","thp","density","q11","q22","q12","q66",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOO|:_precomp.precomp.q_bars",\
+        capi_kwlist,&mat_capi,&thp_capi,&density_capi,&q11_capi,&q22_capi,&q12_capi,&q66_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable mat */
+        f2py_success = int_from_pyobj(&mat,mat_capi,"_precomp.precomp.q_bars() 1st argument (mat) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable thp */
+        f2py_success = double_from_pyobj(&thp,thp_capi,"_precomp.precomp.q_bars() 2nd argument (thp) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable density */
+    ;
+    capi_density_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.q_bars: failed to create array from the 3rd argument `density`";
+    capi_density_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,density_Dims,density_Rank,  capi_density_intent,density_capi,capi_errmess);
+    if (capi_density_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        density = (double *)(PyArray_DATA(capi_density_as_array));
+
+    /* Processing variable q11 */
+    ;
+    capi_q11_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.q_bars: failed to create array from the 4th argument `q11`";
+    capi_q11_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,q11_Dims,q11_Rank,  capi_q11_intent,q11_capi,capi_errmess);
+    if (capi_q11_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        q11 = (double *)(PyArray_DATA(capi_q11_as_array));
+
+    /* Processing variable q22 */
+    ;
+    capi_q22_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.q_bars: failed to create array from the 5th argument `q22`";
+    capi_q22_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,q22_Dims,q22_Rank,  capi_q22_intent,q22_capi,capi_errmess);
+    if (capi_q22_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        q22 = (double *)(PyArray_DATA(capi_q22_as_array));
+
+    /* Processing variable q12 */
+    ;
+    capi_q12_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.q_bars: failed to create array from the 6th argument `q12`";
+    capi_q12_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,q12_Dims,q12_Rank,  capi_q12_intent,q12_capi,capi_errmess);
+    if (capi_q12_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        q12 = (double *)(PyArray_DATA(capi_q12_as_array));
+
+    /* Processing variable q66 */
+    ;
+    capi_q66_intent |= F2PY_INTENT_IN;
+    const char * capi_errmess = "_precomp._precomp.precomp.q_bars: failed to create array from the 7th argument `q66`";
+    capi_q66_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,q66_Dims,q66_Rank,  capi_q66_intent,q66_capi,capi_errmess);
+    if (capi_q66_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        q66 = (double *)(PyArray_DATA(capi_q66_as_array));
+
+    /* Processing variable qbar11 */
+    /* Processing variable qbar22 */
+    /* Processing variable qbar12 */
+    /* Processing variable qbar16 */
+    /* Processing variable qbar26 */
+    /* Processing variable qbar66 */
+    /* Processing variable rho_m */
+    /* Processing variable f2py_density_d0 */
+    f2py_density_d0 = shape(density, 0);
+    /* Processing variable f2py_q11_d0 */
+    f2py_q11_d0 = shape(q11, 0);
+    /* Processing variable f2py_q22_d0 */
+    f2py_q22_d0 = shape(q22, 0);
+    /* Processing variable f2py_q12_d0 */
+    f2py_q12_d0 = shape(q12, 0);
+    /* Processing variable f2py_q66_d0 */
+    f2py_q66_d0 = shape(q66, 0);
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+    (*f2py_func)(&mat,&thp,density,q11,q22,q12,q66,&qbar11,&qbar22,&qbar12,&qbar16,&qbar26,&qbar66,&rho_m,&f2py_density_d0,&f2py_q11_d0,&f2py_q22_d0,&f2py_q12_d0,&f2py_q66_d0);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("ddddddd",qbar11,qbar22,qbar12,qbar16,qbar26,qbar66,rho_m);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    /* End of cleaning variable f2py_q66_d0 */
+    /* End of cleaning variable f2py_q12_d0 */
+    /* End of cleaning variable f2py_q22_d0 */
+    /* End of cleaning variable f2py_q11_d0 */
+    /* End of cleaning variable f2py_density_d0 */
+    /* End of cleaning variable rho_m */
+    /* End of cleaning variable qbar66 */
+    /* End of cleaning variable qbar26 */
+    /* End of cleaning variable qbar16 */
+    /* End of cleaning variable qbar12 */
+    /* End of cleaning variable qbar22 */
+    /* End of cleaning variable qbar11 */
+    if((PyObject *)capi_q66_as_array!=q66_capi) {
+        Py_XDECREF(capi_q66_as_array); }
+    }  /* if (capi_q66_as_array == NULL) ... else of q66 */
+    /* End of cleaning variable q66 */
+    if((PyObject *)capi_q12_as_array!=q12_capi) {
+        Py_XDECREF(capi_q12_as_array); }
+    }  /* if (capi_q12_as_array == NULL) ... else of q12 */
+    /* End of cleaning variable q12 */
+    if((PyObject *)capi_q22_as_array!=q22_capi) {
+        Py_XDECREF(capi_q22_as_array); }
+    }  /* if (capi_q22_as_array == NULL) ... else of q22 */
+    /* End of cleaning variable q22 */
+    if((PyObject *)capi_q11_as_array!=q11_capi) {
+        Py_XDECREF(capi_q11_as_array); }
+    }  /* if (capi_q11_as_array == NULL) ... else of q11 */
+    /* End of cleaning variable q11 */
+    if((PyObject *)capi_density_as_array!=density_capi) {
+        Py_XDECREF(capi_density_as_array); }
+    }  /* if (capi_density_as_array == NULL) ... else of density */
+    /* End of cleaning variable density */
+    } /*if (f2py_success) of thp*/
+    /* End of cleaning variable thp */
+    } /*if (f2py_success) of mat*/
+    /* End of cleaning variable mat */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************* end of q_bars *******************************/
+
+/********************************** q_tildas **********************************/
+static char doc_f2py_rout__precomp_precomp_q_tildas[] = "\
+qtil = q_tildas(qbar11,qbar22,qbar12,qbar16,qbar26,qbar66,mat)\n\nWrapper for ``q_tildas``.\
+\n\nParameters\n----------\n"
+"qbar11 : input float\n"
+"qbar22 : input float\n"
+"qbar12 : input float\n"
+"qbar16 : input float\n"
+"qbar26 : input float\n"
+"qbar66 : input float\n"
+"mat : input int\n"
+"\nReturns\n-------\n"
+"qtil : rank-2 array('d') with bounds (2,2)";
+/*  */
+static PyObject *f2py_rout__precomp_precomp_q_tildas(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(double*,double*,double*,double*,double*,double*,int*,double*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+    double qbar11 = 0;
+    PyObject *qbar11_capi = Py_None;
+    double qbar22 = 0;
+    PyObject *qbar22_capi = Py_None;
+    double qbar12 = 0;
+    PyObject *qbar12_capi = Py_None;
+    double qbar16 = 0;
+    PyObject *qbar16_capi = Py_None;
+    double qbar26 = 0;
+    PyObject *qbar26_capi = Py_None;
+    double qbar66 = 0;
+    PyObject *qbar66_capi = Py_None;
+    int mat = 0;
+    PyObject *mat_capi = Py_None;
+    double *qtil = NULL;
+    npy_intp qtil_Dims[2] = {-1, -1};
+    const int qtil_Rank = 2;
+    PyArrayObject *capi_qtil_as_array = NULL;
+    int capi_qtil_intent = 0;
+    static char *capi_kwlist[] = {"qbar11","qbar22","qbar12","qbar16","qbar26","qbar66","mat",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOO|:_precomp.precomp.q_tildas",\
+        capi_kwlist,&qbar11_capi,&qbar22_capi,&qbar12_capi,&qbar16_capi,&qbar26_capi,&qbar66_capi,&mat_capi))
+        return NULL;
+/*frompyobj*/
+    /* Processing variable qbar11 */
+        f2py_success = double_from_pyobj(&qbar11,qbar11_capi,"_precomp.precomp.q_tildas() 1st argument (qbar11) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable qbar22 */
+        f2py_success = double_from_pyobj(&qbar22,qbar22_capi,"_precomp.precomp.q_tildas() 2nd argument (qbar22) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable qbar12 */
+        f2py_success = double_from_pyobj(&qbar12,qbar12_capi,"_precomp.precomp.q_tildas() 3rd argument (qbar12) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable qbar16 */
+        f2py_success = double_from_pyobj(&qbar16,qbar16_capi,"_precomp.precomp.q_tildas() 4th argument (qbar16) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable qbar26 */
+        f2py_success = double_from_pyobj(&qbar26,qbar26_capi,"_precomp.precomp.q_tildas() 5th argument (qbar26) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable qbar66 */
+        f2py_success = double_from_pyobj(&qbar66,qbar66_capi,"_precomp.precomp.q_tildas() 6th argument (qbar66) can't be converted to double");
+    if (f2py_success) {
+    /* Processing variable mat */
+        f2py_success = int_from_pyobj(&mat,mat_capi,"_precomp.precomp.q_tildas() 7th argument (mat) can't be converted to int");
+    if (f2py_success) {
+    /* Processing variable qtil */
+    qtil_Dims[0]=2,qtil_Dims[1]=2;
+    capi_qtil_intent |= F2PY_INTENT_OUT|F2PY_INTENT_HIDE;
+    const char * capi_errmess = "_precomp._precomp.precomp.q_tildas: failed to create array from the hidden `qtil`";
+    capi_qtil_as_array = ndarray_from_pyobj(  NPY_DOUBLE,1,qtil_Dims,qtil_Rank,  capi_qtil_intent,Py_None,capi_errmess);
+    if (capi_qtil_as_array == NULL) {
+        PyObject* capi_err = PyErr_Occurred();
+        if (capi_err == NULL) {
+            capi_err = _precomp_error;
+            PyErr_SetString(capi_err, capi_errmess);
+        }
+    } else {
+        qtil = (double *)(PyArray_DATA(capi_qtil_as_array));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+                (*f2py_func)(&qbar11,&qbar22,&qbar12,&qbar16,&qbar26,&qbar66,&mat,qtil);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("N",capi_qtil_as_array);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    }  /* if (capi_qtil_as_array == NULL) ... else of qtil */
+    /* End of cleaning variable qtil */
+    } /*if (f2py_success) of mat*/
+    /* End of cleaning variable mat */
+    } /*if (f2py_success) of qbar66*/
+    /* End of cleaning variable qbar66 */
+    } /*if (f2py_success) of qbar26*/
+    /* End of cleaning variable qbar26 */
+    } /*if (f2py_success) of qbar16*/
+    /* End of cleaning variable qbar16 */
+    } /*if (f2py_success) of qbar12*/
+    /* End of cleaning variable qbar12 */
+    } /*if (f2py_success) of qbar22*/
+    /* End of cleaning variable qbar22 */
+    } /*if (f2py_success) of qbar11*/
+    /* End of cleaning variable qbar11 */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/****************************** end of q_tildas ******************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+
+static FortranDataDef f2py_precomp_def[] = {
+  {"dbp",0,{{-1}},NPY_INT, 1},
+  {"pi",0,{{-1}},NPY_DOUBLE, 1},
+  {"r2d",0,{{-1}},NPY_DOUBLE, 1},
+  {"eps",0,{{-1}},NPY_DOUBLE, 1},
+  {"properties",-1,{{-1}},0,0,NULL,(void *)f2py_rout__precomp_precomp_properties,doc_f2py_rout__precomp_precomp_properties},
+  {"embed_us",-1,{{-1}},0,0,NULL,(void *)f2py_rout__precomp_precomp_embed_us,doc_f2py_rout__precomp_precomp_embed_us},
+  {"embed_ls",-1,{{-1}},0,0,NULL,(void *)f2py_rout__precomp_precomp_embed_ls,doc_f2py_rout__precomp_precomp_embed_ls},
+  {"seg_info",-1,{{-1}},0,0,NULL,(void *)f2py_rout__precomp_precomp_seg_info,doc_f2py_rout__precomp_precomp_seg_info},
+  {"tw_rate",-1,{{-1}},0,0,NULL,(void *)f2py_rout__precomp_precomp_tw_rate,doc_f2py_rout__precomp_precomp_tw_rate},
+  {"q_bars",-1,{{-1}},0,0,NULL,(void *)f2py_rout__precomp_precomp_q_bars,doc_f2py_rout__precomp_precomp_q_bars},
+  {"q_tildas",-1,{{-1}},0,0,NULL,(void *)f2py_rout__precomp_precomp_q_tildas,doc_f2py_rout__precomp_precomp_q_tildas},
+  {NULL}
+};
+
+static void f2py_setup_precomp(char *dbp,char *pi,char *r2d,char *eps,char *properties,char *embed_us,char *embed_ls,char *seg_info,char *tw_rate,char *q_bars,char *q_tildas) {
+  int i_f2py=0;
+  f2py_precomp_def[i_f2py++].data = dbp;
+  f2py_precomp_def[i_f2py++].data = pi;
+  f2py_precomp_def[i_f2py++].data = r2d;
+  f2py_precomp_def[i_f2py++].data = eps;
+  f2py_precomp_def[i_f2py++].data = properties;
+  f2py_precomp_def[i_f2py++].data = embed_us;
+  f2py_precomp_def[i_f2py++].data = embed_ls;
+  f2py_precomp_def[i_f2py++].data = seg_info;
+  f2py_precomp_def[i_f2py++].data = tw_rate;
+  f2py_precomp_def[i_f2py++].data = q_bars;
+  f2py_precomp_def[i_f2py++].data = q_tildas;
+}
+extern void F_FUNC(f2pyinitprecomp,F2PYINITPRECOMP)(void (*)(char*,char*,char*,char*,char *,char *,char *,char *,char *,char *,char *));
+static void f2py_init_precomp(void) {
+  F_FUNC(f2pyinitprecomp,F2PYINITPRECOMP)(f2py_setup_precomp);
+}
+
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+
+/*eof routine_defs*/
+    {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+    {NULL,NULL}
+};
+
+static struct PyModuleDef moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_precomp",
+    NULL,
+    -1,
+    f2py_module_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC PyInit__precomp(void) {
+    int i;
+    PyObject *m,*d, *s, *tmp;
+    m = _precomp_module = PyModule_Create(&moduledef);
+    Py_SET_TYPE(&PyFortran_Type, &PyType_Type);
+    import_array();
+    if (PyErr_Occurred())
+        {PyErr_SetString(PyExc_ImportError, "can't initialize module _precomp (failed to import numpy)"); return m;}
+    d = PyModule_GetDict(m);
+    s = PyUnicode_FromString("1.24.4");
+    PyDict_SetItemString(d, "__version__", s);
+    Py_DECREF(s);
+    s = PyUnicode_FromString(
+        "This module '_precomp' is auto-generated with f2py (version:1.24.4).\nFunctions:\n"
+"Fortran 90/95 modules:\n""  precomp --- dbp,pi,r2d,eps,properties(),embed_us(),embed_ls(),seg_info(),tw_rate(),q_bars(),q_tildas()"".");
+    PyDict_SetItemString(d, "__doc__", s);
+    Py_DECREF(s);
+    s = PyUnicode_FromString("1.24.4");
+    PyDict_SetItemString(d, "__f2py_numpy_version__", s);
+    Py_DECREF(s);
+    _precomp_error = PyErr_NewException ("_precomp.error", NULL, NULL);
+    /*
+     * Store the error object inside the dict, so that it could get deallocated.
+     * (in practice, this is a module, so it likely will not and cannot.)
+     */
+    PyDict_SetItemString(d, "__precomp_error", _precomp_error);
+    Py_DECREF(_precomp_error);
+    for(i=0;f2py_routine_defs[i].name!=NULL;i++) {
+        tmp = PyFortranObject_NewAsAttr(&f2py_routine_defs[i]);
+        PyDict_SetItemString(d, f2py_routine_defs[i].name, tmp);
+        Py_DECREF(tmp);
+    }
+
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+  PyDict_SetItemString(d, "precomp", PyFortranObject_New(f2py_precomp_def,f2py_init_precomp));
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+    if (! PyErr_Occurred())
+        on_exit(f2py_report_on_exit,(void*)"_precomp");
+#endif
+    return m;
+}
+#ifdef __cplusplus
+}
+#endif
@@ -1,7 +1,7 @@
 import matplotlib.pyplot as plt
-from wisdem.glue_code.runWISDEM import load_wisdem
+from wisdem.glue_code.runWISDEM import load_wisdem_results
 
-refturb, _, _ = load_wisdem("outputs/refturb_output.pkl")
+refturb, _, _ = load_wisdem_results("outputs/refturb_output.pkl")
 xs = refturb["wt.wt_init.blade.outer_shape_bem.compute_blade_outer_shape_bem.s_default"]
 ys = refturb["wt.rp.powercurve.compute_power_curve.ax_induct_regII"]
 fig, ax = plt.subplots(nrows=1, ncols=1, figsize=(10, 5))